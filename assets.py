@@ -0,0 +1,189 @@
+import os
+
+import pygame
+
+ICON_SIZE = 40
+ROCK_SIZE = 48
+COW_SIZE = 64
+
+# Every size item icons are shown at, generated once at load time
+ICON_SIZES = {
+    "icon": ICON_SIZE,         # Inventory, chest, dragged item and world drops
+    "hotbar": ICON_SIZE - 10,  # Hotbar slots
+}
+
+ITEM_ICON_FILES = {
+    "Meat": "meat.png",
+    "Leather": "leather.png",
+    "Wood": "wood.png",
+    "Wooden Pickaxe": "wooden_pickaxe.png",
+    "Stone Sword": "sword.png",
+}
+
+# Items without artwork yet are drawn as flat colored squares
+ITEM_ICON_COLORS = {
+    "Plank": (139, 69, 19),
+    "Stone": (100, 100, 100),
+    "Campfire": (200, 90, 40),
+}
+
+
+def make_flame_image():
+    surface = pygame.Surface((48, 48), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (255, 140, 50), (24, 24), 20)
+    pygame.draw.circle(surface, (255, 180, 100), (24, 24), 12)
+    return surface
+
+
+class SpriteAtlas:
+    """Packs many small sprites into one surface and hands out named sub-surfaces.
+
+    Sprites are placed left to right on shelves as tall as the tallest sprite in
+    the row, with a 1 px gap so neighbours never bleed into each other.
+    """
+
+    def __init__(self, sprites, max_width=1024, padding=1):
+        self.regions = {}  # name -> Rect inside the atlas
+        x = y = shelf_height = 0
+        width = 0
+        for name, surface in sprites.items():
+            w, h = surface.get_size()
+            if x + w > max_width and x > 0:
+                x, y = 0, y + shelf_height + padding
+                shelf_height = 0
+            self.regions[name] = pygame.Rect(x, y, w, h)
+            x += w + padding
+            width = max(width, x)
+            shelf_height = max(shelf_height, h)
+
+        self.surface = pygame.Surface((max(width, 1), max(y + shelf_height, 1)), pygame.SRCALPHA)
+        for name, surface in sprites.items():
+            self.surface.blit(surface, self.regions[name])
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+        self.sprites = {name: self.surface.subsurface(rect) for name, rect in self.regions.items()}
+
+    def get(self, name):
+        return self.sprites[name]
+
+    def __contains__(self, name):
+        return name in self.sprites
+
+
+class VariantCache:
+    """Flipped / squashed copies of sprites, each built once and then just looked up.
+
+    Keys hold a reference to the source sprite, so its id() can't be reused while cached.
+    """
+
+    def __init__(self):
+        self.variants = {}  # (id(sprite), flip_x, height_scale) -> (sprite, variant)
+
+    def get(self, sprite, flip_x=False, height_scale=1.0):
+        key = (id(sprite), flip_x, height_scale)
+        entry = self.variants.get(key)
+        if entry is not None:
+            return entry[1]
+
+        variant = sprite
+        if flip_x:
+            variant = pygame.transform.flip(variant, True, False)
+        if height_scale != 1.0:
+            variant = pygame.transform.scale(variant, (variant.get_width(), int(variant.get_height() * height_scale)))
+        self.variants[key] = (sprite, variant)
+        return variant
+
+    def prebuild(self, sprites, flips=(False, True), height_scales=(1.0,)):
+        """Build every variant of the given sprites up front, e.g. at load time."""
+        for sprite in sprites:
+            for flip_x in flips:
+                for height_scale in height_scales:
+                    self.get(sprite, flip_x, height_scale)
+
+
+class AssetManager:
+    """Loads every image once, converts it to the display format and packs it into atlases.
+
+    Draw code takes ready-made surfaces from here instead of scaling or creating
+    them per frame. Call load_game_assets() after pygame.display.set_mode so the
+    atlases are converted; anything asked for earlier is loaded unconverted.
+    """
+
+    def __init__(self):
+        self.images = {}   # path -> surface, loaded once
+        self.atlases = {}  # atlas name -> SpriteAtlas
+        self.sheets = {}   # (path, num_frames, scale) -> scaled frames
+        self.variants = VariantCache()
+
+    def convert(self, surface):
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
+
+    def image(self, path):
+        """Image file loaded and converted once."""
+        surface = self.images.get(path)
+        if surface is None:
+            surface = self.images[path] = self.convert(pygame.image.load(path))
+        return surface
+
+    def sheet_frames(self, path, num_frames, scale=1.0):
+        """Vertically stacked frames of a sprite sheet, sliced from the cached image and scaled once."""
+        key = (path, num_frames, scale)
+        frames = self.sheets.get(key)
+        if frames is None:
+            sheet = self.image(path)
+            frame_width = sheet.get_width()
+            frame_height = sheet.get_height() // num_frames
+            size = (int(frame_width * scale), int(frame_height * scale))
+            frames = self.sheets[key] = [
+                pygame.transform.scale(sheet.subsurface((0, i * frame_height, frame_width, frame_height)), size)
+                for i in range(num_frames)
+            ]
+        return frames
+
+    def load_game_assets(self):
+        # Item icons, one atlas per size so each size sits together in memory
+        for size_name, size in ICON_SIZES.items():
+            icons = {}
+            for item, path in ITEM_ICON_FILES.items():
+                icons[item] = pygame.transform.scale(self.image(path), (size, size))
+            for item, color in ITEM_ICON_COLORS.items():
+                icons[item] = pygame.Surface((size, size), pygame.SRCALPHA)
+                icons[item].fill(color)
+            self.atlases["items_" + size_name] = SpriteAtlas(icons)
+
+        # World sprites
+        world = {f"rock{i}": pygame.transform.scale(self.image(os.path.join("gray_rock", f"rock{i}.png")), (ROCK_SIZE, ROCK_SIZE)) for i in range(1, 6)}
+        world["cow"] = pygame.transform.scale(self.image("cow.png"), (COW_SIZE, COW_SIZE))
+        world["flame"] = make_flame_image()
+        self.atlases["world"] = SpriteAtlas(world)
+
+    def atlas(self, name):
+        if name not in self.atlases:
+            self.load_game_assets()
+        return self.atlases[name]
+
+    def sprite(self, atlas_name, name):
+        return self.atlas(atlas_name).get(name)
+
+    def icon(self, item, size_name="icon"):
+        """Item icon at one of the ICON_SIZES, or None for items drawn as shapes (Water)."""
+        atlas = self.atlas("items_" + size_name)
+        return atlas.get(item) if item in atlas else None
+
+    def item_icons(self, size_name="icon"):
+        """{item: icon} for every item, in the shape main's ITEM_TYPES always had."""
+        icons = dict(self.atlas("items_" + size_name).sprites)
+        icons["Water"] = None
+        return icons
+
+    def variant(self, sprite, flip_x=False, height_scale=1.0):
+        return self.variants.get(sprite, flip_x, height_scale)
+
+    def rock_images(self):
+        return [self.sprite("world", f"rock{i}") for i in range(1, 6)]
+
+
+assets = AssetManager()
@@ -0,0 +1,82 @@
+"""Compare the per-object spawn loops with the NumPy batch generators.
+
+Run from the project root:
+
+    python benchmarks/bench_worldgen.py [items] [camps]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pygame
+
+from tile_grid import TileGrid
+from world_generation import spawn_items, spawn_rocks, spawn_camps, spawn_items_batch, spawn_rocks_batch, spawn_camps_batch
+
+GRID_SIZE = 64
+MAP_WIDTH, MAP_HEIGHT = 64000, 64000
+SAFE_ZONE = pygame.Rect(MAP_WIDTH // 2 - 64, MAP_HEIGHT // 2 - 64, 128, 128)
+
+
+def timed(label, fn):
+    """Run fn (returns how many objects it placed) and print time, count and time per object."""
+    start = time.perf_counter()
+    placed = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    per_object = elapsed * 1000 / max(placed, 1)
+    print(f"  {label:<28} {elapsed:9.1f} ms   {placed:7d} placed   {per_object:7.2f} us each")
+    return elapsed, placed
+
+
+def run(n_items, n_rocks, n_camps):
+    area = pygame.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT)
+    rock_images = [pygame.Surface((48, 48))]
+
+    print(f"Map {MAP_WIDTH}x{MAP_HEIGHT}, {n_items} items, {n_rocks} rocks, {n_camps} camps requested")
+
+    # The rock and item loops make n attempts and place fewer, so the batch generators
+    # (which place exactly n unless the map is full) are asked for what the loops placed.
+    # Camps are asked for the full n_camps on both paths: spawn_camps gives up after
+    # 500 tries, and the batch path is meant to place all of them.
+    print("per-object loops:")
+    grid, rng = TileGrid(MAP_WIDTH, MAP_HEIGHT, GRID_SIZE), random.Random(1)
+    rocks, items, camps = [], [], []
+    loops = {
+        "rocks": timed("spawn_rocks", lambda: spawn_rocks(rng, n_rocks, rocks, grid, SAFE_ZONE, area, GRID_SIZE, rock_images) or len(rocks)),
+        "items": timed("spawn_items", lambda: spawn_items(rng, n_items, items, grid, SAFE_ZONE, area, GRID_SIZE) or len(items)),
+        "camps": timed("spawn_camps", lambda: spawn_camps(rng, n_camps, camps, grid, SAFE_ZONE, area, GRID_SIZE) or len(camps)),
+    }
+
+    print("numpy batch:")
+    grid, rng, np_rng = TileGrid(MAP_WIDTH, MAP_HEIGHT, GRID_SIZE), random.Random(1), np.random.default_rng(1)
+    rocks, items, camps = [], [], []
+    n_rocks, n_items = loops["rocks"][1], loops["items"][1]
+    batches = {
+        "rocks": timed("spawn_rocks_batch", lambda: spawn_rocks_batch(np_rng, n_rocks, rocks, grid, SAFE_ZONE, area, GRID_SIZE, rock_images)),
+        "items": timed("spawn_items_batch", lambda: spawn_items_batch(np_rng, n_items, items, grid, SAFE_ZONE, area, GRID_SIZE)),
+        "camps": timed("spawn_camps_batch", lambda: spawn_camps_batch(np_rng, rng, n_camps, camps, grid, SAFE_ZONE, area, GRID_SIZE)),
+    }
+
+    for kind in ("rocks", "items"):
+        (loop_ms, loop_placed), (batch_ms, batch_placed) = loops[kind], batches[kind]
+        assert batch_placed == loop_placed, f"{kind}: batch placed {batch_placed}, loops placed {loop_placed}"
+        print(f"{kind}: {loop_placed} each, loops {loop_ms:.1f} ms, batch {batch_ms:.1f} ms ({loop_ms / max(batch_ms, 1e-9):.1f}x)")
+
+    # The loop places fewer camps, so compare time per camp rather than total time
+    (loop_ms, loop_placed), (batch_ms, batch_placed) = loops["camps"], batches["camps"]
+    print(f"camps: batch placed {batch_placed} of {n_camps} in {batch_ms:.1f} ms")
+    print(f"camps vs loops: loops placed {loop_placed} in {loop_ms:.1f} ms, "
+          f"{loop_ms * 1000 / max(loop_placed, 1):.2f} vs {batch_ms * 1000 / max(batch_placed, 1):.2f} us per camp")
+
+    loop_ms = loops["rocks"][0] + loops["items"][0]
+    batch_ms = batches["rocks"][0] + batches["items"][0]
+    print(f"rocks + items: loops {loop_ms:.1f} ms, batch {batch_ms:.1f} ms ({loop_ms / max(batch_ms, 1e-9):.1f}x)")
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    camps = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    run(items, items // 20, camps)
@@ -1,12 +1,31 @@
 import pygame
 import random
 
+import world_events
+from render_queue import GROUND
+from text_cache import render_text
+
 GRID_SIZE = 64
 
+# Closed and open chest, drawn once each
+chest_images = {}
+
+
+def chest_image(is_open):
+    image = chest_images.get(is_open)
+    if image is None:
+        chest_color = (184, 134, 11) if not is_open else (110, 90, 60)
+        image = chest_images[is_open] = pygame.Surface((GRID_SIZE, GRID_SIZE))
+        image.fill(chest_color)
+        pygame.draw.rect(image, (0, 0, 0), image.get_rect(), 2)
+    return image
+
+
 class Camp:
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=random):
         self.x = x
         self.y = y
+        self.uid = None  # Chunk-local id, set by world generation
         self.width = GRID_SIZE * 2
         self.height = GRID_SIZE * 2
         self.rect = pygame.Rect(x, y, self.width, self.height)
@@ -17,14 +36,19 @@ class Camp:
         self.cursor_timer = 0
 
         # Now using slot-style chest inventory
-        self.inventory = self.generate_loot()
+        self.inventory = self.generate_loot(rng)
 
-    def generate_loot(self):
+    def generate_loot(self, rng=random):
         # Generate list of slot dictionaries like: {"item": "Stone", "count": 1}
-        return [{"item": random.choice(["Plank", "Water", "Meat", "Stone", "Leather"]), "count": random.randint(1, 3)} 
-                for _ in range(random.randint(2, 6))]
+        return [{"item": rng.choice(["Plank", "Water", "Meat", "Stone", "Leather"]), "count": rng.randint(1, 3)} 
+                for _ in range(rng.randint(2, 6))]
 
     def draw(self, screen, camera_x, camera_y):
+        self.draw_base(screen, camera_x, camera_y)
+        self.draw_chest(screen, camera_x, camera_y)
+
+    def draw_base(self, screen, camera_x, camera_y):
+        """Static part of the camp (baked into the terrain cache)."""
         # Camp base
         pygame.draw.rect(screen, (160, 130, 100), (self.x - camera_x, self.y - camera_y, self.width, self.height))
 
@@ -38,10 +62,12 @@ class Camp:
         # Crate
         pygame.draw.rect(screen, (139, 90, 30), (self.x + GRID_SIZE - camera_x + 4, self.y - camera_y + 4, GRID_SIZE - 8, GRID_SIZE - 8))
 
-        # Chest
-        chest_color = (184, 134, 11) if not self.is_open else (110, 90, 60)
-        pygame.draw.rect(screen, chest_color, (self.chest_rect.x - camera_x, self.chest_rect.y - camera_y, GRID_SIZE, GRID_SIZE))
-        pygame.draw.rect(screen, (0, 0, 0), (self.chest_rect.x - camera_x, self.chest_rect.y - camera_y, GRID_SIZE, GRID_SIZE), 2)
+    def draw_chest(self, screen, camera_x, camera_y):
+        """Chest changes color when opened, so it is drawn every frame."""
+        screen.blit(chest_image(self.is_open), (self.chest_rect.x - camera_x, self.chest_rect.y - camera_y))
+
+    def submit_chest(self, queue, camera_x, camera_y):
+        queue.push(GROUND, chest_image(self.is_open), (self.chest_rect.x - camera_x, self.chest_rect.y - camera_y))
 
     def open_if_hovered(self, cursor_rect, pressed_e):
         if self.chest_rect.colliderect(cursor_rect) and pressed_e:
@@ -67,21 +93,11 @@ class Camp:
                 chest_item = self.inventory[self.selected_index]
                 item_name = chest_item["item"]
 
-                # Try to stack with same item
-                for slot in player_inventory:
-                    if slot and slot["item"] == item_name:
-                        slot["count"] += 1
-                        chest_item["count"] -= 1
-                        break
-                else:
-                    # Try to place in an empty slot
-                    for i in range(len(player_inventory)):
-                        if player_inventory[i] is None:
-                            player_inventory[i] = {"item": item_name, "count": 1}
-                            chest_item["count"] -= 1
-                            break
-                    else:
-                        print("Inventory full!")
+                # Stack with the same item or take an empty slot (the inventory's index finds both)
+                if player_inventory.inventory.add(item_name, 1, (player_inventory.row,)):
+                    chest_item["count"] -= 1
+
+                world_events.emit("chest_looted", self)
 
                 # Remove chest item if depleted
                 if chest_item["count"] <= 0:
@@ -101,8 +117,6 @@ class Camp:
         pygame.draw.rect(screen, (35, 25, 15), (panel_x, panel_y, panel_width, panel_height), border_radius=10)
         pygame.draw.rect(screen, (90, 70, 50), (panel_x, panel_y, panel_width, panel_height), 3, border_radius=10)
 
-        font = pygame.font.Font(None, 30)
-
         for i, slot in enumerate(self.inventory):
             item_x = panel_x + 20 + i * 60
             item_y = panel_y + 25
@@ -118,7 +132,7 @@ class Camp:
 
             # Count
             if count > 1:
-                count_text = font.render(str(count), True, (255, 255, 255))
+                count_text = render_text(str(count), 30)
                 screen.blit(count_text, (item_x + 24, item_y + 24))
 
             # Highlight selected
@@ -126,5 +140,5 @@ class Camp:
                 pygame.draw.rect(screen, (255, 255, 255), (item_x - 4, item_y - 4, 48, 48), 2)
 
         # Title
-        title = font.render("Chest", True, (255, 255, 255))
+        title = render_text("Chest", 30)
         screen.blit(title, (panel_x + 10, panel_y - 28))
@@ -2,31 +2,35 @@ import pygame
 import time
 import random
 
+from assets import assets
+from glow_cache import glow_cache
+from render_queue import LIGHTING
+from scheduler import scheduler
+
 
 DESERT_COLOR = (199, 168, 107)
+BURN_TIME = 90000  # ms a fire burns for
+
+rng = random.Random()          # Fires made by the simulation; seeded by simulation.seed_rngs
+flicker_rng = random.Random()  # Flicker runs per rendered frame, so it stays off the seeded generators
 
 
 class Campfire:
-    def __init__(self, x, y, duration=90000):  # Burns for 90 sec (ms)
+    def __init__(self, x, y, duration=BURN_TIME, placed_at=None):  # Burns for 90 sec (ms)
         self.x = x
         self.y = y
         self.rect = pygame.Rect(x, y, 48, 48)
-        self.start_time = pygame.time.get_ticks()
+        self.placed_at = scheduler.now if placed_at is None else placed_at  # Simulation seconds
         self.duration = duration
-        self.image = self.make_flame_image()
-        self.glow_radius = random.randint(280, 320)  # Initial dynamic glow radius
+        self.burning = True  # Put out by the "campfire_burnout" timer (see ChunkManager)
+        self.image = assets.sprite("world", "flame")  # Shared by every fire
+        self.glow_radius = rng.randint(280, 320)  # Initial dynamic glow radius
         self.alpha = 180  # Initial alpha for light intensity
         self.last_flicker_time = pygame.time.get_ticks()  # Timer for flicker updates
         self.flicker_interval = 500  # Flicker every 500ms (adjust for slower flicker)
 
-    def make_flame_image(self):
-        surface = pygame.Surface((48, 48), pygame.SRCALPHA)
-        pygame.draw.circle(surface, (255, 140, 50), (24, 24), 20)
-        pygame.draw.circle(surface, (255, 180, 100), (24, 24), 12)
-        return surface
-
     def is_burning(self):
-        return pygame.time.get_ticks() - self.start_time < self.duration
+        return self.burning
 
     def update_light_effect(self):
         """Update the glow radius and alpha to create a slower flickering effect and gradual fade-out."""
@@ -34,32 +38,36 @@ class Campfire:
         if current_time - self.last_flicker_time >= self.flicker_interval:
             self.last_flicker_time = current_time  # Reset the timer
 
-            elapsed_time = current_time - self.start_time
+            elapsed_time = (scheduler.now - self.placed_at) * 1000
             remaining_time_ratio = max(0, 1 - elapsed_time / self.duration)  # Ratio of remaining burn time (0 to 1)
 
             # Gradually reduce alpha and glow radius as the fire burns out
             self.alpha = int(180 * remaining_time_ratio)  # Fade out light intensity
-            self.glow_radius = int(random.randint(280, 320) * remaining_time_ratio)  # Shrink glow radius
+            self.glow_radius = int(flicker_rng.randint(280, 320) * remaining_time_ratio)  # Shrink glow radius
 
             # Slow down flickering by reducing randomness
-            self.glow_radius += random.randint(-10, 10)
+            self.glow_radius += flicker_rng.randint(-10, 10)
 
-    def draw(self, screen, camera_x, camera_y):
+    def burnout_time(self):
+        """Simulation time (seconds) the fire goes out at."""
+        return self.placed_at + self.duration / 1000
+
+    def draw_base(self, screen, camera_x, camera_y):
         # Fire sprite or box
         pygame.draw.rect(screen, (200, 90, 40), (self.x - camera_x, self.y - camera_y, 64, 64))
 
-        # 🔦 Dynamic light glow with correct brightness (brightest at center, fades outward)
+    def add_light(self, lightmap, camera_x, camera_y):
+        # 🔥 Light cutting through the night, same flicker and fade as the glow
+        self.update_light_effect()
+        lightmap.add_light(self.x + 32 - camera_x, self.y + 32 - camera_y, self.glow_radius, self.alpha)
+
+    def submit_glow(self, queue, camera_x, camera_y):
+        # 🔦 Daytime glow (brightest at center, fades outward), shared from the glow cache.
+        # At night the lightmap lights the fire instead (see add_light)
         self.update_light_effect()  # Update glow radius and alpha
-        glow_surface = pygame.Surface((self.glow_radius * 2, self.glow_radius * 2), pygame.SRCALPHA)
-
-        for radius in range(self.glow_radius, 0, -1):
-            fade_alpha = int(self.alpha * (1 - (radius / self.glow_radius)))  # Brightest at center, fades outward
-            blended_color = (
-                int(DESERT_COLOR[0] * 0.8 + 255 * 0.2),  # Blend with orange
-                int(DESERT_COLOR[1] * 0.8 + 140 * 0.2),
-                int(DESERT_COLOR[2] * 0.8 + 50 * 0.2),
-                fade_alpha
-            )
-            pygame.draw.circle(glow_surface, blended_color, (self.glow_radius, self.glow_radius), radius)
-
-        screen.blit(glow_surface, (self.x - self.glow_radius - camera_x + 32, self.y - self.glow_radius - camera_y + 32))
\ No newline at end of file
+        glow_surface = glow_cache.get(self.glow_radius, self.alpha)
+        if glow_surface is None:
+            return
+
+        half = glow_surface.get_width() // 2
+        queue.push(LIGHTING, glow_surface, (self.x - half - camera_x + 32, self.y - half - camera_y + 32))
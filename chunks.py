@@ -0,0 +1,294 @@
+import random
+
+import pygame
+
+import world_events
+from campfire import Campfire, BURN_TIME
+from herd import Herd
+from scheduler import scheduler
+from spatial_hash import SpatialHash
+from tile_grid import TileGrid, CAMPFIRE
+from world_generation import chunk_seed, generate_chunk, mark_tiles
+
+GRID_SIZE = 64
+ITEM_SIZE = 30
+CHUNK_TILES = 16
+CHUNK_SIZE = CHUNK_TILES * GRID_SIZE  # 1024 px
+LOAD_MARGIN = CHUNK_SIZE // 2          # Chunks this close to the view are loaded
+UNLOAD_MARGIN = CHUNK_SIZE             # ...and only evicted once they are this far away
+
+
+def new_delta():
+    """Player-caused changes to one chunk, relative to what its seed generates."""
+    return {
+        "mined_rocks": set(),       # rock uids
+        "harvested_water": set(),   # water tile uids
+        "picked_items": set(),      # item ids
+        "looted_camps": {},         # camp uid -> current chest inventory
+        "campfires": [],            # {"x", "y"} of placed campfires
+    }
+
+
+class Chunk:
+    """Fixed-size square of the world owning every entity that spawned inside it."""
+
+    def __init__(self, cx, cy, area):
+        self.cx = cx
+        self.cy = cy
+        self.key = (cx, cy)
+        self.area = area  # Chunk rect clipped to the map
+        self.rocks = []
+        self.lakes = []
+        self.items = []
+        self.cows = []
+        self.camps = []
+        self.campfires = []
+
+
+class ChunkManager:
+    """Streams chunks in and out around the camera.
+
+    Only resident chunks are kept in memory. The flat entity lists (rocks, lakes,
+    items, cows, camps, campfires) and the spatial indexes always reflect exactly
+    the resident chunks, so the rest of the game can keep iterating lists.
+
+    Chunks are rebuilt from the world seed whenever they load, so the only thing
+    that outlives an evicted chunk is its delta of player-caused changes.
+    """
+
+    def __init__(self, map_width, map_height, safe_zone, rock_images, cow_image, grid_size=GRID_SIZE, seed=None, deltas=None):
+        self.map_rect = pygame.Rect(0, 0, map_width, map_height)
+        self.grid_size = grid_size
+        self.safe_zone = safe_zone
+        self.rock_images = rock_images
+        self.cow_image = cow_image
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.chunks = {}  # (cx, cy) -> resident Chunk
+        self.deltas = deltas if deltas is not None else {}  # (cx, cy) -> delta, for every chunk ever changed
+
+        self.tile_grid = TileGrid(map_width, map_height, grid_size)
+        self.tile_grid.track_world_events()
+
+        self.rock_index = SpatialHash(grid_size)
+        self.water_index = SpatialHash(grid_size)
+        self.item_index = SpatialHash(grid_size)
+        # Every resident cow's state lives in the herd arrays; it also answers the
+        # cow rect queries, so cows don't need a SpatialHash kept in sync as they walk
+        self.herd = Herd(cow_image.get_size(), seed=self.seed)
+        self.cow_index = self.herd
+        self.subscriptions = world_events.subscribe_all([
+            ("rock_mined", self.rock_index.remove),
+            ("water_harvested", self.water_index.remove),
+            ("rock_mined", self.on_rock_mined),
+            ("water_harvested", self.on_water_harvested),
+            ("chest_looted", self.on_chest_looted),
+        ])
+        self.timer_handlers = [("campfire_burnout", self.burn_out_campfire), ("rock_mined", self.finish_mining)]
+        for name, handler in self.timer_handlers:
+            scheduler.register(name, handler)
+        self.schedule_unlit_campfires()
+
+        # Views over the resident chunks (mutated in place, never reassigned)
+        self.rocks = []
+        self.lakes = []
+        self.items = []
+        self.cows = []
+        self.camps = []
+        self.campfires = []
+
+    # --- Coordinates ---
+    def chunk_key(self, x, y):
+        return int(x // CHUNK_SIZE), int(y // CHUNK_SIZE)
+
+    def chunk_at(self, x, y):
+        """Resident chunk containing the point, or None."""
+        return self.chunks.get(self.chunk_key(x, y))
+
+    def keys_in_rect(self, rect):
+        rect = rect.clip(self.map_rect)
+        if rect.width == 0 or rect.height == 0:
+            return set()
+        cx0, cy0 = self.chunk_key(rect.left, rect.top)
+        cx1, cy1 = self.chunk_key(rect.right - 1, rect.bottom - 1)
+        return {(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)}
+
+    def resident_bounds(self):
+        """Rect covering every resident chunk."""
+        if not self.chunks:
+            return pygame.Rect(0, 0, 0, 0)
+        areas = [chunk.area for chunk in self.chunks.values()]
+        return areas[0].unionall(areas[1:])
+
+    # --- Streaming ---
+    def update(self, view_rect):
+        """Load chunks near view_rect and evict the ones that moved far away."""
+        wanted = self.keys_in_rect(view_rect.inflate(LOAD_MARGIN * 2, LOAD_MARGIN * 2))
+        keep = self.keys_in_rect(view_rect.inflate(UNLOAD_MARGIN * 2, UNLOAD_MARGIN * 2))
+
+        to_load = wanted - self.chunks.keys()
+        to_unload = [key for key in self.chunks if key not in keep]
+        if not to_load and not to_unload:
+            return
+
+        for key in to_unload:
+            self.unload_chunk(key)
+        for key in to_load:
+            self.load_chunk(key)
+        self.rebuild_views()
+
+    def load_chunk(self, key):
+        cx, cy = key
+        area = pygame.Rect(cx * CHUNK_SIZE, cy * CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE).clip(self.map_rect)
+        chunk = Chunk(cx, cy, area)
+        generate_chunk(chunk, chunk_seed(self.seed, cx, cy), self.tile_grid, self.safe_zone, self.grid_size, self.rock_images, self.cow_image, self.herd)
+
+        delta = self.deltas.get(key)
+        if delta is not None:
+            self.apply_delta(chunk, delta)
+
+        self.index_chunk(chunk)
+        self.chunks[key] = chunk
+        world_events.emit("chunk_loaded", chunk)
+        return chunk
+
+    def unload_chunk(self, key):
+        chunk = self.chunks.pop(key)
+        self.unindex_chunk(chunk)
+        # Free the area so regenerating it later sees the same empty grid
+        self.tile_grid.clear_area(chunk.area)
+        world_events.emit("chunk_unloaded", chunk)
+
+    def apply_delta(self, chunk, delta):
+        """Replay recorded player changes on top of a freshly generated chunk."""
+        for rock in chunk.rocks:
+            if rock.uid in delta["mined_rocks"]:
+                rock.mined = True
+                self.tile_grid.on_rock_mined(rock)
+        for lake in chunk.lakes:
+            for tile in lake:
+                if tile.uid in delta["harvested_water"]:
+                    tile.harvested = True
+                    self.tile_grid.on_water_harvested(tile)
+        if delta["picked_items"]:
+            chunk.items = [item for item in chunk.items if item["id"] not in delta["picked_items"]]
+        for camp in chunk.camps:
+            if camp.uid in delta["looted_camps"]:
+                camp.inventory = delta["looted_camps"][camp.uid]
+        for fire_data in delta["campfires"]:
+            fire = Campfire(fire_data["x"], fire_data["y"], placed_at=fire_data.get("placed_at"))
+            chunk.campfires.append(fire)
+        mark_tiles(self.tile_grid, [], [], [], chunk.campfires, self.grid_size)
+
+    def delta_at(self, x, y):
+        key = self.chunk_key(x, y)
+        delta = self.deltas.get(key)
+        if delta is None:
+            delta = self.deltas[key] = new_delta()
+        return delta
+
+    # --- Indexing ---
+    def index_chunk(self, chunk):
+        for rock in chunk.rocks:
+            if not rock.mined:
+                self.rock_index.insert(rock, rock.rect)
+        for lake in chunk.lakes:
+            for tile in lake:
+                if not tile.harvested:
+                    self.water_index.insert(tile, tile.rect)
+        for item in chunk.items:
+            self.item_index.insert(item, (item["x"], item["y"], ITEM_SIZE, ITEM_SIZE))
+
+    def unindex_chunk(self, chunk):
+        for rock in chunk.rocks:
+            self.rock_index.remove(rock)
+        for lake in chunk.lakes:
+            for tile in lake:
+                self.water_index.remove(tile)
+        for item in chunk.items:
+            self.item_index.remove(item)
+        for cow in chunk.cows:
+            cow.release()
+
+    def rebuild_views(self):
+        chunks = list(self.chunks.values())
+        self.rocks[:] = [rock for chunk in chunks for rock in chunk.rocks]
+        self.lakes[:] = [lake for chunk in chunks for lake in chunk.lakes]
+        self.items[:] = [item for chunk in chunks for item in chunk.items]
+        self.cows[:] = [cow for chunk in chunks for cow in chunk.cows]
+        self.camps[:] = [camp for chunk in chunks for camp in chunk.camps]
+        self.campfires[:] = [fire for chunk in chunks for fire in chunk.campfires]
+
+    # --- World edits (each one is recorded in the chunk's delta) ---
+    def remove_item(self, item):
+        chunk = self.chunk_at(item["x"], item["y"])
+        if chunk is not None and item in chunk.items:
+            chunk.items.remove(item)
+        if item in self.items:
+            self.items.remove(item)
+        self.item_index.remove(item)
+        if "id" in item:
+            self.delta_at(item["x"], item["y"])["picked_items"].add(item["id"])
+
+    def add_campfire(self, fire):
+        """Place a campfire in the chunk under it. Returns False if the tile is taken."""
+        chunk = self.chunk_at(fire.x, fire.y)
+        tx, ty = self.tile_grid.to_tile(fire.x, fire.y)
+        if chunk is None or not self.tile_grid.place(tx, ty, CAMPFIRE):
+            return False
+        chunk.campfires.append(fire)
+        self.campfires.append(fire)
+        self.delta_at(fire.x, fire.y)["campfires"].append({"x": fire.x, "y": fire.y, "placed_at": fire.placed_at})
+        scheduler.after(fire.duration / 1000, "campfire_burnout", fire.x, fire.y)
+        world_events.emit("campfire_placed", fire)
+        return True
+
+    def burn_out_campfire(self, x, y):
+        """Timer handler: the fire at (x, y) went out, so it is removed from the world."""
+        delta = self.deltas.get(self.chunk_key(x, y))
+        if delta is not None:
+            delta["campfires"] = [data for data in delta["campfires"] if (data["x"], data["y"]) != (x, y)]
+        chunk = self.chunk_at(x, y)
+        if chunk is None:
+            return
+        for fire in chunk.campfires:
+            if (fire.x, fire.y) == (x, y):
+                fire.burning = False
+                chunk.campfires.remove(fire)
+                self.campfires.remove(fire)
+                self.tile_grid.clear_if(x, y, CAMPFIRE)
+                world_events.emit("campfire_burnt_out", fire)
+                return
+
+    def close(self):
+        """Stop listening to world events and timers, e.g. before building another world in this process."""
+        world_events.unsubscribe_all(self.subscriptions)
+        for name, handler in self.timer_handlers:
+            scheduler.unregister(name, handler)
+        self.tile_grid.close()
+
+    def schedule_unlit_campfires(self):
+        """Saves from before the timer scheduler have fires without a burnout timer; light them now."""
+        for delta in self.deltas.values():
+            for fire_data in delta["campfires"]:
+                if "placed_at" not in fire_data:
+                    fire_data["placed_at"] = scheduler.now
+                    scheduler.after(BURN_TIME / 1000, "campfire_burnout", fire_data["x"], fire_data["y"])
+
+    def finish_mining(self, x, y):
+        """Timer handler: mining the rock at (x, y) is done (if it is still loaded)."""
+        for rock in self.rock_index.query_rect((x, y, 1, 1)):
+            if (rock.x, rock.y) == (x, y) and not rock.mined:
+                rock.mine()
+                return
+
+    def on_rock_mined(self, rock):
+        if rock.uid is not None:
+            self.delta_at(rock.x, rock.y)["mined_rocks"].add(rock.uid)
+
+    def on_water_harvested(self, tile):
+        if tile.uid is not None:
+            self.delta_at(tile.x, tile.y)["harvested_water"].add(tile.uid)
+
+    def on_chest_looted(self, camp):
+        if camp.uid is not None:
+            self.delta_at(camp.x, camp.y)["looted_camps"][camp.uid] = camp.inventory
@@ -1,88 +1,107 @@
 import pygame
-import random
+
+from assets import assets
+from herd import Herd, WALK_SPEED, RUN_SPEED
+from render_queue import ACTORS
 
 class Cow:
-    def __init__(self, x, y, image):
-        self.x = x
-        self.y = y
+    """One cow in a Herd. All of its state lives in the herd's arrays (see herd.py);
+    this object only remembers its slot and its sprite."""
+
+    speed = WALK_SPEED
+    run_speed = RUN_SPEED
+
+    def __init__(self, x, y, image, bounds=None, herd=None):
         self.image = image
-        self.rect = pygame.Rect(x, y, image.get_width(), image.get_height())
-
-        self.health = 3
-        self.speed = 1.3
-        self.run_speed = 5.0
-        self.facing_right = True
-
-        self.invincibility_frames = 0
-        self.moving_timer = 0
-        self.moving_direction = [0, 0]
-        self.run_direction = [0, 0]
-
-    def wander(self, blocked_rects=[]):
-        dx, dy = 0, 0  # Make sure dx and dy always exist
-
-        if self.invincibility_frames > 0:
-            self.invincibility_frames -= 1
-            dx = self.run_direction[0] * self.run_speed
-            dy = self.run_direction[1] * self.run_speed
-        else:
-            if self.moving_timer <= 0:
-                self.moving_direction = [random.choice([-1, 0, 1]), random.choice([-1, 0, 1])]
-                self.moving_timer = random.randint(30, 90)
-            else:
-                self.moving_timer -= 1
-
-            dx = self.moving_direction[0] * self.speed
-            dy = self.moving_direction[1] * self.speed
-
-        self.x += dx
-        self.y += dy
-
-        # Facing direction
-        if dx != 0:
-            self.facing_right = dx < 0
-
-        # Clamp to map
-        self.x = max(0, min(self.x, 4000 - self.image.get_width()))
-        self.y = max(0, min(self.y, 3000 - self.image.get_height()))
-        self.rect.topleft = (self.x, self.y)
-
-        # Collision with environment
-        for rect in blocked_rects:
-            if self.rect.colliderect(rect):
-                self.x -= dx
-                self.y -= dy
-                self.rect.topleft = (self.x, self.y)
-                break
+        self.bounds = bounds  # Area the cow may wander in (its home chunk)
+        self.herd = herd if herd is not None else Herd(image.get_size(), capacity=1)
+        self.slot = self.herd.add(self, x, y, bounds)
 
-    def take_damage(self, player_pos):
-        if self.invincibility_frames > 0:
-            return False
+    def release(self):
+        """Give the slot back to the herd (the cow's chunk was unloaded)."""
+        self.herd.remove(self.slot)
 
-        self.health -= 1
-        self.invincibility_frames = 15  # ~0.5 sec
+    # --- State (views over the herd arrays) ---
+    @property
+    def x(self):
+        return float(self.herd.x[self.slot])
 
-        # Run away direction
-        dx = self.x - player_pos[0]
-        dy = self.y - player_pos[1]
-        dist = (dx**2 + dy**2) ** 0.5 or 1
-        self.run_direction = [dx / dist, dy / dist]
+    @x.setter
+    def x(self, value):
+        self.herd.x[self.slot] = self.herd.prev_x[self.slot] = value
 
-        return self.health <= 0
+    @property
+    def y(self):
+        return float(self.herd.y[self.slot])
 
-    def draw(self, screen, camera_x, camera_y):
-        sprite = self.image
-        if not self.facing_right:
-            sprite = pygame.transform.flip(sprite, True, False)
+    @y.setter
+    def y(self, value):
+        self.herd.y[self.slot] = self.herd.prev_y[self.slot] = value
+
+    @property
+    def rect(self):
+        return self.herd.rect(self.slot)
+
+    @property
+    def health(self):
+        return int(self.herd.health[self.slot])
+
+    @health.setter
+    def health(self, value):
+        self.herd.health[self.slot] = value
+
+    @property
+    def facing_right(self):
+        return bool(self.herd.facing_right[self.slot])
+
+    @property
+    def invincibility_frames(self):
+        return float(self.herd.iframes[self.slot])
+
+    @property
+    def moving_direction(self):
+        return [int(self.herd.dir_x[self.slot]), int(self.herd.dir_y[self.slot])]
 
-        screen.blit(sprite, (self.x - camera_x, self.y - camera_y))
+    @property
+    def run_direction(self):
+        return [float(self.herd.run_x[self.slot]), float(self.herd.run_y[self.slot])]
+
+    def take_damage(self, player_pos):
+        """Lose one health and flee from player_pos. Returns True if the cow died."""
+        return self.herd.hit(self.slot, player_pos[0], player_pos[1])
+
+    # --- Drawing ---
+    def sprite_blits(self, camera_x, camera_y):
+        """(surface, dest) pairs for the cow and its health bar."""
+        x, y = self.herd.draw_position(self.slot)  # Between the last two herd steps
+        sprite = assets.variant(self.image, flip_x=not self.facing_right)  # Flipped copy is built once
+        blits = [(sprite, (x - camera_x, y - camera_y))]
 
         # Health bar
-        if self.health < 3:
-            bar_w, bar_h = 40, 6
-            ratio = self.health / 3
-            bar_x = self.x + self.image.get_width() // 2 - bar_w // 2 - camera_x
-            bar_y = self.y - 12 - camera_y
-
-            pygame.draw.rect(screen, (0, 0, 0), (bar_x, bar_y, bar_w, bar_h))
-            pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, int(bar_w * ratio), bar_h))
+        health = self.health
+        if health < 3:
+            bar_x = x + self.image.get_width() // 2 - HEALTH_BAR_SIZE[0] // 2 - camera_x
+            bar_y = y - 12 - camera_y
+            blits.append((health_bar(health), (bar_x, bar_y)))
+        return blits
+
+    def draw(self, screen, camera_x, camera_y):
+        screen.blits(self.sprite_blits(camera_x, camera_y), doreturn=False)
+
+    def submit(self, queue, camera_x, camera_y):
+        queue.extend(ACTORS, self.sprite_blits(camera_x, camera_y))
+
+
+# Health bars only come in a few widths, so each one is drawn once
+HEALTH_BAR_SIZE = (40, 6)
+health_bars = {}
+
+
+def health_bar(health, max_health=3):
+    bar = health_bars.get(health)
+    if bar is None:
+        bar_w, bar_h = HEALTH_BAR_SIZE
+        bar = health_bars[health] = pygame.Surface(HEALTH_BAR_SIZE)
+        bar.fill((0, 0, 0))
+        pygame.draw.rect(bar, (255, 0, 0), (0, 0, int(bar_w * max(health, 0) / max_health), bar_h))
+    return bar
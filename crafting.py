@@ -1,7 +1,14 @@
 import pygame
 
+from inventory import HOTBAR, INVENTORY, SlotList
+from text_cache import render_text
+
 
 def inventory_to_dict(inventory_slots, hotbar_slots=None):
+    """{item: count}. The player's slots are read from their Inventory's totals (hotbar
+    included); plain lists (a chest's, say) are counted slot by slot."""
+    if isinstance(inventory_slots, SlotList):
+        return inventory_slots.inventory.to_dict()
     data = {}
     for slot in (inventory_slots + (hotbar_slots or [])):
         if slot:
@@ -9,84 +16,17 @@ def inventory_to_dict(inventory_slots, hotbar_slots=None):
             data[item] = data.get(item, 0) + slot["count"]
     return data
 
-def consolidate_duplicates(inventory_slots, hotbar_slots):
-    """Merge duplicate item stacks without reordering or teleporting between inventory/hotbar."""
-
-    all_slots = inventory_slots + hotbar_slots
-    seen = {}
-
-    for i, slot in enumerate(all_slots):
-        if not slot:
-            continue
-
-        item = slot["item"]
-
-        # If this item type has already been seen, merge into the first slot
-        if item in seen:
-            target_index = seen[item]
-            target_slot = all_slots[target_index]
-            target_slot["count"] += slot["count"]
-
-            # Clear the current duplicate slot (but don't delete it)
-            all_slots[i] = None
-        else:
-            seen[item] = i  # Mark this as the "main" stack for this item
-
-    # Reassign back to original lists (since we merged them earlier)
-    for i in range(len(inventory_slots)):
-        inventory_slots[i] = all_slots[i]
-
-    for i in range(len(hotbar_slots)):
-        hotbar_slots[i] = all_slots[i + len(inventory_slots)]
-    
-
 def add_to_inventory(inventory_slots, item_name, amount=1, hotbar=None):
-    """Adds item to inventory or hotbar, stacking if possible, and consolidates after."""
-    # Step 1: Stack into existing hotbar slots
-    if hotbar:
-        for slot in hotbar:
-            if slot and slot["item"] == item_name:
-                slot["count"] += amount
-                break
-        else:
-            # Step 2: Stack into existing inventory slots
-            for slot in inventory_slots:
-                if slot and slot["item"] == item_name:
-                    slot["count"] += amount
-                    break
-            else:
-                # Step 3: Add to empty hotbar slot
-                for i in range(len(hotbar)):
-                    if hotbar[i] is None:
-                        hotbar[i] = {"item": item_name, "count": amount}
-                        break
-                else:
-                    # Step 4: Add to empty inventory slot
-                    for i in range(len(inventory_slots)):
-                        if inventory_slots[i] is None:
-                            inventory_slots[i] = {"item": item_name, "count": amount}
-                            break
-                    else:
-                        print("Inventory and hotbar full! Could not add", item_name)
-                        return
-    else:
-        # No hotbar given, just do inventory
-        for slot in inventory_slots:
-            if slot and slot["item"] == item_name:
-                slot["count"] += amount
-                break
-        else:
-            for i in range(len(inventory_slots)):
-                if inventory_slots[i] is None:
-                    inventory_slots[i] = {"item": item_name, "count": amount}
-                    break
-            else:
-                print("Inventory full! Could not add", item_name)
-                return
-
-    # ✅ Final Step: Consolidate inventory and hotbar after adding
-    if hotbar:
-        consolidate_duplicates(inventory_slots, hotbar)
+    """Adds item to the hotbar or inventory, stacking if possible. Returns False if there was no room.
+
+    inventory_slots has to be a SlotList from an Inventory (a plain list raises TypeError);
+    without a hotbar the item only goes in that row.
+    """
+    if not isinstance(inventory_slots, SlotList):
+        raise TypeError("add_to_inventory needs the slot lists of an Inventory, not a plain list")
+    inventory = inventory_slots.inventory
+    rows = (HOTBAR, INVENTORY) if hotbar is not None else (inventory_slots.row,)
+    return inventory.add(item_name, amount, rows)
 
 class CraftingSystem:
     def __init__(self):
@@ -113,14 +53,9 @@ class CraftingSystem:
         return False
 
     def can_craft(self, item_name, inventory_slots, hotbar_slots):
-        inventory = inventory_to_dict(inventory_slots, hotbar_slots)
         if item_name not in self.recipes:
             return False
-        for material, amount in self.recipes[item_name].items():
-            if inventory.get(material, 0) < amount:
-                return False
-        return True
-
+        return inventory_slots.inventory.has(self.recipes[item_name])
 
     def craft_item(self, item_name, inventory_slots, hotbar_slots):
         """
@@ -130,20 +65,9 @@ class CraftingSystem:
             print(f"Cannot craft {item_name}. Insufficient materials.")
             return False
 
-        # Combine inventory and hotbar into one list for material deduction
-        combined_slots = inventory_slots + hotbar_slots
-
+        inventory = inventory_slots.inventory
         for material, amount in self.recipes[item_name].items():
-            for slot in combined_slots:
-                if slot and slot["item"] == material:
-                    if slot["count"] >= amount:
-                        slot["count"] -= amount
-                        if slot["count"] == 0:
-                            slot.clear()
-                        break
-                    else:
-                        amount -= slot["count"]
-                        slot.clear()
+            inventory.remove(material, amount)
 
         return item_name
 
@@ -174,7 +98,6 @@ class CraftingSystem:
         pygame.draw.rect(screen, (50, 50, 50), (self.panel_x, self.panel_y, self.panel_width, self.panel_height))
         pygame.draw.rect(screen, (200, 200, 200), (self.panel_x, self.panel_y, self.panel_width, self.panel_height), 3)
 
-        font = pygame.font.Font(None, 24)
         self.buttons = []
         y_offset = self.panel_y + 50
 
@@ -187,7 +110,7 @@ class CraftingSystem:
 
             # Draw item name and recipe
             text = f"{item_name} - {', '.join([f'{v}x {k}' for k, v in recipe.items()])}"
-            text_surface = font.render(text, True, (255, 255, 255))
+            text_surface = render_text(text, 24)
             screen.blit(text_surface, (self.panel_x + 30, y_offset + 10))
 
             # Update y_offset for next button
@@ -1,5 +1,7 @@
 import pygame
 
+from hud import Panel
+
 class DayNightCycle:
     def __init__(self, day_length=300, night_length=150):
         """Initialize the day-night cycle with different day and night speeds."""
@@ -8,6 +10,7 @@ class DayNightCycle:
         self.night_length = night_length * 1000  # Convert night duration to milliseconds
         self.full_cycle = self.day_length + self.night_length  # Total cycle length
         self.night_opacity = 180  # How dark night gets (0-255)
+        self.clock_panel = None  # Cached clock HUD, created on first draw
 
     def get_time_of_day(self):
         """Returns a value between 0 (morning) and 1 (midnight)."""
@@ -17,8 +20,8 @@ class DayNightCycle:
         else:
             return 0.5 + ((current_time - self.day_length) / self.night_length) * 0.5  # Nighttime (0.5 to 1)
 
-    def draw(self, screen):
-        """Draws a transparent overlay to simulate day-night lighting."""
+    def get_darkness(self):
+        """How dark the world is right now (0 = full daylight, night_opacity = midnight)."""
         time_of_day = self.get_time_of_day()
         darkness = 0
 
@@ -34,29 +37,44 @@ class DayNightCycle:
         elif 0.75 <= time_of_day < 1:
             darkness = int(((1 - time_of_day) / 0.25) * self.night_opacity)
 
-        # **Apply Darkness Overlay**
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, darkness))  
-        screen.blit(overlay, (0, 0))
+        return darkness
+
+    def draw(self, screen, lightmap):
+        """Darkens the world through the lightmap, then draws the clock on top."""
+        lightmap.composite(screen)
 
         # Draw the clock GUI
-        self.draw_clock(screen, time_of_day)
+        self.draw_clock(screen, self.get_time_of_day())
 
     def draw_clock(self, screen, time_of_day):
         """Draws a simple clock UI showing sun & moon movement."""
         clock_x, clock_y = (screen.get_width() // 2) - 200, 20  # Centered horizontally
         clock_width, clock_height = 400, 40  # Increased size
 
+        if self.clock_panel is None:
+            # Border is 2px outside the clock; the sun/moon can stick out 30px on the right
+            self.clock_panel = Panel((clock_x - 2, clock_y - 2, clock_width + 4 + 30, clock_height + 4), self.render_clock)
+
+        # Only redrawn when the sun or moon moves a pixel
+        sun_x = int(time_of_day * clock_width)
+        moon_x = int((time_of_day + 0.5) % 1 * clock_width)
+        self.clock_panel.update((sun_x, moon_x), time_of_day)
+        self.clock_panel.draw(screen)
+
+    def render_clock(self, surface, time_of_day):
+        clock_x, clock_y = 2, 2  # Inside the border
+        clock_width, clock_height = 400, 40
+
         # **Draw Background**
-        pygame.draw.rect(screen, (50, 50, 50), (clock_x, clock_y, clock_width, clock_height))
-        pygame.draw.rect(screen, (0, 0, 0), (clock_x - 2, clock_y - 2, clock_width + 4, clock_height + 4), 2)  # Black Border
+        pygame.draw.rect(surface, (50, 50, 50), (clock_x, clock_y, clock_width, clock_height))
+        pygame.draw.rect(surface, (0, 0, 0), (clock_x - 2, clock_y - 2, clock_width + 4, clock_height + 4), 2)  # Black Border
 
         # **Determine Sun & Moon Position**
         sun_x = int(clock_x + (time_of_day * clock_width))  # Move sun based on time
         moon_x = int(clock_x + ((time_of_day + 0.5) % 1 * clock_width))  # Moon moves opposite to sun
 
         # **Draw Sun (Orange Square)**
-        pygame.draw.rect(screen, (255, 165, 0), (sun_x, clock_y + 10, 30, 30))  # Sun position
+        pygame.draw.rect(surface, (255, 165, 0), (sun_x, clock_y + 10, 30, 30))  # Sun position
 
         # **Draw Moon (Gray Square)**
-        pygame.draw.rect(screen, (180, 180, 180), (moon_x, clock_y + 10, 30, 30))  # Moon position
+        pygame.draw.rect(surface, (180, 180, 180), (moon_x, clock_y + 10, 30, 30))  # Moon position
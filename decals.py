@@ -0,0 +1,101 @@
+import pygame
+
+import world_events
+from render_queue import DECALS
+from scheduler import scheduler
+
+CHUNK_SIZE = 1024     # Same chunks as the world streaming (chunks.CHUNK_SIZE)
+FADE_INTERVAL = 0.25  # Simulation seconds between global fade steps
+FADE_FACTOR = 200     # Alpha is multiplied by FADE_FACTOR / 255 every step
+FADE_STEPS = 24       # After this many steps without a new stamp a chunk is blank
+FOOTPRINT_COLOR = (100, 80, 60, 255)  # Brownish
+
+
+class DecalLayer:
+    """Marks on the ground (footprints, later scorch marks, blood...) stamped once
+    into persistent chunk-sized surfaces.
+
+    All decals fade together: every FADE_INTERVAL of simulation time the alpha of
+    each surface is scaled down in one fill, and a surface that has faded out is
+    dropped. Drawing is one blit per visible chunk, however many decals there are.
+    """
+
+    def __init__(self):
+        self.surfaces = {}    # (cx, cy) -> SRCALPHA surface covering the chunk
+        self.idle_steps = {}  # (cx, cy) -> fade steps since the last stamp
+        self.last_fade = None  # scheduler.now at the last fade step (set on the first update)
+        self.stamps = 0
+        self.subscriptions = world_events.subscribe_all([("chunk_unloaded", self.on_chunk_unloaded)])
+
+    def close(self):
+        world_events.unsubscribe_all(self.subscriptions)
+
+    def chunk_keys(self, rect):
+        cx0, cy0 = rect.left // CHUNK_SIZE, rect.top // CHUNK_SIZE
+        cx1, cy1 = (rect.right - 1) // CHUNK_SIZE, (rect.bottom - 1) // CHUNK_SIZE
+        return [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+
+    def surface_for(self, key):
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((CHUNK_SIZE, CHUNK_SIZE), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()  # Display format, so the per-frame chunk blits stay cheap
+            self.surfaces[key] = surface
+        self.idle_steps[key] = 0
+        return surface
+
+    # --- Stamping ---
+    def stamp(self, image, x, y):
+        """Blend an image into the decal layer at world (x, y)."""
+        rect = image.get_rect(topleft=(int(x), int(y)))
+        for key in self.chunk_keys(rect):
+            self.surface_for(key).blit(image, (rect.x - key[0] * CHUNK_SIZE, rect.y - key[1] * CHUNK_SIZE))
+        self.stamps += 1
+
+    def fill(self, color, rect):
+        """Stamp a solid rectangle (cheaper than stamp for plain shapes)."""
+        rect = pygame.Rect(rect)
+        for key in self.chunk_keys(rect):
+            self.surface_for(key).fill(color, rect.move(-key[0] * CHUNK_SIZE, -key[1] * CHUNK_SIZE))
+        self.stamps += 1
+
+    def add_footprint(self, x, y, size):
+        self.fill(FOOTPRINT_COLOR, (int(x), int(y), size, size))
+
+    # --- Fading ---
+    def update(self):
+        """Apply the fade steps due by the current simulation time (called every tick)."""
+        now = scheduler.now
+        if self.last_fade is None:
+            self.last_fade = now
+        steps = int((now - self.last_fade) // FADE_INTERVAL)
+        if steps <= 0:
+            return
+        self.last_fade += steps * FADE_INTERVAL
+
+        for key in list(self.surfaces):
+            self.idle_steps[key] += steps
+            if self.idle_steps[key] >= FADE_STEPS:
+                self.drop(key)
+                continue
+            for _ in range(min(steps, FADE_STEPS)):
+                self.surfaces[key].fill((255, 255, 255, FADE_FACTOR), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def drop(self, key):
+        self.surfaces.pop(key, None)
+        self.idle_steps.pop(key, None)
+
+    def on_chunk_unloaded(self, chunk):
+        self.drop(chunk.key)
+
+    # --- Drawing ---
+    def submit(self, queue, camera_x, camera_y, view):
+        """Queue one blit per visible chunk that has decals. Returns the number of blits."""
+        blits = [
+            (surface, (key[0] * CHUNK_SIZE - camera_x, key[1] * CHUNK_SIZE - camera_y))
+            for key, surface in self.surfaces.items()
+            if view.colliderect((key[0] * CHUNK_SIZE, key[1] * CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE))
+        ]
+        queue.extend(DECALS, blits)
+        return len(blits)
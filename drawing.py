@@ -1,47 +1,93 @@
 import pygame
+from render_queue import RenderQueue, GROUND, LIGHTING
 from ui_helpers import draw_grid, draw_inventory, draw_hotbar  # Import draw_inventory and draw_hotbar
 
+# Dropped water has no icon, it's a plain square
+WATER_ITEM = pygame.Surface((30, 30))
+WATER_ITEM.fill((50, 143, 168))
+
+# Shared by every frame; emptied by each flush
+render_queue = RenderQueue()
+
+# --- Culling ---
+SPRITE_MARGIN = 32  # Item icons and cow health bars reach past their rects
+GLOW_MARGIN = 340   # Campfire glow radius tops out around 330 px
+
+# Per-frame culling counters {kind: {"visible": n, "culled": n}}, refreshed by every draw_game call
+cull_stats = {}
+
+
+def record_cull(kind, visible, total):
+    cull_stats[kind] = {"visible": visible, "culled": total - visible}
+
+
+def cull_totals():
+    """(visible, culled) summed over every entity kind for the last frame."""
+    visible = sum(stats["visible"] for stats in cull_stats.values())
+    culled = sum(stats["culled"] for stats in cull_stats.values())
+    return visible, culled
+
+
 def draw_game(
-    screen, player, camera_x, camera_y, lakes, rocks, cows, items, camps, campfires,
+    screen, player, camera_x, camera_y, world, terrain,
     inventory_open, inventory_slots, hotbar_slots, dragged_item, dragged_index,
     dragged_from, survival, minimap, crafting_system, day_night_cycle, particle_system,
-    ITEM_TYPES, grid_surface  # Add grid_surface as a parameter
+    ITEM_TYPES, grid_overlay, lightmap, decals
 ):
-    for lake in lakes:
-        for tile in lake:
-            tile.draw(screen, camera_x, camera_y)
+    # Camera rectangle, computed once; entities outside it are never submitted
+    view = pygame.Rect(camera_x, camera_y, screen.get_width(), screen.get_height())
+    sprite_view = view.inflate(SPRITE_MARGIN * 2, SPRITE_MARGIN * 2)
+    glow_view = view.inflate(GLOW_MARGIN * 2, GLOW_MARGIN * 2)
+
+    # World sprites are queued per layer and flushed with one blits call per layer,
+    # so the layer decides what ends up on top, not the order below.
+
+    # Lakes, rocks, camp bases and fire pits come pre-rendered, one blit per visible chunk
+    terrain_blits = terrain.submit(render_queue, camera_x, camera_y, view.width, view.height)
+    record_cull("terrain_chunks", terrain_blits, len(world.chunks))
 
-    for rock in rocks:
-        rock.draw(screen, camera_x, camera_y)
+    # Footprints and other ground marks, one blit per chunk that has any
+    record_cull("decal_chunks", decals.submit(render_queue, camera_x, camera_y, view), len(decals.surfaces))
 
+    cows = world.cow_index.query_rect(sprite_view)
+    record_cull("cows", len(cows), len(world.cow_index))
     for cow in cows:
-        cow.draw(screen, camera_x, camera_y)
+        cow.submit(render_queue, camera_x, camera_y)
 
-    for item in items:
-        ix, iy = item["x"] - camera_x, item["y"] - camera_y
-        if item["type"] == "Water":
-            pygame.draw.rect(screen, (50, 143, 168), (ix, iy, 30, 30))
-        else:
-            screen.blit(ITEM_TYPES[item["type"]], (ix, iy))  # Use ITEM_TYPES to draw items
+    items = world.item_index.query_rect(sprite_view)
+    record_cull("items", len(items), len(world.item_index))
+    render_queue.extend(GROUND, [
+        (WATER_ITEM if item["type"] == "Water" else ITEM_TYPES[item["type"]], (item["x"] - camera_x, item["y"] - camera_y))
+        for item in items
+    ])
 
+    camps = [camp for camp in world.camps if view.colliderect(camp.chest_rect)]
+    record_cull("camp_chests", len(camps), len(world.camps))
     for camp in camps:
-        camp.draw(screen, camera_x, camera_y)
+        camp.submit_chest(render_queue, camera_x, camera_y)
+
+    player.submit(render_queue, camera_x, camera_y, debug=True)
 
-    player.draw(screen, camera_x, camera_y, debug=True)
-    day_night_cycle.draw(screen)
+    # Night darkness and firelight are accumulated in the lightmap and multiplied over the world
+    lightmap.begin(day_night_cycle.get_darkness())
+    fires = [fire for fire in world.campfires if fire.is_burning() and glow_view.colliderect(fire.rect)]
+    record_cull("campfires", len(fires), len(world.campfires))
+    for fire in fires:
+        if lightmap.ambient < 255:
+            fire.add_light(lightmap, camera_x, camera_y)
+        else:
+            fire.submit_glow(render_queue, camera_x, camera_y)  # No lightmap in full daylight, so fires glow as before
+    render_queue.call(LIGHTING, lambda screen: day_night_cycle.draw(screen, lightmap))
 
-    for fire in campfires:
-        if fire.is_burning():
-            fire.draw(screen, camera_x, camera_y)
+    render_queue.flush(screen)
 
     survival.draw(screen)
-    minimap.draw(screen, player.x, player.y, camps=camps, rocks=rocks, water_tiles=lakes, cows=cows)
+    minimap.draw(screen, player.x, player.y, world.tile_grid, world.herd)
     crafting_system.draw(screen, inventory_slots)
-    particle_system.update()
     particle_system.draw(screen, camera_x, camera_y)
 
     # Draw grid
-    draw_grid(screen, grid_surface, camera_x, camera_y)  # Use imported draw_grid
+    draw_grid(screen, grid_overlay, camera_x, camera_y)  # Use imported draw_grid
 
     # Draw inventory
     draw_inventory(screen, inventory_slots, inventory_open, ITEM_TYPES, dragged_item=dragged_item, dragged_index=dragged_index, dragged_from=dragged_from)
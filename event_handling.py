@@ -1,10 +1,9 @@
 import pygame
 from save_load import save_game
-from crafting import inventory_to_dict  # Import inventory_to_dict
 
 def handle_events(
     event, keys, inventory_open, crafting_system, minimap, survival, inventory_slots,
-    hotbar_slots, player, camps, rocks, items, campfires, lakes, cows, day_night_cycle
+    hotbar_slots, player, world, day_night_cycle
 ):
     if event.type == pygame.QUIT:
         return False, inventory_open
@@ -12,27 +11,27 @@ def handle_events(
     elif event.type == pygame.KEYDOWN:
         if pygame.K_1 <= event.key <= pygame.K_8:
             selected_hotbar_index = event.key - pygame.K_1
-        elif event.key == pygame.K_e and not any(c.is_open for c in camps):
+        elif event.key == pygame.K_e and not any(c.is_open for c in world.camps):
             inventory_open = not inventory_open  # Toggle inventory
         elif event.key == pygame.K_c:
             crafting_system.toggle()
         elif event.key == pygame.K_m:
             minimap.toggle_fullscreen()
         elif event.key == pygame.K_h:
-            survival.eat(inventory_to_dict(inventory_slots))  # Use imported inventory_to_dict
+            # Survival looks at the count from the inventory's totals; the meat/water is then taken out of the slots
+            inventory = inventory_slots.inventory
+            if survival.eat({"Meat": inventory.count("Meat")}):
+                inventory.remove("Meat")
         elif event.key == pygame.K_j:
-            survival.drink(inventory_to_dict(inventory_slots))  # Use imported inventory_to_dict
+            inventory = inventory_slots.inventory
+            if survival.drink({"Water": inventory.count("Water")}):
+                inventory.remove("Water")
         elif event.key == pygame.K_o:
             save_game(
                 player,
                 inventory_slots,
                 hotbar_slots,
-                rocks,
-                items,
-                campfires,
-                lakes,
-                camps,
-                cows,
+                world,
                 day_night_cycle.time_of_day,
                 survival.hunger,
                 survival.thirst,
@@ -40,7 +39,7 @@ def handle_events(
             print("Game saved.")
         elif event.key == pygame.K_ESCAPE:
             inventory_open = False
-            for c in camps:
+            for c in world.camps:
                 c.is_open = False
 
     return True, inventory_open
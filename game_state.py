@@ -1,23 +1,27 @@
+import random
 from save_load import save_game, load_game
 
-def initialize_game_state(rock_images, cow_image, MAP_WIDTH, MAP_HEIGHT, GRID_SIZE, PLAYER_SAFE_ZONE):
-    saved = load_game(rock_images, cow_image)
+def initialize_game_state(MAP_WIDTH, MAP_HEIGHT, fresh=False, seed=None):
+    """Player state, world seed and world changes from the save file, or a fresh start.
+
+    fresh ignores the save file (headless runs); seed fixes the seed of a fresh world.
+    """
+    saved = None if fresh else load_game()
     if saved:
+        if saved["seed"] is None:
+            saved["seed"] = random.randrange(2 ** 32)
         return saved
     else:
         return {
             "player": {"x": MAP_WIDTH // 2, "y": MAP_HEIGHT // 2},
             "inventory_slots": [None] * 24,
             "hotbar_slots": [None] * 8,
-            "rocks": [],
-            "items": [],
-            "campfires": [],
-            "lakes": [],
-            "camps": [],
-            "cows": [],
             "time_of_day": 0,
             "hunger": 100,
             "thirst": 100,
+            "seed": seed if seed is not None else random.randrange(2 ** 32),
+            "changes": {},
+            "timers": {},
         }
 
 def inventory_to_dict(slots):
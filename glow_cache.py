@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+DESERT_COLOR = (199, 168, 107)
+
+# Warm light tint: desert blended 20% towards orange, same as the original campfire glow
+GLOW_COLOR = (
+    int(DESERT_COLOR[0] * 0.8 + 255 * 0.2),
+    int(DESERT_COLOR[1] * 0.8 + 140 * 0.2),
+    int(DESERT_COLOR[2] * 0.8 + 50 * 0.2),
+)
+
+# Color a light source adds to the lightmap at full strength (warm firelight)
+LIGHT_COLOR = (255, 190, 120)
+
+RADIUS_STEP = 8   # Glow radii are rounded to this many pixels
+ALPHA_STEP = 12   # Peak alphas are rounded to this many levels
+
+
+def render_glow(radius, alpha, color=GLOW_COLOR):
+    """Radial gradient sprite: alpha at the center fading linearly to 0 at radius."""
+    size = radius * 2
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    surface.fill(color + (0,))
+
+    # Distance of every pixel center from the middle, turned into the ring alpha
+    coords = np.arange(size) - radius + 0.5
+    dist = np.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2)
+    ring = np.maximum(np.ceil(dist), 1)
+    fade = np.where(dist <= radius, alpha * (1 - ring / radius), 0)
+
+    pixels = pygame.surfarray.pixels_alpha(surface)
+    pixels[:] = np.clip(fade, 0, 255).astype(np.uint8)
+    del pixels  # Unlock the surface
+    return surface
+
+
+def render_light(radius, alpha, color=LIGHT_COLOR):
+    """Opaque light sprite for the lightmap: color scaled by alpha/255, fading to black at radius.
+
+    Meant to be added onto a lightmap with BLEND_RGB_ADD, so black corners add nothing.
+    """
+    size = radius * 2
+    coords = np.arange(size) - radius + 0.5
+    dist = np.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2)
+    falloff = np.clip(1 - dist / radius, 0, 1) * (alpha / 255)
+
+    rgb = (falloff[:, :, None] * np.array(color)).astype(np.uint8)
+    return pygame.surfarray.make_surface(rgb)
+
+
+class GlowCache:
+    """Pre-rendered glow sprites for quantized (radius, alpha) buckets with LRU eviction.
+
+    Every fire shares the sprites, so drawing a glow is a lookup and one blit.
+    `render(radius, alpha)` builds a missing sprite.
+    """
+
+    def __init__(self, max_entries=48, render=render_glow, radius_step=RADIUS_STEP, alpha_step=ALPHA_STEP):
+        self.max_entries = max_entries
+        self.render = render
+        self.radius_step = radius_step
+        self.alpha_step = alpha_step
+        self.sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, radius, alpha):
+        radius = int(round(radius / self.radius_step)) * self.radius_step
+        alpha = int(round(alpha / self.alpha_step)) * self.alpha_step
+        return radius, min(alpha, 255)
+
+    def get(self, radius, alpha):
+        """Glow sprite for the bucket nearest to (radius, alpha), or None if it would be invisible."""
+        key = self.quantize(radius, alpha)
+        if key[0] <= 0 or key[1] <= 0:
+            return None
+
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = self.sprites[key] = self.render(*key)
+        if len(self.sprites) > self.max_entries:
+            self.sprites.popitem(last=False)
+        return sprite
+
+
+glow_cache = GlowCache()
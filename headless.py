@@ -0,0 +1,141 @@
+"""Run the simulation without rendering, as fast as it will go.
+
+Builds a fresh world the same way the game does, feeds it scripted input and
+reports how many ticks per second it managed. Works without a display:
+
+    python headless.py [seconds of game time] [seed]
+
+Handy for soak tests, balancing the Survival drain rates and benchmarks.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window needed
+
+import pygame
+
+from assets import assets
+from crafting import CraftingSystem
+from day_night import DayNightCycle
+from decals import DecalLayer
+from event_handling import handle_events
+from game_state import initialize_game_state
+from minimap import MiniMap
+from settings import GRID_SIZE, MAP_HEIGHT, MAP_WIDTH
+from settings import SCREEN_HEIGHT as VIEW_HEIGHT, SCREEN_WIDTH as VIEW_WIDTH  # Chunks stream around a view this size
+from simulation import build_simulation, TICK_RATE
+
+
+class KeyState:
+    """Stands in for pygame.key.get_pressed(): keys[pygame.K_x] is True while x is held."""
+
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    """Input played from a script of (ticks, held keys, keys pressed at the start) steps.
+
+    The script loops, so a short pattern can drive a session of any length.
+    """
+
+    def __init__(self, steps, loop=True):
+        self.steps = [(ticks, KeyState(held), tuple(pressed)) for ticks, held, pressed in steps]
+        self.loop = loop
+        self.length = sum(ticks for ticks, _, _ in self.steps)
+
+    def at(self, tick):
+        """(KeyState, [KEYDOWN events]) for a tick."""
+        if self.loop:
+            tick %= self.length
+        for ticks, keys, pressed in self.steps:
+            if tick < ticks:
+                events = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in pressed] if tick == 0 else []
+                return keys, events
+            tick -= ticks
+        return KeyState(), []
+
+
+# Walk a square (sprinting part of the way), stand around, eat and drink
+DEFAULT_SCRIPT = [
+    (60, {pygame.K_RIGHT}, ()),
+    (30, {pygame.K_DOWN, pygame.K_LSHIFT}, ()),
+    (60, {pygame.K_LEFT}, ()),
+    (30, {pygame.K_UP, pygame.K_LCTRL}, ()),
+    (90, {pygame.K_f}, (pygame.K_h, pygame.K_j)),
+]
+
+
+class HeadlessGame:
+    """The game minus everything that draws: the Simulation plus the systems input events reach."""
+
+    def __init__(self, seed=None, game_state=None, rng_seed=None):
+        if not pygame.display.get_init() or pygame.display.get_surface() is None:
+            pygame.init()
+            pygame.display.set_mode((1, 1))  # Sprites are converted on load, which needs a display mode
+        assets.load_game_assets()
+
+        self.decals = DecalLayer()  # Footprints go here, as in the game, so the particles match a recording
+        if game_state is None:
+            game_state = initialize_game_state(MAP_WIDTH, MAP_HEIGHT, fresh=True, seed=seed)
+        self.simulation = build_simulation(
+            game_state, MAP_WIDTH, MAP_HEIGHT, VIEW_WIDTH, VIEW_HEIGHT, GRID_SIZE,
+            decals=self.decals, rng_seed=rng_seed
+        )
+        self.crafting_system = CraftingSystem()
+        self.minimap = MiniMap(MAP_WIDTH, MAP_HEIGHT, VIEW_WIDTH, VIEW_HEIGHT)
+        self.day_night_cycle = DayNightCycle(30, 15)
+        self.inventory_open = False
+        self.running = True
+
+    def step(self, keys, events, dt):
+        """One tick: events go through the same handler as in the game, then the world advances."""
+        sim = self.simulation
+        for event in events:
+            self.running, self.inventory_open = handle_events(
+                event, keys, self.inventory_open, self.crafting_system, self.minimap, sim.survival,
+                sim.inventory_slots, sim.hotbar_slots, sim.player, sim.world, self.day_night_cycle
+            )
+        sim.tick(keys, dt)
+
+    def close(self):
+        """Unhook everything from world_events and the scheduler so another game can be built."""
+        self.simulation.close()
+        self.minimap.close()
+        self.decals.close()
+
+    def run(self, input_source, ticks, tick_rate=TICK_RATE):
+        """Step as fast as possible. Returns (ticks run, wall seconds)."""
+        dt = 1 / tick_rate
+        start = time.perf_counter()
+        tick = 0
+        while tick < ticks and self.running:
+            keys, events = input_source.at(tick)
+            self.step(keys, events, dt)
+            tick += 1
+        return tick, time.perf_counter() - start
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="headless.py", description="Run the simulation without rendering, as fast as it will go.")
+    parser.add_argument("seconds", nargs="?", type=float, default=600, help="seconds of game time to simulate (default 600)")
+    parser.add_argument("seed", nargs="?", type=int, default=1, help="world seed (default 1)")
+    args = parser.parse_args(argv[1:])
+
+    game = HeadlessGame(seed=args.seed)
+    ticks, elapsed = game.run(ScriptedInput(DEFAULT_SCRIPT), int(args.seconds * TICK_RATE))
+
+    sim = game.simulation
+    print(f"{ticks} ticks ({ticks / TICK_RATE:.0f} s of game time) in {elapsed:.2f} s")
+    print(f"  {ticks / elapsed:,.0f} ticks/s, {ticks / TICK_RATE / elapsed:.1f}x realtime")
+    print(f"  hunger {sim.survival.hunger:.1f}, thirst {sim.survival.thirst:.1f}, "
+          f"player at ({sim.player.x:.0f}, {sim.player.y:.0f}), {len(sim.world.chunks)} chunks, {len(sim.world.herd)} cows")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
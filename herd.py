@@ -0,0 +1,250 @@
+import numpy as np
+import pygame
+
+from lod import LODScheduler
+from tile_grid import WATER, ROCK, CAMP, CAMPFIRE
+
+FRAME_RATE = 60          # Speeds and timers are per frame at 60 FPS; step() scales them by dt
+WALK_SPEED = 1.3
+RUN_SPEED = 5.0
+WANDER_FRAMES = (30, 90)  # How long a cow keeps one wander direction
+FLEE_FRAMES = 15          # Invincibility frames after a hit, spent running away
+MAX_HEALTH = 3
+
+# Tile kinds a cow can't walk into
+BLOCKING = np.zeros(256, dtype=bool)
+BLOCKING[[WATER, ROCK, CAMP, CAMPFIRE]] = True
+
+
+class Herd:
+    """Every cow's state in NumPy arrays, advanced for all cows in one vectorized step.
+
+    Cows live in slots of fixed-size arrays (grown when full) with a free-slot
+    stack like the particle pool. Cow objects are thin views holding a slot
+    number, so the rest of the game can keep treating cows as objects.
+
+    Given the player position, step() only moves the cows the LOD scheduler
+    says are due; far away cows move rarely, in one coarse step covering
+    the time they were skipped.
+    """
+
+    def __init__(self, cow_size, capacity=256, seed=None):
+        self.cow_w, self.cow_h = cow_size
+        self.rng = np.random.default_rng(seed)
+        self.alpha = 1.0  # Render interpolation between the last two steps, set by the game loop
+        self.lod = LODScheduler()
+        self.tick = 0
+        self.capacity = 0
+        self.free_slots = []
+        self.views = []
+        self.count = 0
+        self.grow(capacity)
+
+    # --- Storage ---
+    def grow(self, capacity):
+        """Resize every array to capacity slots, keeping the cows already stored."""
+        old = self.capacity
+
+        def resized(name, dtype, fill=0):
+            array = np.full(capacity, fill, dtype=dtype)
+            if old:
+                array[:old] = getattr(self, name)
+            setattr(self, name, array)
+
+        for name in ("x", "y", "prev_x", "prev_y", "run_x", "run_y", "timer", "iframes"):
+            resized(name, np.float32)
+        resized("last_tick", np.int64)  # Herd tick each cow was last stepped at
+        resized("dir_x", np.int8)
+        resized("dir_y", np.int8)
+        resized("health", np.int16)
+        resized("facing_right", bool, True)
+        resized("alive", bool, False)
+        # Home area each cow is clamped to (unbounded by default)
+        resized("min_x", np.float32, -np.inf)
+        resized("min_y", np.float32, -np.inf)
+        resized("max_x", np.float32, np.inf)
+        resized("max_y", np.float32, np.inf)
+
+        self.views.extend([None] * (capacity - old))
+        self.free_slots.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def add(self, view, x, y, bounds=None):
+        """Claim a slot for a new cow at (x, y). Returns the slot."""
+        if not self.free_slots:
+            self.grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+        self.x[slot] = self.prev_x[slot] = x
+        self.y[slot] = self.prev_y[slot] = y
+        self.dir_x[slot] = self.dir_y[slot] = 0
+        self.run_x[slot] = self.run_y[slot] = 0
+        self.timer[slot] = 0
+        self.iframes[slot] = 0
+        self.last_tick[slot] = self.tick
+        self.health[slot] = MAX_HEALTH
+        self.facing_right[slot] = True
+        if bounds is not None:
+            self.min_x[slot], self.min_y[slot] = bounds.left, bounds.top
+            self.max_x[slot], self.max_y[slot] = bounds.right - self.cow_w, bounds.bottom - self.cow_h
+        else:
+            self.min_x[slot] = self.min_y[slot] = -np.inf
+            self.max_x[slot] = self.max_y[slot] = np.inf
+        self.alive[slot] = True
+        self.views[slot] = view
+        self.count += 1
+        return slot
+
+    def remove(self, slot):
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        self.views[slot] = None
+        self.free_slots.append(slot)
+        self.count -= 1
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return (self.views[i] for i in np.flatnonzero(self.alive))
+
+    # --- Simulation ---
+    def step(self, dt, tile_grid=None, focus=None):
+        """Advance the herd one tick of dt seconds, colliding with blocking tiles.
+
+        Without a focus every cow moves. With focus (the player position) only the
+        cows due for their LOD tier move, each by all the time since its last step.
+        """
+        self.tick += 1
+        idx = np.flatnonzero(self.alive)
+        if len(idx) == 0:
+            return
+        self.prev_x[idx], self.prev_y[idx] = self.x[idx], self.y[idx]
+
+        if focus is None:
+            frames = dt * FRAME_RATE
+        else:
+            idx, elapsed = self.lod.schedule(idx, self.x[idx], self.y[idx], self.last_tick[idx], self.tick, focus)
+            if len(idx) == 0:
+                return
+            frames = (elapsed * (dt * FRAME_RATE)).astype(np.float32)
+        self.last_tick[idx] = self.tick
+        x, y = self.x[idx], self.y[idx]
+
+        # Cows that were hit run straight away until their invincibility wears off;
+        # whatever is left of the step after that is spent wandering
+        frames = np.broadcast_to(frames, idx.shape)
+        run_frames = np.minimum(frames, np.maximum(self.iframes[idx], 0))
+        walk_frames = frames - run_frames
+        fleeing = run_frames > 0
+        self.iframes[idx[fleeing]] -= run_frames[fleeing]
+
+        # Wandering cows pick a new direction (or stand still) when their timer runs out
+        calm = walk_frames > 0
+        expired = idx[calm & (self.timer[idx] <= 0)]
+        ticking = calm & (self.timer[idx] > 0)
+        self.timer[idx[ticking]] -= walk_frames[ticking]
+        if len(expired):
+            self.dir_x[expired] = self.rng.integers(-1, 2, len(expired))
+            self.dir_y[expired] = self.rng.integers(-1, 2, len(expired))
+            self.timer[expired] = self.rng.integers(WANDER_FRAMES[0], WANDER_FRAMES[1] + 1, len(expired))
+
+        dx = self.run_x[idx] * RUN_SPEED * run_frames + self.dir_x[idx] * WALK_SPEED * walk_frames
+        dy = self.run_y[idx] * RUN_SPEED * run_frames + self.dir_y[idx] * WALK_SPEED * walk_frames
+
+        # Clamp to each cow's home chunk
+        new_x = np.clip(x + dx, self.min_x[idx], self.max_x[idx])
+        new_y = np.clip(y + dy, self.min_y[idx], self.max_y[idx])
+
+        if tile_grid is not None:
+            new_x, new_y = self.walk(x, y, new_x, new_y, tile_grid)
+
+        moving = dx != 0
+        self.facing_right[idx[moving]] = dx[moving] < 0
+        self.x[idx], self.y[idx] = new_x, new_y
+
+    def walk(self, x, y, to_x, to_y, tile_grid):
+        """Move cows from (x, y) towards (to_x, to_y), stopping in front of lakes, rocks and camps.
+
+        Long moves (far cows catching up, fleeing cows) are checked a tile at a
+        time so nothing is walked through. A cow that already overlaps a blocking
+        tile (spawned on top of it) may still walk out.
+        """
+        size = tile_grid.grid_size
+        moved = np.flatnonzero((to_x != x) | (to_y != y))
+        if len(moved) == 0:
+            return to_x, to_y
+        start_x, start_y = x[moved], y[moved]
+        dist = np.maximum(np.abs(to_x[moved] - start_x), np.abs(to_y[moved] - start_y))
+        steps = np.maximum(np.ceil(dist / size), 1).astype(np.intp)
+
+        result_x, result_y = x.copy(), y.copy()
+        cur_x, cur_y = start_x.copy(), start_y.copy()
+        walking = np.arange(len(moved))  # Cows (into moved) that haven't stopped yet
+        for step in range(1, int(steps.max()) + 1):
+            walking = walking[steps[walking] >= step]
+            t = step / steps[walking]
+            next_x = start_x[walking] + (to_x[moved[walking]] - start_x[walking]) * t
+            next_y = start_y[walking] + (to_y[moved[walking]] - start_y[walking]) * t
+            hit = self.blocked(next_x, next_y, tile_grid)
+            if hit.any():
+                hit[hit] = ~self.blocked(cur_x[walking[hit]], cur_y[walking[hit]], tile_grid)
+            clear = walking[~hit]
+            cur_x[clear], cur_y[clear] = next_x[~hit], next_y[~hit]
+            walking = clear
+        result_x[moved], result_y[moved] = cur_x, cur_y
+        return result_x, result_y
+
+    def blocked(self, xs, ys, tile_grid):
+        """True for each cow rect at (xs, ys) that touches a blocking tile."""
+        size = tile_grid.grid_size
+        # Sample the rect edges every tile so no tile under the cow is skipped
+        offsets_x = np.append(np.arange(0, self.cow_w - 1, size), self.cow_w - 1)
+        offsets_y = np.append(np.arange(0, self.cow_h - 1, size), self.cow_h - 1)
+        tiles = tile_grid.tiles
+        result = np.zeros(len(xs), dtype=bool)
+        # Positions are never negative after clamping, so truncating is flooring
+        for ox in offsets_x:
+            tx = np.minimum(((xs + ox) * (1 / size)).astype(np.intp), tile_grid.width - 1)
+            for oy in offsets_y:
+                ty = np.minimum(((ys + oy) * (1 / size)).astype(np.intp), tile_grid.height - 1)
+                result |= BLOCKING[tiles[tx, ty]]
+        return result
+
+    def hit(self, slot, from_x, from_y):
+        """Damage one cow and send it running away from (from_x, from_y).
+
+        Returns True if the cow died. Hits during the invincibility frames are ignored.
+        """
+        if self.iframes[slot] > 0:
+            return False
+        self.health[slot] -= 1
+        self.iframes[slot] = FLEE_FRAMES
+        dx = self.x[slot] - from_x
+        dy = self.y[slot] - from_y
+        dist = float(np.hypot(dx, dy)) or 1
+        self.run_x[slot], self.run_y[slot] = dx / dist, dy / dist
+        return bool(self.health[slot] <= 0)
+
+    # --- Queries ---
+    def query_rect(self, rect):
+        """Cows whose rect overlaps rect (same interface as SpatialHash.query_rect)."""
+        left, top, width, height = rect
+        mask = self.alive & (self.x < left + width) & (self.x + self.cow_w > left) \
+            & (self.y < top + height) & (self.y + self.cow_h > top)
+        return [self.views[i] for i in np.flatnonzero(mask)]
+
+    def positions(self):
+        """(xs, ys) arrays of every live cow."""
+        idx = np.flatnonzero(self.alive)
+        return self.x[idx], self.y[idx]
+
+    def draw_position(self, slot):
+        """Position interpolated between the last two steps, for rendering."""
+        a = self.alpha
+        prev_x, prev_y = float(self.prev_x[slot]), float(self.prev_y[slot])
+        return (prev_x + (float(self.x[slot]) - prev_x) * a,
+                prev_y + (float(self.y[slot]) - prev_y) * a)
+
+    def rect(self, slot):
+        return pygame.Rect(int(self.x[slot]), int(self.y[slot]), self.cow_w, self.cow_h)
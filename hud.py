@@ -0,0 +1,54 @@
+from collections import deque
+
+import pygame
+
+# Ticks of recent panel re-renders, for renders_per_second()
+recent_renders = deque()
+total_renders = 0
+
+
+def record_render():
+    global total_renders
+    total_renders += 1
+    recent_renders.append(pygame.time.get_ticks())
+
+
+def renders_per_second():
+    """How many HUD panels were re-rendered during the last second (for tuning)."""
+    cutoff = pygame.time.get_ticks() - 1000
+    while recent_renders and recent_renders[0] <= cutoff:
+        recent_renders.popleft()
+    return len(recent_renders)
+
+
+class Panel:
+    """A piece of HUD kept as its own surface and only redrawn when what it shows changes.
+
+    render(surface, *args) draws the panel in panel coordinates. update() takes a
+    hashable snapshot of the displayed values (e.g. the integer hunger value) and
+    only calls render when that snapshot differs from the last one.
+    """
+
+    def __init__(self, rect, render):
+        self.rect = pygame.Rect(rect)
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.render = render
+        self.state = None
+        self.renders = 0
+
+    def update(self, state, *args):
+        if state == self.state and self.renders:
+            return False
+        self.surface.fill((0, 0, 0, 0))
+        self.render(self.surface, *args)
+        self.state = state
+        self.renders += 1
+        record_render()
+        return True
+
+    def draw(self, screen):
+        screen.blit(self.surface, self.rect)
+
+    def invalidate(self):
+        """Force a re-render on the next update."""
+        self.renders = 0
@@ -0,0 +1,209 @@
+import heapq
+
+# Rows, in the order new stacks look for an empty slot
+HOTBAR = "hotbar"
+INVENTORY = "inventory"
+
+
+class SlotList(list):
+    """One row of slots (None or {"item", "count"}) owned by an Inventory.
+
+    It is still a plain list for everything that reads it (the UI, the save
+    file), but writing a slot goes through the inventory so its index stays
+    right, e.g. when an item is dragged to another slot. A row has a fixed
+    number of slots, so anything that would add or drop slots is refused.
+    """
+
+    def __init__(self, slots, inventory, row):
+        super().__init__(slots)
+        self.inventory = inventory
+        self.row = row
+
+    def __setitem__(self, index, slot):
+        if isinstance(index, slice):
+            new_slots = list(slot)
+            if len(range(*index.indices(len(self)))) != len(new_slots):
+                raise TypeError("inventory rows have a fixed number of slots")
+            super().__setitem__(index, new_slots)
+            self.inventory.reindex()
+        else:
+            self.inventory.set_slot(self.row, index, slot)
+
+    def fixed_size(self, *args, **kwargs):
+        raise TypeError("inventory rows have a fixed number of slots; set a slot to None to empty it")
+
+    append = extend = insert = pop = remove = clear = __delitem__ = __iadd__ = __imul__ = fixed_size
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.inventory.reindex()
+
+    def reverse(self):
+        super().reverse()
+        self.inventory.reindex()
+
+
+class Inventory:
+    """The player's hotbar and inventory slots, indexed as they change.
+
+    Keeps where each item's stack is, a free list of empty slots per row and
+    the total count of every item, so adding, counting and crafting checks
+    don't scan the slots. All changes go through add/remove/set_slot/move (or
+    a SlotList write, which calls set_slot).
+    """
+
+    def __init__(self, inventory_slots, hotbar_slots):
+        consolidate_duplicates(inventory_slots, hotbar_slots)  # Older saves may hold split stacks
+        self.slots = SlotList(inventory_slots, self, INVENTORY)
+        self.hotbar = SlotList(hotbar_slots, self, HOTBAR)
+        self.rows = {HOTBAR: self.hotbar, INVENTORY: self.slots}
+        self.reindex()
+
+    def reindex(self):
+        """Rebuild every index from the slots (only needed after bulk edits)."""
+        self.stacks = {}  # item -> (row, index) of its stack
+        self.totals = {}  # item -> count
+        self.free = {}    # row -> heap of empty slot indexes, lowest first
+        for row, slots in self.rows.items():
+            self.free[row] = []
+            for index, slot in enumerate(slots):
+                if slot:
+                    self.index_slot(row, index, slot)
+                else:
+                    self.free[row].append(index)
+            heapq.heapify(self.free[row])
+
+    def index_slot(self, row, index, slot):
+        item = slot["item"]
+        self.stacks.setdefault(item, (row, index))
+        self.totals[item] = self.totals.get(item, 0) + slot["count"]
+
+    def unindex_slot(self, row, index, slot):
+        item = slot["item"]
+        self.totals[item] -= slot["count"]
+        if self.totals[item] <= 0:
+            del self.totals[item]
+        if self.stacks.get(item) == (row, index):
+            del self.stacks[item]
+            self.find_stack(item)
+
+    def find_stack(self, item):
+        # Only reached when a stack is split over several slots (by set_slot/move)
+        if item in self.totals:
+            for row, slots in self.rows.items():
+                for index, slot in enumerate(slots):
+                    if slot and slot["item"] == item:
+                        self.stacks[item] = (row, index)
+                        return
+
+    # --- Queries ---
+    def count(self, item):
+        return self.totals.get(item, 0)
+
+    def has(self, materials):
+        """True if there is at least {item: amount} of every item."""
+        return all(self.totals.get(item, 0) >= amount for item, amount in materials.items())
+
+    def to_dict(self):
+        return dict(self.totals)
+
+    # --- Changes ---
+    def add(self, item, amount=1, rows=(HOTBAR, INVENTORY)):
+        """Stack onto the item's existing stack, or start one in the first empty slot of rows.
+
+        Returns False if there was no room.
+        """
+        location = self.stacks.get(item)
+        if location is not None and location[0] in rows:
+            self.rows[location[0]][location[1]]["count"] += amount
+            self.totals[item] += amount
+            return True
+
+        for row in rows:
+            if self.free[row]:
+                index = heapq.heappop(self.free[row])
+                list.__setitem__(self.rows[row], index, {"item": item, "count": amount})
+                self.index_slot(row, index, self.rows[row][index])
+                return True
+        print("Inventory and hotbar full! Could not add", item)
+        return False
+
+    def remove(self, item, amount=1):
+        """Take amount of item out, emptying stacks that run out. Returns False (and
+        takes nothing) if there isn't enough."""
+        if self.totals.get(item, 0) < amount:
+            return False
+        while amount > 0:
+            row, index = self.stacks[item]
+            slot = self.rows[row][index]
+            taken = min(amount, slot["count"])
+            if taken == slot["count"]:
+                self.set_slot(row, index, None)
+            else:
+                slot["count"] -= taken
+                self.totals[item] -= taken
+            amount -= taken
+        return True
+
+    def set_slot(self, row, index, slot):
+        """Put slot (or None) at rows[row][index], replacing what was there."""
+        slots = self.rows[row]
+        old = slots[index]
+        # Write first, so looking for another stack of the old item can't pick this slot
+        list.__setitem__(slots, index, slot or None)
+        if old:
+            self.unindex_slot(row, index, old)
+        if slot:
+            if not old:
+                self.free[row].remove(index)
+                heapq.heapify(self.free[row])
+            self.index_slot(row, index, slot)
+        elif old:
+            heapq.heappush(self.free[row], index)
+
+    def move(self, from_row, from_index, to_row, to_index):
+        """Drag a slot onto another: merges equal items, otherwise swaps the two."""
+        source = self.rows[from_row][from_index]
+        target = self.rows[to_row][to_index]
+        if not source or (from_row, from_index) == (to_row, to_index):
+            return
+        if target and target["item"] == source["item"]:
+            self.set_slot(from_row, from_index, None)
+            self.set_slot(to_row, to_index, {"item": target["item"], "count": target["count"] + source["count"]})
+        else:
+            self.set_slot(from_row, from_index, None)
+            self.set_slot(to_row, to_index, None)
+            self.set_slot(to_row, to_index, source)
+            self.set_slot(from_row, from_index, target)
+
+
+def consolidate_duplicates(inventory_slots, hotbar_slots):
+    """Merge duplicate item stacks without reordering or teleporting between inventory/hotbar."""
+
+    all_slots = list(inventory_slots) + list(hotbar_slots)
+    seen = {}
+
+    for i, slot in enumerate(all_slots):
+        if not slot:
+            all_slots[i] = None  # Emptied stacks ({}) become plain empty slots
+            continue
+
+        item = slot["item"]
+
+        # If this item type has already been seen, merge into the first slot
+        if item in seen:
+            target_index = seen[item]
+            target_slot = all_slots[target_index]
+            target_slot["count"] += slot["count"]
+
+            # Clear the current duplicate slot (but don't delete it)
+            all_slots[i] = None
+        else:
+            seen[item] = i  # Mark this as the "main" stack for this item
+
+    # Reassign back to original lists (since we merged them earlier)
+    for i in range(len(inventory_slots)):
+        inventory_slots[i] = all_slots[i]
+
+    for i in range(len(hotbar_slots)):
+        hotbar_slots[i] = all_slots[i + len(inventory_slots)]
@@ -0,0 +1,52 @@
+import pygame
+
+from glow_cache import GlowCache, render_light
+
+LIGHTMAP_SCALE = 4  # Lightmap pixels are 4x4 screen pixels
+
+# Light sprites live at lightmap resolution, so radii are rounded much finer than screen glows
+light_cache = GlowCache(render=render_light, radius_step=2)
+
+
+class Lightmap:
+    """Persistent low-resolution light buffer composited over the world once per frame.
+
+    Each frame starts filled with the ambient light level (white at noon, dark at
+    night). Light sources are added onto it, then it is scaled up and multiplied
+    over the screen, so lights cut through the darkness instead of being painted
+    on top of it. Nothing is allocated per frame and every light is one small blit.
+    """
+
+    def __init__(self, screen_width, screen_height, scale=LIGHTMAP_SCALE):
+        self.scale = scale
+        self.screen_size = (screen_width, screen_height)
+        small_size = (-(-screen_width // scale), -(-screen_height // scale))
+        self.surface = pygame.Surface(small_size)
+        self.upscaled = pygame.Surface(self.screen_size)
+        self.ambient = 255
+        self.lights = 0  # Lights added this frame
+
+    def begin(self, darkness):
+        """Reset the lightmap for a new frame. darkness 0 = full daylight, 255 = black."""
+        self.ambient = 255 - darkness
+        self.lights = 0
+        if self.ambient < 255:
+            self.surface.fill((self.ambient, self.ambient, self.ambient))
+
+    def add_light(self, x, y, radius, strength):
+        """Add a light centered at screen (x, y). strength works like a glow alpha (0-255)."""
+        if self.ambient >= 255:
+            return  # Daylight already lights everything
+        sprite = light_cache.get(radius / self.scale, strength)
+        if sprite is None:
+            return
+        half = sprite.get_width() // 2
+        self.surface.blit(sprite, (x // self.scale - half, y // self.scale - half), special_flags=pygame.BLEND_RGB_ADD)
+        self.lights += 1
+
+    def composite(self, screen):
+        """Scale the lightmap up and multiply it over the screen."""
+        if self.ambient >= 255:
+            return
+        pygame.transform.smoothscale(self.surface, self.screen_size, self.upscaled)
+        screen.blit(self.upscaled, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
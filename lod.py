@@ -0,0 +1,54 @@
+import numpy as np
+
+# Update tiers by distance from the player (px)
+NEAR = 0  # Updated every tick (covers the whole view plus a margin)
+MID = 1   # Updated every MID_EVERY ticks
+FAR = 2   # Updated every FAR_EVERY ticks, integrating all the time that passed in one coarse step
+
+NEAR_RADIUS = 1200
+MID_RADIUS = 3000
+MID_EVERY = 4
+FAR_EVERY = 30
+
+
+class LODScheduler:
+    """Decides which entities get simulated on a tick, based on their distance to the player.
+
+    Works on arrays so the herd (and anything else stored the same way) can ask
+    for a whole population at once. Each entity keeps the tick it was last
+    updated; when it is due it gets the time elapsed since then, so skipped
+    ticks are caught up instead of lost. Entities moving into a closer tier are
+    due right away. Within a tier, updates are spread over the ticks by slot
+    number so the work per tick stays flat.
+    """
+
+    def __init__(self, near_radius=NEAR_RADIUS, mid_radius=MID_RADIUS, mid_every=MID_EVERY, far_every=FAR_EVERY):
+        self.near_radius = near_radius
+        self.mid_radius = mid_radius
+        self.every = np.array([1, mid_every, far_every])
+        self.tier_counts = [0, 0, 0]  # Entities per tier at the last schedule() call
+        self.updated_last_tick = 0
+
+    def tiers(self, xs, ys, focus):
+        dist_sq = (xs - focus[0]) ** 2 + (ys - focus[1]) ** 2
+        tiers = np.full(len(xs), FAR, dtype=np.int8)
+        tiers[dist_sq < self.mid_radius ** 2] = MID
+        tiers[dist_sq < self.near_radius ** 2] = NEAR
+        return tiers
+
+    def schedule(self, slots, xs, ys, last_ticks, tick, focus):
+        """Pick the slots due on this tick.
+
+        Returns (due_slots, elapsed_ticks). An entity is due when its tier's turn
+        comes up for its slot, or when it hasn't been updated for longer than its
+        tier's interval (it just moved closer).
+        """
+        tiers = self.tiers(xs, ys, focus)
+        every = self.every[tiers]
+        elapsed = tick - last_ticks
+        due = ((tick + slots) % every == 0) | (elapsed >= every)
+        due &= elapsed > 0
+
+        self.tier_counts = np.bincount(tiers, minlength=3).tolist()
+        self.updated_last_tick = int(due.sum())
+        return slots[due], elapsed[due]
@@ -1,6 +1,18 @@
+import numpy as np
 import pygame
 
+import world_events
+from tile_grid import FREE, WATER, ROCK, CAMP, CAMPFIRE
+
 class MiniMap:
+    """Minimap in two layers.
+
+    The static layer (sand, lakes, rocks, camps) is painted straight from the
+    TileGrid array, one pixel per tile, and only the tiles under world changes
+    (rock mined, chunk streamed in, ...) are repainted.
+    Every frame it is blitted and just the cows and the player are drawn on top.
+    """
+
     def __init__(self, map_width, map_height, screen_width, screen_height):
         self.map_width = map_width
         self.map_height = map_height
@@ -16,51 +28,98 @@ class MiniMap:
 
         self.border_color = (80, 60, 40)
         self.bg_color = (20, 20, 20, 180)
-        self.camp_color = (255, 220, 100)
-        self.player_color = (255, 80, 80)
-        self.rock_color = (130, 130, 130)
-        self.water_color = (50, 140, 255)
-        self.cow_color = (200, 255, 200)
+        self.camp_color = (255, 230, 100)
+        self.player_color = (255, 0, 0)
+        self.rock_color = (100, 100, 100)
+        self.water_color = (50, 120, 255)
+        self.cow_color = (0, 255, 0)
+
+        # Tile kind -> minimap color
+        self.palette = np.zeros((256, 3), dtype=np.uint8)
+        self.palette[FREE] = (30, 30, 30)  # Dark background
+        self.palette[WATER] = self.water_color
+        self.palette[ROCK] = self.rock_color
+        self.palette[CAMP] = self.camp_color
+        self.palette[CAMPFIRE] = (30, 30, 30)
+
+        self.tile_layer = None    # One pixel per tile, rebuilt on world changes
+        self.static_layer = None  # tile_layer scaled to the current minimap size
+        self.grid_size = 64
+        self.dirty_rects = []     # World pixel rects changed since the last draw
+        self.rebuilds = 0
+
+        # Cow dot, blitted once per cow in a single fblits call
+        self.cow_dot = pygame.Surface((5, 5), pygame.SRCALPHA)
+        pygame.draw.circle(self.cow_dot, self.cow_color, (2, 2), 2)
+
+        self.subscriptions = world_events.subscribe_all([
+            ("rock_mined", lambda rock: self.mark_dirty(rock.rect)),
+            ("water_harvested", lambda tile: self.mark_dirty(tile.rect)),
+            ("campfire_placed", lambda fire: self.mark_dirty(fire.rect)),
+            ("campfire_burnt_out", lambda fire: self.mark_dirty(fire.rect)),
+            ("chunk_loaded", lambda chunk: self.mark_dirty(chunk.area)),
+            ("chunk_unloaded", lambda chunk: self.mark_dirty(chunk.area)),
+        ])
+
+    def close(self):
+        world_events.unsubscribe_all(self.subscriptions)
+
+    def mark_dirty(self, rect):
+        self.dirty_rects.append(rect)
 
     def toggle_fullscreen(self):
         self.fullscreen = not self.fullscreen
         new_size = self.large_size if self.fullscreen else self.small_size
         self.surface = pygame.Surface(new_size, pygame.SRCALPHA)
         self.width, self.height = new_size  # Update width and height when toggling fullscreen
+        self.scale_static_layer()  # Same world, just a different size
+
+    def rebuild_static_layer(self, tile_grid):
+        rgb = self.palette[tile_grid.tiles]  # (tiles_x, tiles_y, 3), same axis order as surfarray
+        self.tile_layer = pygame.surfarray.make_surface(rgb)
+        self.grid_size = tile_grid.grid_size
+        self.scale_static_layer()
+        self.dirty_rects.clear()
+        self.rebuilds += 1
+
+    def update_static_layer(self, tile_grid):
+        """Repaint only the tiles under the changed rects, then rescale."""
+        pixels = pygame.surfarray.pixels3d(self.tile_layer)
+        for rect in self.dirty_rects:
+            tx0, ty0, tx1, ty1 = tile_grid.tile_span(rect)
+            pixels[tx0:tx1, ty0:ty1] = self.palette[tile_grid.tiles[tx0:tx1, ty0:ty1]]
+        del pixels  # Unlock the surface
+        self.dirty_rects.clear()
+        self.scale_static_layer()
+
+    def scale_static_layer(self):
+        if self.tile_layer is None:
+            return
+        # The grid rounds the map up to whole tiles, so the scaled layer overhangs the
+        # minimap a little and gets clipped when blitted
+        tiles_x, tiles_y = self.tile_layer.get_size()
+        size = (round(tiles_x * self.grid_size / self.map_width * self.width),
+                round(tiles_y * self.grid_size / self.map_height * self.height))
+        self.static_layer = pygame.transform.scale(self.tile_layer, size)
+
+    def draw(self, screen, player_x, player_y, tile_grid, herd):
+        if self.tile_layer is None or self.tile_layer.get_size() != tile_grid.tiles.shape:
+            self.rebuild_static_layer(tile_grid)
+        elif self.dirty_rects:
+            self.update_static_layer(tile_grid)
+        self.surface.blit(self.static_layer, (0, 0))
 
-    def draw(self, screen, player_x, player_y, camps, rocks, water_tiles, cows):
-        # Clear minimap
-        self.surface.fill((30, 30, 30))  # Dark background
-
-        # Draw camps as yellow squares
-        for camp in camps:
-            cx = int((camp.x / self.map_width) * self.width)
-            cy = int((camp.y / self.map_height) * self.height)
-            pygame.draw.rect(self.surface, (255, 230, 100), (cx, cy, 4, 4))  # Yellow for camps
-
-        # Draw water as blue squares
-        for lake in water_tiles:
-            for tile in lake:
-                lx = int((tile.x / self.map_width) * self.width)
-                ly = int((tile.y / self.map_height) * self.height)
-                pygame.draw.rect(self.surface, (50, 120, 255), (lx, ly, 2, 2))  # Blue for lakes
-
-        # Draw rocks as gray squares
-        for rock in rocks:
-            rx = int((rock.x / self.map_width) * self.width)
-            ry = int((rock.y / self.map_height) * self.height)
-            pygame.draw.rect(self.surface, (100, 100, 100), (rx, ry, 2, 2))  # Gray for rocks
-
-        # Draw cows as green dots
-        for cow in cows:
-            cow_x = int((cow.x / self.map_width) * self.width)
-            cow_y = int((cow.y / self.map_height) * self.height)
-            pygame.draw.circle(self.surface, (0, 255, 0), (cow_x, cow_y), 2)  # Green for cows
+        # Draw cows as green dots (positions straight from the herd arrays)
+        xs, ys = herd.positions()
+        if len(xs):
+            cow_xs = ((xs / self.map_width) * self.width).astype(np.int32) - 2
+            cow_ys = ((ys / self.map_height) * self.height).astype(np.int32) - 2
+            self.surface.fblits(zip([self.cow_dot] * len(xs), zip(cow_xs.tolist(), cow_ys.tolist())))
 
         # Draw player as a red dot
         mini_x = int((player_x / self.map_width) * self.width)
         mini_y = int((player_y / self.map_height) * self.height)
-        pygame.draw.circle(self.surface, (255, 0, 0), (mini_x, mini_y), 5)
+        pygame.draw.circle(self.surface, self.player_color, (mini_x, mini_y), 5)
 
         # Blit to screen
         screen.blit(self.surface, (self.screen_width - self.width - 20, 20))  # Adjusted position
@@ -1,85 +1,179 @@
 import pygame
 import random
 
-class Particle:
-    def __init__(self, x, y, size, lifetime, color, spread_x):
-        self.x = x + random.uniform(-spread_x, spread_x)  # Spread out on X-axis
-        self.y = y
-        self.size = size
-        self.lifetime = lifetime  # How long the particle lasts
-        self.color = color
-        self.velocity_x = random.uniform(-0.3, 0.3)  # Slight side movement
-        self.velocity_y = random.uniform(0.5, 1.2)  # Moves downward slightly
-
-    def update(self):
-        """Update particle movement and reduce lifetime."""
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        self.lifetime -= 1  # Slowly disappears
+import numpy as np
 
-    def draw(self, screen, camera_x, camera_y):
-        """Draw the particle relative to the camera position."""
-        if self.lifetime > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x - camera_x), int(self.y - camera_y)), self.size)
+# Particle styles (each one gets a table of prebaked sprites)
+SAND = 0
+FOOTPRINT = 1
+STYLES = {
+    SAND: ("circle", (210, 180, 140)),     # Sand color
+    FOOTPRINT: ("square", (100, 80, 60)),  # Brownish footprint
+}
 
+MAX_SIZE = 12      # Largest radius / side a particle can have
+ALPHA_LEVELS = 16  # Fading particles pick the nearest of these prebaked alphas
+FRAME_RATE = 60    # Velocities, lifetimes and fades are per frame at 60 FPS; update() scales them by dt
 
-class Footprint:
-    def __init__(self, x, y, size, lifetime):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.lifetime = lifetime  # How long the footprint lasts
-        self.alpha = 255  # Opacity (fades out over time)
+# Spawn randomness has its own generator so nothing drawn elsewhere (e.g. per render
+# frame) shifts it; simulation.seed_rngs seeds it for recordings and replays
+rng = random.Random()
 
-    def update(self):
-        """Slowly fade out and disappear."""
-        self.lifetime -= 1
-        self.alpha = max(0, self.alpha - 3)  # Gradually fade
 
-    def draw(self, screen, camera_x, camera_y):
-        """Draw footprints with fading effect."""
-        if self.lifetime > 0:
-            footprint_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            footprint_surface.fill((100, 80, 60, self.alpha))  # Brownish color with alpha
-            screen.blit(footprint_surface, (self.x - camera_x, self.y - camera_y))
+def bake_sprite(shape, color, size, alpha):
+    if shape == "circle":
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color + (alpha,), (size, size), size)
+    else:
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        surface.fill(color + (alpha,))
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()  # Display format blits ~1.5x faster
+    return surface
 
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []  # List of active particles
-        self.footprints = []  # List of footprints
+    """Fixed-capacity particle pool stored as NumPy arrays (one array per field).
+
+    Spawning takes a slot from a free-slot stack and expiry pushes it back, so
+    nothing is allocated per particle. Movement, fading and expiry run as array
+    operations, and drawing is one batched blit call over prebaked sprites.
+    """
+
+    def __init__(self, capacity=32768, decals=None):
+        self.capacity = capacity
+        self.decals = decals  # DecalLayer footprints are stamped into, if any
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)     # Frames left
+        self.alpha = np.zeros(capacity, dtype=np.float32)
+        self.fade = np.zeros(capacity, dtype=np.float32)     # Alpha lost per frame
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.style = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Free-slot stack: free_slots[:free_count] are unused indices
+        self.free_slots = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self.free_count = capacity
+        self.dropped = 0  # Spawns refused because the pool was full
+
+        # Sprite table indexed by (style, size, alpha level), plus the blit offset of each
+        self.sprites = np.empty(len(STYLES) * (MAX_SIZE + 1) * ALPHA_LEVELS, dtype=object)
+        self.offsets = np.zeros(len(self.sprites), dtype=np.int32)
+        for style, (shape, color) in STYLES.items():
+            for size in range(MAX_SIZE + 1):
+                for level in range(ALPHA_LEVELS):
+                    i = self.sprite_index(style, size, level)
+                    alpha = round(255 * (level + 1) / ALPHA_LEVELS)
+                    self.sprites[i] = bake_sprite(shape, color, max(size, 1), alpha)
+                    self.offsets[i] = -size if shape == "circle" else 0  # Circles are centered
+
+    @staticmethod
+    def sprite_index(style, size, level):
+        return (style * (MAX_SIZE + 1) + size) * ALPHA_LEVELS + level
+
+    def __len__(self):
+        return self.capacity - self.free_count
+
+    # --- Spawning ---
+    def spawn(self, x, y, vx, vy, life, size, style, alpha=255, fade=0):
+        """Spawn one particle. Returns False if the pool is full."""
+        if self.free_count == 0:
+            self.dropped += 1
+            return False
+        self.free_count -= 1
+        i = self.free_slots[self.free_count]
+        self.x[i], self.y[i] = x, y
+        self.vx[i], self.vy[i] = vx, vy
+        self.life[i] = life
+        self.alpha[i], self.fade[i] = alpha, fade
+        self.size[i] = min(size, MAX_SIZE)
+        self.style[i] = style
+        self.alive[i] = True
+        return True
+
+    def spawn_many(self, x, y, vx, vy, life, size, style, alpha=255, fade=0):
+        """Spawn a burst from arrays (scalars are broadcast). Returns how many fit."""
+        requested = np.size(x)
+        n = min(requested, self.free_count)
+        self.dropped += requested - n
+        if n == 0:
+            return 0
+        idx = self.free_slots[self.free_count - n:self.free_count]
+        self.free_count -= n
+
+        def take(values):
+            return np.broadcast_to(values, (requested,))[:n]
+
+        self.x[idx], self.y[idx] = take(x), take(y)
+        self.vx[idx], self.vy[idx] = take(vx), take(vy)
+        self.life[idx] = take(life)
+        self.alpha[idx], self.fade[idx] = take(alpha), take(fade)
+        self.size[idx] = np.minimum(take(size), MAX_SIZE)
+        self.style[idx] = take(style)
+        self.alive[idx] = True
+        return n
 
     def add_particle(self, x, y, speed):
         """Create a new sand particle behind the player."""
-        if random.random() < 0.3:  # Lower chance of spawning (30% chance per frame)
-            size = random.randint(2, 3)  # Small particle size
-            lifetime = random.randint(10, 18)  # How long it lasts
-            color = (210, 180, 140)  # Sand color
+        if rng.random() < 0.3:  # Lower chance of spawning (30% chance per frame)
+            size = rng.randint(2, 3)  # Small particle size
+            lifetime = rng.randint(10, 18)  # How long it lasts
             spread_x = 5  # Spread out left & right
-
-            self.particles.append(Particle(x, y, size, lifetime, color, spread_x))
+            self.spawn(
+                x + rng.uniform(-spread_x, spread_x), y,
+                rng.uniform(-0.3, 0.3),  # Slight side movement
+                rng.uniform(0.5, 1.2),   # Moves downward slightly
+                lifetime, size, SAND,
+            )
 
     def add_footprint(self, x, y):
         """Add a footprint at the player's position with lower chance."""
-        if random.random() < 0.3:  # 30% chance per step (previously 60%)
-            size = random.randint(6, 9)  # Footprint size
+        if rng.random() < 0.3:  # 30% chance per step (previously 60%)
+            size = rng.randint(6, 9)  # Footprint size
             lifetime = 60  # Lasts about 2 seconds (60 frames at 30 FPS)
-            self.footprints.append(Footprint(x, y, size, lifetime))
-
-    def update(self):
-        """Update all particles and footprints."""
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for particle in self.particles:
-            particle.update()
-
-        self.footprints = [f for f in self.footprints if f.lifetime > 0]
-        for footprint in self.footprints:
-            footprint.update()
-
+            if self.decals is not None:
+                self.decals.add_footprint(x, y, size)  # Stamped once, fades with the decal layer
+            else:
+                self.spawn(x, y, 0, 0, lifetime, size, FOOTPRINT, fade=3)  # Gradually fade
+
+    # --- Simulation ---
+    def update(self, dt=1 / FRAME_RATE):
+        """Move, fade and age every live particle by dt seconds, then recycle the expired ones."""
+        idx = np.flatnonzero(self.alive)
+        if len(idx) == 0:
+            return
+        frames = dt * FRAME_RATE
+        self.x[idx] += self.vx[idx] * frames
+        self.y[idx] += self.vy[idx] * frames
+        self.alpha[idx] = np.maximum(self.alpha[idx] - self.fade[idx] * frames, 0)
+        self.life[idx] -= frames
+
+        expired = idx[self.life[idx] <= 0]
+        if len(expired):
+            self.alive[expired] = False
+            self.free_slots[self.free_count:self.free_count + len(expired)] = expired
+            self.free_count += len(expired)
+
+    # --- Drawing ---
     def draw(self, screen, camera_x, camera_y):
-        """Draw footprints first (so particles appear above them)."""
-        for footprint in self.footprints:
-            footprint.draw(screen, camera_x, camera_y)
-
-        for particle in self.particles:
-            particle.draw(screen, camera_x, camera_y)
+        """Blit every visible particle in one call (footprints first so particles appear above them)."""
+        sx = self.x - camera_x
+        sy = self.y - camera_y
+        visible = self.alive & (self.alpha > 0) \
+            & (sx > -MAX_SIZE * 2) & (sx < screen.get_width() + MAX_SIZE) \
+            & (sy > -MAX_SIZE * 2) & (sy < screen.get_height() + MAX_SIZE)
+        idx = np.flatnonzero(visible)
+        if len(idx) == 0:
+            return 0
+        idx = idx[np.argsort(self.style[idx] != FOOTPRINT, kind="stable")]
+
+        levels = np.clip((self.alpha[idx] * ALPHA_LEVELS / 255).astype(np.int32) - 1, 0, ALPHA_LEVELS - 1)
+        sprite_ids = (self.style[idx] * (MAX_SIZE + 1) + self.size[idx]) * ALPHA_LEVELS + levels
+        xs = (sx[idx].astype(np.int32) + self.offsets[sprite_ids]).tolist()
+        ys = (sy[idx].astype(np.int32) + self.offsets[sprite_ids]).tolist()
+        # fblits (pygame-ce) is the lean variant of blits: no rects returned, no per-item flags
+        screen.fblits(zip(self.sprites[sprite_ids].tolist(), zip(xs, ys)))
+        return len(idx)
@@ -1,5 +1,12 @@
 import pygame
 
+from assets import assets
+from render_queue import ACTORS, DEBUG
+from tile_grid import WATER
+
+CROUCH_SQUASH = 0.75  # Sprite height while crouching
+FRAME_RATE = 60  # Speeds below are per frame at 60 FPS; update() scales them by dt
+
 class Player:
     def __init__(self, x, y, scale=2.5):
         """Initialize the player with position, animations, scaling, and movement settings."""
@@ -17,6 +24,8 @@ class Player:
         self.scale = scale  # Scale factor for sprites
         self.is_crouching = False  # Track if crouching
         self.last_direction = "down"  # default
+        self.prev_x, self.prev_y = x, y  # Position at the previous tick, for interpolation
+        self.render_offset = (0, 0)  # Interpolated position minus the real one, see interpolate()
 
         # Load animations
         self.idle_sprites = self.load_sprite_sheet("character/idle.png", num_frames=5)
@@ -47,23 +56,26 @@ class Player:
         self.sprite_offset_y = -22  # Vertical offset for sprite alignment
         self.shadow_offset_y = -25  # Offset for shadow alignment
 
-    def load_sprite_sheet(self, path, num_frames):
-        """Load sprite sheet, extract vertically stacked frames, and scale them up."""
-        sheet = pygame.image.load(path).convert_alpha()
-        frame_width = sheet.get_width()
-        frame_height = sheet.get_height() // num_frames  # Divide height by frame count
+        # Every facing x crouch variant of every frame, so drawing is only lookups
+        assets.variants.prebuild(self.idle_sprites + self.run_sprites, height_scales=(1.0, CROUCH_SQUASH))
 
-        frames = []
-        for i in range(num_frames):
-            frame = sheet.subsurface((0, i * frame_height, frame_width, frame_height))
-            frame = pygame.transform.scale(frame, (int(frame_width * self.scale), int(frame_height * self.scale)))  # Scale up
-            frames.append(frame)
+        # Shadow never changes size, build it once
+        self.shadow = pygame.Surface((self.rect.width, 12), pygame.SRCALPHA)
+        pygame.draw.ellipse(self.shadow, (0, 0, 0, 80), self.shadow.get_rect())
 
-        return frames
+    def load_sprite_sheet(self, path, num_frames):
+        """Vertically stacked frames of a sprite sheet, scaled up (loaded once by the asset manager)."""
+        return assets.sheet_frames(path, num_frames, self.scale)
 
-    def update(self, keys, map_width, map_height, rocks, lakes):
-        """Update player movement, animations, and keep within boundaries."""
+    def update(self, keys, map_width, map_height, rock_index, tile_grid, dt=1 / FRAME_RATE):
+        """Advance the player by dt seconds: movement, animations, and map boundaries.
+
+        rock_index is a SpatialHash, so collision only checks the rocks in the cells
+        around the player; water is looked up directly in the TileGrid.
+        """
         previous_sprites = self.current_sprites  # Store previous animation state
+        self.prev_x, self.prev_y = self.x, self.y
+        frames = dt * FRAME_RATE
 
         # Reset velocity & animation speed
         self.velocity_x = 0
@@ -117,8 +129,8 @@ class Player:
 
         # Apply movement
         old_x, old_y = self.x, self.y
-        self.x += self.velocity_x
-        self.y += self.velocity_y
+        self.x += self.velocity_x * frames
+        self.y += self.velocity_y * frames
 
         # Keep player inside map boundaries
         self.x = max(0, min(self.x, map_width - self.rect.width))
@@ -127,65 +139,78 @@ class Player:
         # Update collision rect position
         self.rect.topleft = (self.x + self.hitbox_offset[0], self.y + self.hitbox_offset[1])
 
-        # Check collisions with rocks
-        for rock in rocks:
-            if not rock.mined and rock.blocks_movement(self.rect):
-                self.x, self.y = old_x, old_y
-                self.rect.topleft = (self.x + self.hitbox_offset[0], self.y + self.hitbox_offset[1])
-                break
-
-        # Check collisions with lakes
-        for lake in lakes:
-            for tile in lake:
-                if self.rect.colliderect(tile.rect):
-                    self.x, self.y = old_x, old_y
-                    self.rect.topleft = (self.x + self.hitbox_offset[0], self.y + self.hitbox_offset[1])
-                    break
+        # Check collisions with nearby rocks and lake tiles
+        blocked = any(
+            not rock.mined and rock.blocks_movement(self.rect)
+            for rock in rock_index.query_rect(self.rect)
+        ) or tile_grid.rect_has(self.rect, WATER)
+        if blocked:
+            self.x, self.y = old_x, old_y
+            self.rect.topleft = (self.x + self.hitbox_offset[0], self.y + self.hitbox_offset[1])
 
         # Update animation frame
-        self.update_animation()
+        self.update_animation(frames)
 
-    def update_animation(self):
+    def update_animation(self, frames=1):
         """Update the player's animation frame safely."""
-        self.timer += self.animation_speed
+        self.timer += self.animation_speed * frames
         if self.timer >= 1:
             self.timer = 0
             self.frame_index = (self.frame_index + 1) % len(self.current_sprites)
 
-    def draw(self, screen, camera_x, camera_y, debug=False):
-        """Draw the player at the correct position relative to the camera."""
-        sprite = self.current_sprites[int(self.frame_index)]  # Get current frame safely
+    def interpolate(self, alpha):
+        """Draw the player alpha (0..1) of the way from the previous tick to the current one.
+
+        Returns the interpolated position; collisions keep using the real one.
+        """
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        self.render_offset = (x - self.x, y - self.y)
+        return x, y
 
-        # Flip sprite when facing left
-        if self.direction == "left":
-            sprite = pygame.transform.flip(sprite, True, False)
+    def sprite_blits(self, camera_x, camera_y):
+        """(surface, dest) pairs for the shadow and the current frame, relative to the camera."""
+        camera_x -= self.render_offset[0]
+        camera_y -= self.render_offset[1]
+        sprite = self.current_sprites[int(self.frame_index)]  # Get current frame safely
 
-        # Apply squash effect when crouching
+        # Flipped when facing left, squashed when crouching (both precomputed)
         crouch_offset_y = 0  # Track how much to move down when crouching
+        height_scale = 1.0
         if self.is_crouching:
-            sprite = pygame.transform.scale(sprite, (sprite.get_width(), int(sprite.get_height() * 0.75)))  # Shorter sprite
+            height_scale = CROUCH_SQUASH  # Shorter sprite
             crouch_offset_y = 10  # Move player down slightly
+        sprite = assets.variant(sprite, self.direction == "left", height_scale)
 
         # Calculate offsets
         offset_x = self.sprite_offset_x
         offset_y = self.sprite_offset_y + crouch_offset_y
 
-        # Draw shadow
-        shadow_width = self.rect.width
-        shadow_height = 12
+        # Shadow under the feet
+        shadow_width = self.shadow.get_width()
         shadow_x = self.rect.x - camera_x + offset_x + sprite.get_width() // 1.9 - shadow_width // 1.9
         shadow_y = self.rect.y - camera_y + offset_y + sprite.get_height() + self.shadow_offset_y
 
-        shadow = pygame.Surface((shadow_width, shadow_height), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow, (0, 0, 0, 80), shadow.get_rect())
-        screen.blit(shadow, (shadow_x, shadow_y))
+        return [
+            (self.shadow, (shadow_x, shadow_y)),
+            (sprite, (self.rect.x - camera_x + offset_x, self.rect.y - camera_y + offset_y)),
+        ]
+
+    def draw_debug(self, screen, camera_x, camera_y):
+        """Draw the collision rect."""
+        pygame.draw.rect(screen, (255, 0, 0), (self.rect.x - camera_x, self.rect.y - camera_y, self.rect.width, self.rect.height), 2)
 
-        # Draw sprite
-        screen.blit(sprite, (self.rect.x - camera_x + offset_x, self.rect.y - camera_y + offset_y))
+    def draw(self, screen, camera_x, camera_y, debug=False):
+        """Draw the player at the correct position relative to the camera."""
+        screen.blits(self.sprite_blits(camera_x, camera_y), doreturn=False)
+        if debug:
+            self.draw_debug(screen, camera_x, camera_y)
 
-        # Debug: Draw collision rect
+    def submit(self, queue, camera_x, camera_y, debug=False):
+        """Queue the player on the actor layer (and the hitbox on the debug layer)."""
+        queue.extend(ACTORS, self.sprite_blits(camera_x, camera_y))
         if debug:
-            pygame.draw.rect(screen, (255, 0, 0), (self.rect.x - camera_x, self.rect.y - camera_y, self.rect.width, self.rect.height), 2)
+            queue.call(DEBUG, lambda screen: self.draw_debug(screen, camera_x, camera_y))
 
     def get_current_frame(self):
         """Returns the current animation frame safely."""
@@ -0,0 +1,52 @@
+# Layers, drawn bottom to top
+TERRAIN = 0    # Baked chunk surfaces
+DECALS = 5     # Footprints and other marks on the ground
+GROUND = 10    # Dropped items, camp chests
+ACTORS = 20    # Cows, player
+DEBUG = 30     # Hitboxes and other debug shapes
+LIGHTING = 40  # Night darkness and firelight, multiplied over everything below
+
+
+class RenderQueue:
+    """Collects (surface, dest) pairs per layer and flushes them bottom to top.
+
+    Consecutive pairs in a layer go out in a single Surface.blits call. Drawing
+    that isn't a plain blit (shapes, the lightmap composite) is queued as a call
+    and runs in order between the batches of its layer.
+    """
+
+    def __init__(self):
+        self.layers = {}  # layer -> list of batches (list of pairs) and callables
+        self.blits_last_flush = 0
+        self.batches_last_flush = 0
+
+    def push(self, layer, surface, dest):
+        batches = self.layers.setdefault(layer, [])
+        if not batches or callable(batches[-1]):
+            batches.append([])
+        batches[-1].append((surface, dest))
+
+    def extend(self, layer, pairs):
+        batches = self.layers.setdefault(layer, [])
+        if not batches or callable(batches[-1]):
+            batches.append([])
+        batches[-1].extend(pairs)
+
+    def call(self, layer, fn):
+        """Queue fn(screen) to run at this point of the layer."""
+        self.layers.setdefault(layer, []).append(fn)
+
+    def flush(self, screen):
+        blits = batches_sent = 0
+        for layer in sorted(self.layers):
+            for batch in self.layers[layer]:
+                if callable(batch):
+                    batch(screen)
+                elif batch:
+                    screen.blits(batch, doreturn=False)
+                    blits += len(batch)
+                    batches_sent += 1
+        self.layers.clear()
+        self.blits_last_flush = blits
+        self.batches_last_flush = batches_sent
+        return blits
@@ -0,0 +1,167 @@
+"""Record a play session's input and replay it headless, bit for bit.
+
+Recording (from the game):
+
+    python main.py --record session.nrec
+
+Replaying at full speed, e.g. as a repeatable benchmark:
+
+    python replay.py session.nrec
+
+A recording holds the starting game state, the seed for the simulation's random
+generators (see simulation.seed_rngs) and, for every simulation tick, the held
+keys and the key presses handled before it. The world is rebuilt from the same state and seeds, so the replay
+takes exactly the same path; a checksum of the final state confirms it.
+"""
+import argparse
+import hashlib
+import json
+import struct
+import sys
+import zlib
+
+import numpy as np
+import pygame
+
+from headless import HeadlessGame, KeyState
+from save_load import deltas_to_data, state_from_data, state_to_data
+from scheduler import scheduler
+
+MAGIC = b"NMRC"
+VERSION = 1
+HEADER = struct.Struct("<4sBIHI")  # magic, version, rng seed, tick rate, state JSON length
+TICK = struct.Struct("<IB")        # held key bitmask, number of key presses
+TRAILER = struct.Struct("<I32s")   # tick count, sha256 of the final state
+
+# Every key the game reads; held keys are stored as one bit each, presses as an index
+TRACKED_KEYS = [
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+    pygame.K_LSHIFT, pygame.K_LCTRL, pygame.K_f, pygame.K_r,
+    pygame.K_e, pygame.K_c, pygame.K_m, pygame.K_h, pygame.K_j, pygame.K_o, pygame.K_ESCAPE,
+    pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8,
+]
+KEY_INDEX = {key: i for i, key in enumerate(TRACKED_KEYS)}
+QUIT_CODE = 255
+SKIPPED_ON_REPLAY = {pygame.K_o}  # Saving would overwrite the real save file
+
+
+def state_checksum(simulation):
+    """sha256 over everything the simulation owns, to compare a replay with the recording."""
+    h = hashlib.sha256()
+    player, survival, herd = simulation.player, simulation.survival, simulation.world.herd
+    h.update(struct.pack("<5d", player.x, player.y, survival.hunger, survival.thirst, scheduler.now))
+    alive = herd.alive
+    for array in (herd.x, herd.y, herd.health, herd.iframes):
+        h.update(array[alive].tobytes())
+    particles = simulation.particle_system
+    for array in (particles.x, particles.y, particles.life):
+        h.update(array[particles.alive].tobytes())
+    fires = [(fire.x, fire.y, fire.placed_at, fire.burning) for fire in simulation.world.campfires]
+    h.update(json.dumps(fires).encode())
+    h.update(json.dumps([simulation.inventory_slots, simulation.hotbar_slots], sort_keys=True).encode())
+    h.update(json.dumps(deltas_to_data(simulation.world.deltas), sort_keys=True).encode())
+    return h.digest()
+
+
+class InputRecorder:
+    """Writes per-tick input to a compressed log as the game runs."""
+
+    def __init__(self, path, game_state, rng_seed, tick_rate):
+        state_json = json.dumps(state_to_data(game_state)).encode()
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, rng_seed, tick_rate, len(state_json)))
+        self.file.write(state_json)
+        self.body = zlib.compressobj(9)
+        self.pending = []  # Key press codes handled since the last tick
+        self.ticks = 0
+
+    def add_event(self, event):
+        """Remember an input event handled this frame; it belongs to the next tick."""
+        if event.type == pygame.QUIT:
+            self.pending.append(QUIT_CODE)
+        elif event.type == pygame.KEYDOWN and event.key in KEY_INDEX:
+            self.pending.append(KEY_INDEX[event.key])
+
+    def record_tick(self, keys):
+        mask = 0
+        for i, key in enumerate(TRACKED_KEYS):
+            if keys[key]:
+                mask |= 1 << i
+        record = TICK.pack(mask, len(self.pending)) + bytes(self.pending)
+        self.file.write(self.body.compress(record))
+        self.pending.clear()
+        self.ticks += 1
+
+    def close(self, simulation):
+        """Finish the log with the tick count and a checksum of the final state."""
+        self.file.write(self.body.flush())
+        self.file.write(TRAILER.pack(self.ticks, state_checksum(simulation)))
+        self.file.close()
+
+
+class RecordedInput:
+    """Input source replaying a log; same at(tick) interface as headless.ScriptedInput."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.rng_seed, self.tick_rate, state_len = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input recording")
+        offset = HEADER.size
+        self.game_state = state_from_data(json.loads(data[offset:offset + state_len]))
+        self.ticks, self.checksum = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+        body = zlib.decompress(data[offset + state_len:len(data) - TRAILER.size])
+
+        # Decode every tick up front so replaying costs nothing per tick
+        self.masks = np.zeros(self.ticks, dtype=np.uint32)
+        self.presses = {}  # tick -> [key codes], only for ticks that have any
+        pos = 0
+        for tick in range(self.ticks):
+            self.masks[tick], count = TICK.unpack_from(body, pos)
+            pos += TICK.size
+            if count:
+                self.presses[tick] = list(body[pos:pos + count])
+                pos += count
+        self.key_states = {}
+
+    def at(self, tick):
+        if tick >= self.ticks:
+            return KeyState(), [pygame.event.Event(pygame.QUIT)]
+        mask = int(self.masks[tick])
+        keys = self.key_states.get(mask)
+        if keys is None:
+            keys = self.key_states[mask] = KeyState(key for i, key in enumerate(TRACKED_KEYS) if mask >> i & 1)
+        events = []
+        for code in self.presses.get(tick, ()):
+            if code == QUIT_CODE:
+                events.append(pygame.event.Event(pygame.QUIT))
+            elif TRACKED_KEYS[code] not in SKIPPED_ON_REPLAY:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=TRACKED_KEYS[code]))
+        return keys, events
+
+
+def replay(path):
+    """Replay a recording headless at full speed. Returns (ticks, seconds, matched)."""
+    recording = RecordedInput(path)
+    game = HeadlessGame(game_state=recording.game_state, rng_seed=recording.rng_seed)
+    ticks, elapsed = game.run(recording, recording.ticks, recording.tick_rate)
+    matched = state_checksum(game.simulation) == recording.checksum
+    game.close()
+    return ticks, elapsed, matched
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="replay.py", description="Replay a recorded session headless and check it ends in the same state.")
+    parser.add_argument("recording", help="file written by python main.py --record")
+    args = parser.parse_args(argv[1:])
+
+    ticks, elapsed, matched = replay(args.recording)
+    print(f"{ticks} ticks in {elapsed:.2f} s ({ticks / max(elapsed, 1e-9):,.0f} ticks/s)")
+    print("final state matches the recording" if matched else "final state DIFFERS from the recording")
+    return 0 if matched else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
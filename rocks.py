@@ -2,31 +2,46 @@ import pygame
 import random
 import os
 
+import world_events
+from scheduler import scheduler
+
+MINING_TIME = 2.0  # Seconds of holding the pickaxe on a rock
+
 class Rock:
     def __init__(self, x, y, image, **kwargs):
         self.x = x
         self.y = y
         self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.mining_timer = 0
+        self.mining_timer = None  # Pending scheduler Timer while being mined
         self.mined = kwargs.get("mined", False)
+        self.uid = kwargs.get("uid")  # Chunk-local id, set by world generation
 
 
     def draw(self, screen, camera_x, camera_y):
         if not self.mined:
             screen.blit(self.image, (self.x - camera_x, self.y - camera_y))
 
-    def update(self, dt, is_holding, player_rect, has_pickaxe):
+    def update(self, is_holding, player_rect, has_pickaxe):
+        """Start mining while the player holds a pickaxe on the rock, stop when they let go.
+
+        Nothing is counted per frame; the "rock_mined" timer finishes the job.
+        """
         if self.mined:
             return
 
         if self.rect.colliderect(player_rect) and is_holding and has_pickaxe:
-            self.mining_timer += dt
-            if self.mining_timer >= 2000:  # 2 seconds to mine
-                self.mined = True
-                print("Rock mined!")
-        else:
-            self.mining_timer = 0
+            if self.mining_timer is None:
+                self.mining_timer = scheduler.after(MINING_TIME, "rock_mined", self.x, self.y, saved=False)
+        elif self.mining_timer is not None:
+            self.mining_timer.cancel()
+            self.mining_timer = None
+
+    def mine(self):
+        self.mined = True
+        self.mining_timer = None
+        world_events.emit("rock_mined", self)
+        print("Rock mined!")
 
     def blocks_movement(self, player_rect):
         return self.rect.colliderect(player_rect)
@@ -1,73 +1,89 @@
 import json
 import os
-import random
-from rocks import Rock
-from cow import Cow
-from water_tile import WaterTile
-from camp import Camp
-from campfire import Campfire
+
+from scheduler import scheduler
 
 SAVE_FILE = "savegame.json"
+SAVE_VERSION = 3  # 2 = world seed + per-chunk deltas instead of full world dumps, 3 = + pending timers
 
-def save_game(player, inventory_slots, hotbar_slots, rocks, items, campfires, lakes, camps, cows, time_of_day, hunger, thirst):
+def save_game(player, inventory_slots, hotbar_slots, world, time_of_day, hunger, thirst):
     data = {
+        "version": SAVE_VERSION,
         "player": {
             "x": player.x,
             "y": player.y
         },
         "inventory_slots": inventory_slots,
         "hotbar_slots": hotbar_slots,
-        "rocks": [{"x": r.x, "y": r.y, "mined": r.mined} for r in rocks],
-        "items": items,
-        "campfires": [{"x": cf.x, "y": cf.y} for cf in campfires],
-        "lakes": [[{"x": tile.x, "y": tile.y} for tile in lake] for lake in lakes],
-        "camps": [{"x": camp.x, "y": camp.y} for camp in camps],
-        "cows": [{"x": cow.x, "y": cow.y} for cow in cows],
         "time_of_day": time_of_day,
         "hunger": hunger,
-        "thirst": thirst
+        "thirst": thirst,
+        # The world itself is regenerated from the seed; only player changes are stored
+        "seed": world.seed,
+        "changes": deltas_to_data(world.deltas),
+        "timers": scheduler.to_data(),  # Simulation clock and pending timers (fire burnouts...)
     }
 
-    with open("savegame.json", "w") as f:
+    with open(SAVE_FILE, "w") as f:
         json.dump(data, f, indent=4)
 
 
-def load_game(rock_images, cow_image):
+def load_game():
     if not os.path.exists(SAVE_FILE):
         return None
 
     with open(SAVE_FILE, "r") as f:
         data = json.load(f)
+    return state_from_data(data)
 
-    # Reconstruct rocks
-    rocks = [Rock(r["x"], r["y"], random.choice(rock_images), mined=r.get("mined", False)) for r in data.get("rocks", [])]
-
-    # Reconstruct cows
-    cows = [Cow(c["x"], c["y"], cow_image) for c in data.get("cows", [])]
-
-    # Reconstruct campfires
-    campfires = [Campfire(cf["x"], cf["y"]) for cf in data.get("campfires", [])]
-
-    # Reconstruct lakes (2D list of WaterTile objects)
-    lakes = []
-    for lake_data in data.get("lakes", []):
-        lake = [WaterTile(tile["x"], tile["y"]) for tile in lake_data]
-        lakes.append(lake)
-
-    # Reconstruct camps
-    camps = [Camp(c["x"], c["y"]) for c in data.get("camps", [])]
 
+def state_from_data(data):
+    """Game state dict (as initialize_game_state returns it) from saved JSON data."""
+    # Older saves dumped the whole (unseeded) world; those only keep the player state
+    # and start a fresh seeded world.
     return {
         "player": data["player"],
         "inventory_slots": data["inventory_slots"],
         "hotbar_slots": data["hotbar_slots"],
-        "rocks": rocks,
-        "items": data["items"],
-        "campfires": campfires,
-        "lakes": lakes,
-        "camps": camps,
-        "cows": cows,
         "time_of_day": data.get("time_of_day", 0),
         "hunger": data.get("hunger", 100),
-        "thirst": data.get("thirst", 100)
-    }
\ No newline at end of file
+        "thirst": data.get("thirst", 100),
+        "seed": data.get("seed"),
+        "changes": deltas_from_data(data.get("changes", {})),
+        "timers": data.get("timers", {}),
+    }
+
+
+def state_to_data(state):
+    """JSON-ready copy of a game state dict, the inverse of state_from_data."""
+    data = dict(state, version=SAVE_VERSION)
+    data["changes"] = deltas_to_data(state["changes"])
+    return data
+
+
+# --- Chunk deltas ---
+def deltas_to_data(deltas):
+    data = {}
+    for (cx, cy), delta in deltas.items():
+        data[f"{cx},{cy}"] = {
+            "mined_rocks": sorted(delta["mined_rocks"]),
+            "harvested_water": sorted(delta["harvested_water"]),
+            "picked_items": sorted(delta["picked_items"]),
+            "looted_camps": {str(uid): inventory for uid, inventory in delta["looted_camps"].items()},
+            "campfires": delta["campfires"],
+        }
+    return data
+
+
+def deltas_from_data(data):
+    deltas = {}
+    for key, delta in data.items():
+        cx, cy = (int(v) for v in key.split(","))
+        deltas[(cx, cy)] = {
+            "mined_rocks": set(delta.get("mined_rocks", [])),
+            "harvested_water": set(delta.get("harvested_water", [])),
+            "picked_items": set(delta.get("picked_items", [])),
+            "looted_camps": {int(uid): inventory for uid, inventory in delta.get("looted_camps", {}).items()},
+            "campfires": delta.get("campfires", []),
+        }
+    return deltas
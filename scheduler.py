@@ -0,0 +1,113 @@
+"""Timers keyed on simulation time, so nothing has to poll a clock every frame.
+
+Systems register a named handler once and then schedule calls to it by name:
+
+    scheduler.register("campfire_burnout", world.burn_out_campfire)
+    scheduler.after(90, "campfire_burnout", fire.x, fire.y)
+
+Handlers are referred to by name and their arguments are plain values, so
+every pending timer can be written into the save and restored on load.
+"""
+import heapq
+
+
+class Timer:
+    """A pending call. Keep it to cancel() it later."""
+
+    __slots__ = ("due", "name", "args", "every", "saved", "active")
+
+    def __init__(self, due, name, args, every, saved=True):
+        self.due = due
+        self.name = name
+        self.args = args
+        self.every = every  # Seconds between repeats, or None for one-shot
+        self.saved = saved  # False for timers tied to held input (mining, filling water)
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+
+class Scheduler:
+    """Min-heap of timers ordered by due time (simulation seconds).
+
+    advance(dt) moves simulation time forward and runs every timer that came
+    due, in order. Cancelled timers stay in the heap and are skipped when they
+    come up, so cancelling is O(1).
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.heap = []      # (due, seq, timer); seq keeps same-time timers in scheduling order
+        self.seq = 0
+        self.handlers = {}  # name -> callable
+        self.fired = 0
+
+    def register(self, name, handler):
+        self.handlers[name] = handler
+
+    def unregister(self, name, handler):
+        """Drop the handler for name, unless something else registered under it since."""
+        if self.handlers.get(name) == handler:
+            del self.handlers[name]
+
+    def after(self, delay, name, *args, every=None, saved=True):
+        """Call handler name(*args) delay seconds from now (and then every `every` seconds)."""
+        return self.push(Timer(self.now + delay, name, args, every, saved))
+
+    def push(self, timer):
+        if timer.every is not None and timer.every <= 0:
+            raise ValueError(f"timer {timer.name!r} repeats every {timer.every} s; it would never let time move on")
+        heapq.heappush(self.heap, (timer.due, self.seq, timer))
+        self.seq += 1
+        return timer
+
+    def advance(self, dt):
+        self.now += dt
+        heap = self.heap
+        while heap and heap[0][0] <= self.now:
+            _, _, timer = heapq.heappop(heap)
+            if not timer.active:
+                continue
+            if timer.every is not None:
+                timer.due += timer.every
+                self.push(timer)
+            else:
+                timer.active = False
+            handler = self.handlers.get(timer.name)
+            if handler is None:
+                raise KeyError(f"no handler registered for timer {timer.name!r}")
+            handler(*timer.args)
+            self.fired += 1
+
+    def pending(self):
+        """Active timers, soonest first. Sorts the whole heap, so it's for saving and
+        debugging, not for calling every tick."""
+        return [timer for _, _, timer in sorted(self.heap) if timer.active]
+
+    def __len__(self):
+        return sum(1 for _, _, timer in self.heap if timer.active)
+
+    def reset(self):
+        self.now = 0.0
+        self.heap.clear()
+
+    # --- Saving ---
+    def to_data(self):
+        return {
+            "now": self.now,
+            "timers": [
+                {"due": timer.due, "name": timer.name, "args": list(timer.args), "every": timer.every}
+                for timer in self.pending() if timer.saved
+            ],
+        }
+
+    def load_data(self, data):
+        """Replace the clock and every pending timer with the saved ones (handlers stay)."""
+        self.reset()
+        self.now = data.get("now", 0.0)
+        for entry in data.get("timers", []):
+            self.push(Timer(entry["due"], entry["name"], tuple(entry["args"]), entry.get("every")))
+
+
+scheduler = Scheduler()
@@ -0,0 +1,5 @@
+# World and window sizes shared by the game (main.py) and the headless runner,
+# so both stream and simulate the same world
+SCREEN_WIDTH, SCREEN_HEIGHT = 1600, 900
+MAP_WIDTH, MAP_HEIGHT = 4000, 3000
+GRID_SIZE = 64
@@ -0,0 +1,191 @@
+import random
+
+import pygame
+
+import campfire
+import particles
+from assets import assets
+from chunks import ChunkManager
+from crafting import add_to_inventory
+from inventory import Inventory
+from particles import ParticleSystem
+from player import Player
+from scheduler import scheduler
+from survival import Survival
+from tile_grid import WATER
+
+TICK_RATE = 30            # Simulation ticks per second, independent of the render rate
+MAX_TICKS_PER_FRAME = 5   # After a long hitch the world skips ahead instead of spiralling
+WATER_PICKUP_TIME = 2.0   # Seconds holding F on water to fill up
+
+# Tile in front of the player for each facing, in grid cells
+CURSOR_OFFSETS = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+
+
+class FixedStep:
+    """Turns variable frame times into a whole number of fixed-size ticks.
+
+    Frame time goes into an accumulator and advance() says how many ticks of
+    dt seconds to run; whatever is left over becomes alpha, how far rendering
+    is between the last two ticks (0..1).
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_ticks=MAX_TICKS_PER_FRAME):
+        self.dt = 1 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.ticks = 0
+
+    def advance(self, frame_seconds):
+        self.accumulator += frame_seconds
+        steps = int(self.accumulator // self.dt)
+        if steps > self.max_ticks:
+            self.accumulator -= (steps - self.max_ticks) * self.dt  # Drop the time we can't catch up on
+            steps = self.max_ticks
+        self.accumulator -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.dt, 1.0)
+
+
+def camera_position(center_x, center_y, view_width, view_height, map_width, map_height):
+    """Top-left of a view centered on (center_x, center_y), clamped to the map."""
+    camera_x = int(center_x) - view_width // 2
+    camera_y = int(center_y) - view_height // 2
+    camera_x = max(0, min(camera_x, map_width - view_width))
+    camera_y = max(0, min(camera_y, map_height - view_height))
+    return camera_x, camera_y
+
+
+def seed_rngs(seed):
+    """Seed every generator the simulation draws from outside the world seed (the
+    module-level one, particles and campfires), so a recording replays exactly."""
+    random.seed(seed)
+    particles.rng.seed(seed)
+    campfire.rng.seed(seed)
+
+
+def build_simulation(game_state, map_width, map_height, view_width, view_height, grid_size=64,
+                     safe_zone=None, decals=None, rng_seed=None):
+    """Player, world and survival stats from a game_state dict (see game_state.initialize_game_state).
+
+    Shared by the game and the headless runner so both simulate the same world.
+    With rng_seed the random generators are seeded first (see seed_rngs), at the
+    same point for a recorded game and its replay.
+    """
+    if rng_seed is not None:
+        seed_rngs(rng_seed)
+    if safe_zone is None:
+        safe_zone = pygame.Rect(map_width // 2 - 64, map_height // 2 - 64, 128, 128)
+
+    # Simulation clock and pending timers go first, loaded fires and the world refer to them
+    scheduler.load_data(game_state.get("timers", {}))
+
+    player = Player(game_state["player"]["x"], game_state["player"]["y"])
+
+    # World is regenerated from its seed; saved changes are replayed as chunks load
+    world = ChunkManager(
+        map_width, map_height, safe_zone, assets.rock_images(), assets.sprite("world", "cow"), grid_size,
+        seed=game_state["seed"], deltas=game_state["changes"]
+    )
+
+    survival = Survival()
+    survival.hunger = game_state.get("hunger", 100)
+    survival.thirst = game_state.get("thirst", 100)
+
+    return Simulation(
+        player, world, survival, ParticleSystem(decals=decals),
+        game_state["inventory_slots"], game_state["hotbar_slots"],
+        map_width, map_height, view_width, view_height, grid_size
+    )
+
+
+class Simulation:
+    """Everything that advances the world, run once per fixed tick.
+
+    Input is read by the caller (keys) and drawing happens elsewhere, so the
+    same tick runs whether or not anything is rendered.
+    """
+
+    def __init__(self, player, world, survival, particle_system, inventory_slots, hotbar_slots,
+                 map_width, map_height, view_width, view_height, grid_size=64):
+        self.player = player
+        self.world = world
+        self.survival = survival
+        self.particle_system = particle_system
+        # Indexed inventory; the slot lists stay what the UI and the save read
+        self.inventory = Inventory(inventory_slots, hotbar_slots)
+        self.inventory_slots = self.inventory.slots
+        self.hotbar_slots = self.inventory.hotbar
+        self.map_width, self.map_height = map_width, map_height
+        self.view_width, self.view_height = view_width, view_height
+        self.grid_size = grid_size
+
+        self.water_timer = None  # Pending "water_filled" Timer while F is held over water
+        self.cursor_rect = pygame.Rect(0, 0, grid_size, grid_size)
+        self.is_cursor_over_water = False
+        self.ticks = 0
+        scheduler.register("water_filled", self.on_water_filled)
+
+    def close(self):
+        """Detach the world and this simulation from the shared event hub and scheduler."""
+        self.world.close()
+        scheduler.unregister("water_filled", self.on_water_filled)
+
+    def view_rect(self):
+        camera_x, camera_y = camera_position(
+            self.player.rect.centerx, self.player.rect.centery,
+            self.view_width, self.view_height, self.map_width, self.map_height
+        )
+        return pygame.Rect(camera_x, camera_y, self.view_width, self.view_height)
+
+    def tick(self, keys, dt):
+        player, world = self.player, self.world
+        scheduler.advance(dt)  # Fires, mining, water filling... whatever came due
+
+        # Stream chunks in/out around the player's view
+        world.update(self.view_rect())
+
+        player.update(keys, self.map_width, self.map_height, world.rock_index, world.tile_grid, dt)
+        world.herd.step(dt, world.tile_grid, focus=player.rect.center)
+        self.survival.update(player.get_state(), dt=dt)
+
+        # Check for item pickups
+        for item in world.item_index.query_rect(player.rect):
+            add_to_inventory(self.inventory_slots, item["type"], hotbar=self.hotbar_slots)
+            world.remove_item(item)
+
+        self.update_water_pickup(keys, dt)
+        self.particle_system.update(dt)
+        if self.particle_system.decals is not None:
+            self.particle_system.decals.update()  # Footprints fade on simulation time
+        self.ticks += 1
+
+    def update_water_pickup(self, keys, dt):
+        grid = self.grid_size
+        dx, dy = CURSOR_OFFSETS.get(self.player.last_direction, (0, 0))
+        self.cursor_rect.topleft = (
+            (self.player.rect.centerx + dx * grid) // grid * grid,
+            (self.player.rect.centery + dy * grid) // grid * grid,
+        )
+        self.is_cursor_over_water = self.world.tile_grid.get_at(self.cursor_rect.x, self.cursor_rect.y) == WATER
+
+        if keys[pygame.K_f] and self.is_cursor_over_water:
+            if self.water_timer is None:
+                self.water_timer = scheduler.after(WATER_PICKUP_TIME, "water_filled", saved=False)
+        elif self.water_timer is not None:
+            self.water_timer.cancel()
+            self.water_timer = None
+
+    def on_water_filled(self):
+        add_to_inventory(self.inventory_slots, "Water", hotbar=self.hotbar_slots)
+        self.water_timer = None  # Still holding F starts the next one
+
+    @property
+    def water_pickup_progress(self):
+        if self.water_timer is None:
+            return 0
+        return min(1 - (self.water_timer.due - scheduler.now) / WATER_PICKUP_TIME, 1)
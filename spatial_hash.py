@@ -0,0 +1,118 @@
+GRID_SIZE = 64
+
+
+class SpatialHash:
+    """Uniform-grid spatial index mapping GRID_SIZE cells to the objects overlapping them.
+
+    Objects are tracked by identity, so unhashable entries such as item dicts work too.
+    Each object is stored with the rect it was inserted with; queries only return
+    objects whose stored rect actually intersects the query rect.
+    """
+
+    def __init__(self, cell_size=GRID_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}    # (cell_x, cell_y) -> {id(obj): obj}
+        self.entries = {}  # id(obj) -> (obj, rect, cell_keys)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self.entries
+
+    def __iter__(self):
+        return (entry[0] for entry in self.entries.values())
+
+    def _cell_range(self, x, y, w, h):
+        """Return the inclusive cell bounds covered by a rect."""
+        size = self.cell_size
+        # Rects are half-open, so the last covered pixel is (x + w - 1)
+        return (
+            int(x // size), int(y // size),
+            int((x + max(w, 1) - 1) // size), int((y + max(h, 1) - 1) // size),
+        )
+
+    def _cell_keys(self, rect):
+        x0, y0, x1, y1 = self._cell_range(rect[0], rect[1], rect[2], rect[3])
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, obj, rect):
+        """Add obj covering rect (anything with x, y, w, h indexing). Re-inserting moves it."""
+        key = id(obj)
+        if key in self.entries:
+            self.remove(obj)
+        rect = tuple(rect)
+        cell_keys = self._cell_keys(rect)
+        for cell in cell_keys:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                bucket = self.cells[cell] = {}
+            bucket[key] = obj
+        self.entries[key] = (obj, rect, cell_keys)
+
+    def remove(self, obj):
+        """Drop obj from the index. Returns False if it was not indexed."""
+        entry = self.entries.pop(id(obj), None)
+        if entry is None:
+            return False
+        key = id(obj)
+        for cell in entry[2]:
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del self.cells[cell]
+        return True
+
+    def move(self, obj, rect):
+        """Update the rect of obj, only touching buckets when it crosses a cell boundary."""
+        key = id(obj)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.insert(obj, rect)
+            return
+        rect = tuple(rect)
+        old_keys = entry[2]
+        if self._cell_range(rect[0], rect[1], rect[2], rect[3]) == self._cell_range(*entry[1]):
+            self.entries[key] = (obj, rect, old_keys)
+            return
+        self.insert(obj, rect)
+
+    def query_rect(self, rect):
+        """Return every object whose rect intersects rect (x, y, w, h)."""
+        qx, qy, qw, qh = rect[0], rect[1], rect[2], rect[3]
+        qr, qb = qx + qw, qy + qh
+        x0, y0, x1, y1 = self._cell_range(qx, qy, qw, qh)
+
+        found = []
+        seen = set()
+        cells = self.cells
+        entries = self.entries
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for key in bucket:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    obj, (ox, oy, ow, oh), _ = entries[key]
+                    if ox < qr and qx < ox + ow and oy < qb and qy < oy + oh:
+                        found.append(obj)
+        return found
+
+    def query_point(self, x, y):
+        """Return every object whose rect contains the point (x, y)."""
+        return self.query_rect((x, y, 1, 1))
+
+    def any_in_rect(self, rect, predicate=None):
+        """True if some object intersecting rect passes predicate (or any object if None)."""
+        for obj in self.query_rect(rect):
+            if predicate is None or predicate(obj):
+                return True
+        return False
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
@@ -1,5 +1,11 @@
 import pygame
 
+from hud import Panel
+from text_cache import get_font, render_text
+
+BAR_WIDTH = 300  # Increased width
+FRAME_RATE = 60  # Drain rates are per frame at 60 FPS; update() scales them by dt
+
 class Survival:
     def __init__(self):
         self.hunger = 100
@@ -9,9 +15,12 @@ class Survival:
         self.hunger_decrease = 0.0055
         self.thirst_decrease = 0.0065  # maybe thirst drains faster
 
-        self.font = pygame.font.Font(None, 28)
+        self.font = get_font(None, 28)
 
-    def update(self, player_state, near_fire=False):
+        # Bars sit at (30, 30); the panel includes their 4px border and the labels
+        self.panel = Panel((26, 26, 480, 88), self.render_bars)
+
+    def update(self, player_state, near_fire=False, dt=1 / FRAME_RATE):
         # 👣 Base idle rates (go down slowly even when doing nothing)
         hunger_rate = self.hunger_decrease
         thirst_rate = self.thirst_decrease
@@ -32,8 +41,9 @@ class Survival:
             thirst_rate *= 0.5
 
         # Always decrease, even if idle
-        self.hunger -= hunger_rate
-        self.thirst -= thirst_rate
+        frames = dt * FRAME_RATE
+        self.hunger -= hunger_rate * frames
+        self.thirst -= thirst_rate * frames
 
         self.hunger = max(0, self.hunger)
         self.thirst = max(0, self.thirst)
@@ -58,26 +68,31 @@ class Survival:
         return False
 
     def draw(self, screen):
-        bar_x = 30  # Adjusted position
-        bar_y = 30  # Adjusted position
-        bar_width = 300  # Increased width
+        # Only redrawn when a bar's width or its label changes (~every 50 frames)
+        state = (int((self.hunger / 100) * BAR_WIDTH), int(round(self.hunger)),
+                 int((self.thirst / 100) * BAR_WIDTH), int(round(self.thirst)))
+        self.panel.update(state, self.hunger, self.thirst)
+        self.panel.draw(screen)
+
+    def render_bars(self, surface, hunger, thirst):
+        bar_x = 4  # Panel sits 4px up-left of the bars for their border
+        bar_y = 4
+        bar_width = BAR_WIDTH
         bar_height = 30  # Increased height
         spacing = 20  # Increased spacing
 
-        font = pygame.font.Font("freesansbold.ttf", 22)  # Slightly larger font
-
         def draw_bar(label, value, y_offset, color):
             outer_rect = pygame.Rect(bar_x - 4, bar_y + y_offset - 4, bar_width + 8, bar_height + 8)
             bg_rect = pygame.Rect(bar_x, bar_y + y_offset, bar_width, bar_height)
             fill_width = int((value / 100) * bar_width)
             fill_rect = pygame.Rect(bar_x, bar_y + y_offset, fill_width, bar_height)
 
-            pygame.draw.rect(screen, (20, 20, 20), outer_rect, border_radius=6)
-            pygame.draw.rect(screen, (40, 40, 40), bg_rect, border_radius=4)
-            pygame.draw.rect(screen, color, fill_rect, border_radius=4)
+            pygame.draw.rect(surface, (20, 20, 20), outer_rect, border_radius=6)
+            pygame.draw.rect(surface, (40, 40, 40), bg_rect, border_radius=4)
+            pygame.draw.rect(surface, color, fill_rect, border_radius=4)
 
-            label_surface = font.render(f"{label}: {int(round(value))}", True, (240, 240, 240))
-            screen.blit(label_surface, (bar_x + bar_width + 16, bar_y + y_offset + 2))
+            label_surface = render_text(f"{label}: {int(round(value))}", 22, (240, 240, 240), face="freesansbold.ttf")  # Slightly larger font
+            surface.blit(label_surface, (bar_x + bar_width + 16, bar_y + y_offset + 2))
 
-        draw_bar("Hunger", self.hunger, 0, (200, 50, 50))
-        draw_bar("Thirst", self.thirst, bar_height + spacing, (50, 120, 255))
+        draw_bar("Hunger", hunger, 0, (200, 50, 50))
+        draw_bar("Thirst", thirst, bar_height + spacing, (50, 120, 255))
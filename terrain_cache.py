@@ -0,0 +1,113 @@
+from collections import OrderedDict
+
+import pygame
+
+import world_events
+from render_queue import TERRAIN
+
+DESERT_COLOR = (199, 168, 107)
+CAMPFIRE_SIZE = 64
+
+
+class TerrainRenderer:
+    """Bakes static world content (sand, lakes, rocks, camps, fire pits) into one surface per chunk.
+
+    Each frame only the visible chunks are blitted. A chunk is re-baked when something
+    in it changes (rock mined, water harvested, campfire placed or burnt out) and
+    surfaces of chunks that scrolled away are dropped in LRU order.
+    """
+
+    def __init__(self, world, max_cached=12):
+        self.world = world
+        self.max_cached = max_cached
+        self.surfaces = OrderedDict()  # chunk key -> baked surface
+        self.bakes = 0                 # Total bakes, handy for tuning
+        self.blits_last_frame = 0
+
+        self.subscriptions = world_events.subscribe_all([
+            ("rock_mined", self.on_rock_mined),
+            ("water_harvested", self.on_water_harvested),
+            ("campfire_placed", self.on_campfire_changed),
+            ("campfire_burnt_out", self.on_campfire_changed),
+            ("chunk_unloaded", self.on_chunk_unloaded),
+        ])
+
+    def close(self):
+        world_events.unsubscribe_all(self.subscriptions)
+
+    # --- Invalidation ---
+    def invalidate_rect(self, rect):
+        """Drop the cached surface of every chunk the rect touches."""
+        for key in self.world.keys_in_rect(pygame.Rect(rect)):
+            self.surfaces.pop(key, None)
+
+    def on_rock_mined(self, rock):
+        self.invalidate_rect(rock.rect)
+
+    def on_water_harvested(self, tile):
+        self.invalidate_rect(tile.rect)
+
+    def on_campfire_changed(self, fire):
+        self.invalidate_rect((fire.x, fire.y, CAMPFIRE_SIZE, CAMPFIRE_SIZE))
+
+    def on_chunk_unloaded(self, chunk):
+        self.surfaces.pop(chunk.key, None)
+
+    # --- Baking ---
+    def bake(self, chunk):
+        """Render everything static that overlaps the chunk, including overhang from neighbours."""
+        area = chunk.area
+        surface = pygame.Surface(area.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(DESERT_COLOR)
+
+        for tile in self.world.water_index.query_rect(area):
+            tile.draw(surface, area.x, area.y)
+        for rock in self.world.rock_index.query_rect(area):
+            rock.draw(surface, area.x, area.y)
+        for camp in self.world.camps:
+            if camp.rect.colliderect(area):
+                camp.draw_base(surface, area.x, area.y)
+
+        # Fire pits are only shown while burning; a burnout event drops the bake
+        for fire in self.world.campfires:
+            if fire.is_burning() and area.colliderect((fire.x, fire.y, CAMPFIRE_SIZE, CAMPFIRE_SIZE)):
+                fire.draw_base(surface, area.x, area.y)
+
+        self.bakes += 1
+        return surface
+
+    # --- Drawing ---
+    def visible_blits(self, camera_x, camera_y, width, height):
+        """(surface, dest) for every visible chunk, baking the ones that are missing or stale."""
+        view = pygame.Rect(camera_x, camera_y, width, height)
+        blits = []
+
+        for key in self.world.keys_in_rect(view):
+            chunk = self.world.chunks.get(key)
+            if chunk is None:
+                continue
+            surface = self.surfaces.get(key)
+            if surface is None:
+                surface = self.surfaces[key] = self.bake(chunk)
+            self.surfaces.move_to_end(key)
+            blits.append((surface, (chunk.area.x - camera_x, chunk.area.y - camera_y)))
+
+        while len(self.surfaces) > self.max_cached:
+            self.surfaces.popitem(last=False)
+
+        self.blits_last_frame = len(blits)
+        return blits
+
+    def draw(self, screen, camera_x, camera_y):
+        """Blit the visible chunk surfaces. Returns the number of blits."""
+        blits = self.visible_blits(camera_x, camera_y, screen.get_width(), screen.get_height())
+        screen.blits(blits, doreturn=False)
+        return len(blits)
+
+    def submit(self, queue, camera_x, camera_y, width, height):
+        """Queue the visible chunk surfaces on the terrain layer. Returns the number of blits."""
+        blits = self.visible_blits(camera_x, camera_y, width, height)
+        queue.extend(TERRAIN, blits)
+        return len(blits)
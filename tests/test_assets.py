@@ -0,0 +1,24 @@
+import pygame
+
+from assets import AssetManager
+
+
+def test_sheet_frames_are_sliced_from_one_cached_image(tmp_path, monkeypatch):
+    sheet = pygame.Surface((10, 30), pygame.SRCALPHA)
+    for i, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255)]):
+        sheet.fill(color, (0, i * 10, 10, 10))
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(sheet, path)
+
+    loads = []
+    real_load = pygame.image.load
+    monkeypatch.setattr(pygame.image, "load", lambda p: loads.append(p) or real_load(p))
+
+    manager = AssetManager()
+    frames = manager.sheet_frames(path, 3, scale=2)
+    assert [frame.get_size() for frame in frames] == [(20, 20)] * 3
+    assert frames[1].get_at((5, 5))[:3] == (0, 255, 0)
+
+    assert manager.sheet_frames(path, 3, scale=2) is frames  # Scaled once
+    assert len(manager.sheet_frames(path, 3, scale=1)) == 3
+    assert loads == [path]  # Both scales come from the one loaded image
@@ -0,0 +1,27 @@
+from decals import FADE_INTERVAL, FADE_STEPS, DecalLayer
+from scheduler import scheduler
+
+
+def test_footprints_fade_on_simulation_time():
+    scheduler.reset()
+    decals = DecalLayer()
+    try:
+        decals.add_footprint(10, 10, 8)
+        decals.update()
+        surface = decals.surfaces[(0, 0)]
+        assert surface.get_at((12, 12)).a == 255
+
+        scheduler.advance(FADE_INTERVAL * 2)
+        decals.update()
+        faded = surface.get_at((12, 12)).a
+        assert 0 < faded < 255
+
+        decals.update()  # No simulation time passed, nothing changes
+        assert surface.get_at((12, 12)).a == faded
+
+        scheduler.advance(FADE_INTERVAL * FADE_STEPS)
+        decals.update()
+        assert decals.surfaces == {}
+    finally:
+        decals.close()
+        scheduler.reset()
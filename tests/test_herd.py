@@ -0,0 +1,81 @@
+import numpy as np
+import pygame
+
+from herd import FLEE_FRAMES, RUN_SPEED, WALK_SPEED, Herd
+from lod import MID_RADIUS, LODScheduler
+from tile_grid import ROCK, TileGrid
+
+COW = (40, 30)
+
+
+def herd_with_cow(x, y, **kwargs):
+    herd = Herd(COW, capacity=4, seed=1)
+    slot = herd.add(None, x, y, **kwargs)
+    return herd, slot
+
+
+def test_cows_stay_inside_their_home_chunk():
+    herd, slot = herd_with_cow(10, 10, bounds=pygame.Rect(0, 0, 200, 200))
+    herd.dir_x[slot], herd.dir_y[slot], herd.timer[slot] = -1, -1, 1000
+    for _ in range(60):
+        herd.step(1 / 30)
+    assert (herd.x[slot], herd.y[slot]) == (0, 0)
+
+
+def test_far_cows_do_not_tunnel_through_rocks():
+    grid = TileGrid(4096, 640)
+    grid.tiles[10, :] = ROCK  # A wall of rock from x=640 to 704
+    herd, slot = herd_with_cow(500, 300)
+    herd.lod = LODScheduler(far_every=120)  # One 312 px jump every 4 s, well past the wall
+    herd.dir_x[slot], herd.dir_y[slot], herd.timer[slot] = 1, 0, 10_000
+
+    focus = (500 + MID_RADIUS + 1000, 300)  # Far tier
+    for _ in range(120 * 3):
+        herd.step(1 / 30, grid, focus)
+    assert herd.x[slot] + COW[0] <= 640
+    assert herd.x[slot] > 500  # It did walk up to the wall
+
+
+def test_a_cow_on_a_rock_can_walk_off_it():
+    grid = TileGrid(1024, 1024)
+    grid.tiles[5, 5] = ROCK
+    herd, slot = herd_with_cow(5 * 64 + 10, 5 * 64 + 10)
+    herd.dir_x[slot], herd.dir_y[slot], herd.timer[slot] = 1, 0, 10_000
+    herd.step(1 / 30, grid)
+    assert herd.x[slot] > 5 * 64 + 10
+
+
+def test_fleeing_stops_when_the_invincibility_runs_out():
+    herd, slot = herd_with_cow(0, 0)
+    herd.dir_x[slot], herd.dir_y[slot], herd.timer[slot] = 0, 0, 1000  # Stands still once calm
+    herd.hit(slot, -10, 0)  # Runs along +x
+    herd.step(1.0)  # One second = 60 frames, far more than FLEE_FRAMES
+    assert np.isclose(herd.x[slot], RUN_SPEED * FLEE_FRAMES)
+    assert herd.iframes[slot] == 0
+
+
+def test_calm_part_of_a_step_is_spent_wandering():
+    herd, slot = herd_with_cow(0, 0)
+    herd.dir_x[slot], herd.dir_y[slot], herd.timer[slot] = 0, 1, 1000
+    herd.hit(slot, -10, 0)
+    herd.step(1.0)
+    assert np.isclose(herd.y[slot], WALK_SPEED * (60 - FLEE_FRAMES))
+    assert np.isclose(herd.timer[slot], 1000 - (60 - FLEE_FRAMES))
+
+
+def test_lod_catches_up_skipped_ticks():
+    lod = LODScheduler()
+    slots = np.arange(3)
+    xs = np.array([0.0, 2000.0, 10000.0])
+    ys = np.zeros(3)
+    last = np.zeros(3, dtype=np.int64)
+    updates = np.zeros(3, dtype=np.int64)
+    elapsed_total = np.zeros(3, dtype=np.int64)
+    for tick in range(1, 121):
+        due, elapsed = lod.schedule(slots, xs, ys, last, tick, (0, 0))
+        last[due] = tick
+        updates[due] += 1
+        elapsed_total[due] += elapsed
+    assert updates[0] == 120
+    assert updates[0] > updates[1] > updates[2] > 0
+    assert (elapsed_total == last).all()  # No skipped time is lost
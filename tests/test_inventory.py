@@ -0,0 +1,136 @@
+import random
+
+import pytest
+
+from crafting import CraftingSystem, add_to_inventory, inventory_to_dict
+from inventory import HOTBAR, INVENTORY, Inventory
+
+
+def recount(inventory):
+    counts = {}
+    for slots in inventory.rows.values():
+        for slot in slots:
+            if slot:
+                counts[slot["item"]] = counts.get(slot["item"], 0) + slot["count"]
+    return counts
+
+
+def check_index(inventory):
+    """stacks, totals and the free lists agree with the slots themselves."""
+    assert inventory.totals == recount(inventory)
+    assert set(inventory.stacks) == set(inventory.totals)
+    for item, (row, index) in inventory.stacks.items():
+        assert inventory.rows[row][index]["item"] == item
+    for row, slots in inventory.rows.items():
+        assert sorted(inventory.free[row]) == [i for i, slot in enumerate(slots) if not slot]
+
+
+def make_inventory():
+    return Inventory([None] * 24, [None] * 8)
+
+
+def test_add_stacks_and_fills_hotbar_first():
+    inventory = make_inventory()
+    add_to_inventory(inventory.slots, "Wood", 2, hotbar=inventory.hotbar)
+    add_to_inventory(inventory.slots, "Wood", 3, hotbar=inventory.hotbar)
+    add_to_inventory(inventory.slots, "Stone", 1, hotbar=inventory.hotbar)
+    assert inventory.hotbar[0] == {"item": "Wood", "count": 5}
+    assert inventory.hotbar[1] == {"item": "Stone", "count": 1}
+    assert inventory.count("Wood") == 5
+    check_index(inventory)
+
+
+def test_full_inventory_refuses():
+    inventory = Inventory([None], [None])
+    assert inventory.add("Wood")
+    assert inventory.add("Stone")
+    assert not inventory.add("Meat")
+    assert inventory.add("Wood")  # Stacking still works
+    check_index(inventory)
+
+
+def test_removing_a_split_stack_does_not_leave_a_stale_index():
+    inventory = make_inventory()
+    inventory.add("Wood", 1)
+    inventory.add("Wood", 3, (INVENTORY,))  # Goes on the hotbar stack
+    inventory.set_slot(INVENTORY, 5, {"item": "Wood", "count": 2})  # A second stack, e.g. dragged there
+    inventory.remove("Wood", 4)
+    check_index(inventory)
+    assert inventory.remove("Wood", 2)
+    assert inventory.count("Wood") == 0
+    assert inventory.add("Wood")
+    check_index(inventory)
+
+
+def test_slot_writes_are_indexed():
+    inventory = make_inventory()
+    inventory.slots[3] = {"item": "Meat", "count": 2}
+    inventory.hotbar[0] = {"item": "Meat", "count": 1}
+    assert inventory.count("Meat") == 3
+    inventory.slots[3] = None
+    assert inventory.count("Meat") == 1
+    inventory.slots[0:2] = [{"item": "Water", "count": 1}, None]
+    assert inventory.count("Water") == 1
+    check_index(inventory)
+
+
+@pytest.mark.parametrize("change", [
+    lambda slots: slots.append(None),
+    lambda slots: slots.pop(),
+    lambda slots: slots.clear(),
+    lambda slots: slots.extend([None]),
+    lambda slots: slots.__delitem__(0),
+    lambda slots: slots.__setitem__(slice(0, 2), [None]),
+])
+def test_rows_keep_their_size(change):
+    inventory = make_inventory()
+    with pytest.raises(TypeError):
+        change(inventory.slots)
+    assert len(inventory.slots) == 24
+
+
+def test_plain_lists_are_rejected():
+    with pytest.raises(TypeError):
+        add_to_inventory([None] * 4, "Wood")
+
+
+def test_crafting_uses_the_index():
+    inventory = make_inventory()
+    crafting = CraftingSystem()
+    inventory.add("Wood", 2)
+    inventory.set_slot(INVENTORY, 4, {"item": "Wood", "count": 1})
+    assert crafting.can_craft("Plank", inventory.slots, inventory.hotbar)
+    assert crafting.craft_item("Plank", inventory.slots, inventory.hotbar) == "Plank"
+    assert inventory_to_dict(inventory.slots, inventory.hotbar) == {"Wood": 1}
+    assert not crafting.can_craft("Plank", inventory.slots, inventory.hotbar)
+    check_index(inventory)
+
+
+def test_loading_merges_split_stacks():
+    slots = [{"item": "Wood", "count": 1}, None, {"item": "Wood", "count": 2}, {}]
+    inventory = Inventory(slots, [{"item": "Wood", "count": 4}])
+    assert inventory.slots[0] == {"item": "Wood", "count": 7}
+    assert inventory.hotbar[0] is None
+    check_index(inventory)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_changes_keep_the_index_consistent(seed):
+    rng = random.Random(seed)
+    inventory = Inventory([None] * 6, [None] * 3)
+    items = ["Wood", "Stone", "Plank", "Water", "Meat", "Leather"]
+    rows = [HOTBAR, INVENTORY]
+    for _ in range(2000):
+        op = rng.randrange(4)
+        if op == 0:
+            inventory.add(rng.choice(items), rng.randint(1, 4), rng.choice([(HOTBAR, INVENTORY), (INVENTORY,)]))
+        elif op == 1:
+            inventory.remove(rng.choice(items), rng.randint(1, 5))
+        elif op == 2:
+            row, other = rng.choice(rows), rng.choice(rows)
+            inventory.move(row, rng.randrange(len(inventory.rows[row])), other, rng.randrange(len(inventory.rows[other])))
+        else:
+            row = rng.choice(rows)
+            slot = rng.choice([None, {"item": rng.choice(items), "count": rng.randint(1, 3)}])
+            inventory.rows[row][rng.randrange(len(inventory.rows[row]))] = slot
+        check_index(inventory)
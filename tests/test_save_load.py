@@ -0,0 +1,38 @@
+import save_load
+from campfire import Campfire
+from headless import HeadlessGame, KeyState
+from scheduler import scheduler
+
+
+def test_save_round_trip_keeps_player_inventory_and_world_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(save_load, "SAVE_FILE", str(tmp_path / "save.json"))
+
+    game = HeadlessGame(seed=5)
+    sim, world = game.simulation, game.simulation.world
+    sim.tick(KeyState(), 1 / 30)  # Stream the chunks around the player in
+    rock = next(rock for rock in world.rocks if rock.uid is not None)
+    rock.mine()
+    fire_x, fire_y = next(
+        (tx * 64, ty * 64) for tx in range(20, 60) for ty in range(20, 40)
+        if world.tile_grid.is_free(tx, ty) and world.chunk_at(tx * 64, ty * 64) is not None
+    )
+    assert world.add_campfire(Campfire(fire_x, fire_y))
+    sim.inventory.add("Wood", 4)
+    sim.player.x, sim.player.y = 1234, 987
+    save_load.save_game(sim.player, sim.inventory_slots, sim.hotbar_slots, world, 0.3, 55, 44)
+    game.close()
+
+    state = save_load.load_game()
+    restored = HeadlessGame(game_state=state)
+    try:
+        sim, world = restored.simulation, restored.simulation.world
+        assert (sim.player.x, sim.player.y) == (1234, 987)
+        assert (sim.survival.hunger, sim.survival.thirst) == (55, 44)
+        assert sim.inventory.count("Wood") == 4
+        sim.tick(KeyState(), 1 / 30)
+        assert world.seed == 5
+        assert [r.mined for r in world.rocks if (r.x, r.y) == (rock.x, rock.y)] == [True]
+        assert [(f.x, f.y) for f in world.campfires] == [(fire_x, fire_y)]
+        assert [timer.name for timer in scheduler.pending()] == ["campfire_burnout"]
+    finally:
+        restored.close()
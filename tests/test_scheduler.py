@@ -0,0 +1,69 @@
+import pytest
+
+from scheduler import Scheduler
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def timers(calls):
+    scheduler = Scheduler()
+    scheduler.register("note", lambda *args: calls.append((scheduler.now, args)))
+    return scheduler
+
+
+def test_timers_fire_in_due_order(timers, calls):
+    timers.after(3, "note", "c")
+    timers.after(1, "note", "a")
+    timers.after(2, "note", "b")
+    timers.advance(2.5)
+    assert [args for _, args in calls] == [("a",), ("b",)]
+    timers.advance(1)
+    assert [args for _, args in calls] == [("a",), ("b",), ("c",)]
+
+
+def test_same_time_timers_fire_in_scheduling_order(timers, calls):
+    for name in "xyz":
+        timers.after(1, "note", name)
+    timers.advance(1)
+    assert [args[0] for _, args in calls] == ["x", "y", "z"]
+
+
+def test_repeating_and_cancelled_timers(timers, calls):
+    timers.after(1, "note", "tick", every=1)
+    cancelled = timers.after(0.5, "note", "never")
+    cancelled.cancel()
+    timers.advance(3.5)
+    assert [args for _, args in calls] == [("tick",)] * 3
+    assert len(timers) == 1
+
+
+def test_non_positive_repeat_is_rejected(timers):
+    with pytest.raises(ValueError):
+        timers.after(1, "note", every=0)
+    with pytest.raises(ValueError):
+        timers.after(1, "note", every=-1)
+
+
+def test_missing_handler_is_an_error(timers):
+    timers.after(1, "nobody")
+    with pytest.raises(KeyError):
+        timers.advance(1)
+
+
+def test_save_round_trip_skips_unsaved_timers(timers, calls):
+    timers.after(5, "note", 1, 2)
+    timers.after(2, "note", "repeat", every=2)
+    timers.after(1, "note", "input", saved=False)
+    timers.advance(0.5)
+    data = timers.to_data()
+
+    restored = Scheduler()
+    restored.register("note", lambda *args: calls.append((restored.now, args)))
+    restored.load_data(data)
+    assert restored.now == 0.5
+    restored.advance(5)
+    assert [args for _, args in calls] == [("repeat",), ("repeat",), (1, 2)]
@@ -0,0 +1,12 @@
+from simulation import FixedStep
+
+
+def test_fixed_step_accumulates_and_caps():
+    stepper = FixedStep(tick_rate=30, max_ticks=5)
+    assert stepper.advance(1 / 60) == 0
+    assert 0.49 < stepper.alpha < 0.51
+    assert stepper.advance(1 / 60) == 1
+    assert stepper.advance(0.1) == 3
+    assert stepper.advance(10) == 5  # A long hitch is skipped, not caught up
+    assert stepper.alpha < 1
+    assert stepper.ticks == 9
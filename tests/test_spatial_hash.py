@@ -0,0 +1,17 @@
+from spatial_hash import SpatialHash
+
+
+def test_spatial_hash_queries_and_moves():
+    index = SpatialHash(64)
+    a, b = {"name": "a"}, {"name": "b"}  # Unhashable objects are fine
+    index.insert(a, (10, 10, 20, 20))
+    index.insert(b, (100, 100, 80, 80))
+    assert index.query_rect((0, 0, 64, 64)) == [a]
+    assert index.query_point(150, 150) == [b]
+    assert index.query_rect((31, 31, 10, 10)) == []  # Same cell as a, but no overlap
+
+    index.move(a, (150, 150, 10, 10))
+    assert sorted(obj["name"] for obj in index.query_point(155, 155)) == ["a", "b"]
+    assert index.remove(a)
+    assert not index.remove(a)
+    assert len(index) == 1 and b in index
@@ -0,0 +1,17 @@
+from tile_grid import CAMPFIRE, FREE, ROCK, TileGrid
+
+
+def test_tile_grid_placement_and_bounds():
+    grid = TileGrid(640, 320, 64)
+    assert (grid.width, grid.height) == (10, 5)
+    assert grid.place(2, 2, CAMPFIRE)
+    assert not grid.place(2, 2, ROCK)
+    assert not grid.can_place(9, 4, 2, 1)  # Off the right edge
+    assert grid.get_at(130, 140) == CAMPFIRE
+    assert grid.get(-1, 0) == FREE
+    assert grid.rect_has((100, 100, 64, 64), CAMPFIRE)
+
+    grid.clear_if(128, 128, ROCK)  # Wrong kind, left alone
+    assert grid.get(2, 2) == CAMPFIRE
+    grid.clear_if(128, 128, CAMPFIRE)
+    assert grid.get(2, 2) == FREE
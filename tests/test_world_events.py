@@ -0,0 +1,48 @@
+import pygame
+
+import world_events
+from headless import HeadlessGame
+from scheduler import scheduler
+
+
+class Fire:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+        self.rect = pygame.Rect(x, y, 64, 64)
+
+
+def test_unsubscribe_all_undoes_subscribe_all():
+    seen = []
+    subscriptions = world_events.subscribe_all([("test_event", seen.append), ("other_event", seen.append)])
+    world_events.emit("test_event", 1)
+    world_events.unsubscribe_all(subscriptions)
+    world_events.emit("test_event", 2)
+    world_events.emit("other_event", 3)
+    assert seen == [1]
+
+
+def test_closed_games_stop_listening():
+    first = HeadlessGame(seed=1)
+    first.close()
+    second = HeadlessGame(seed=2)
+    try:
+        first.minimap.dirty_rects.clear()
+        second.minimap.dirty_rects.clear()
+        world_events.emit("campfire_placed", Fire(128, 128))
+        assert first.minimap.dirty_rects == []
+        assert second.minimap.dirty_rects == [pygame.Rect(128, 128, 64, 64)]
+        assert scheduler.handlers["campfire_burnout"] == second.simulation.world.burn_out_campfire
+    finally:
+        second.close()
+    assert "campfire_burnout" not in scheduler.handlers
+    assert "water_filled" not in scheduler.handlers
+
+
+def test_unregister_keeps_a_newer_handler():
+    old, new = (lambda: None), (lambda: None)
+    scheduler.register("test_timer", old)
+    scheduler.register("test_timer", new)
+    scheduler.unregister("test_timer", old)
+    assert scheduler.handlers["test_timer"] is new
+    scheduler.unregister("test_timer", new)
+    assert "test_timer" not in scheduler.handlers
@@ -0,0 +1,77 @@
+import random
+
+import numpy as np
+import pygame
+
+from tile_grid import CAMP, FREE, ROCK, TileGrid
+from world_generation import poisson_disk_tiles, spawn_camps_batch, spawn_items_batch, spawn_rocks_batch
+
+SAFE_ZONE = pygame.Rect(0, 0, 128, 128)
+
+
+# --- Batch placement ---
+def test_rocks_batch_places_exactly_n_on_free_unique_tiles():
+    area = pygame.Rect(0, 0, 64 * 40, 64 * 40)
+    grid = TileGrid(area.width, area.height, 64)
+    grid.tiles[10:30, :] = ROCK  # Half the map blocked, so many draws miss
+    rocks = []
+    placed = spawn_rocks_batch(np.random.default_rng(2), 500, rocks, grid, SAFE_ZONE, area, 64, [pygame.Surface((4, 4))])
+
+    assert placed == len(rocks) == 500
+    tiles = {(rock.x // 64, rock.y // 64) for rock in rocks}
+    assert len(tiles) == 500
+    assert not any(10 <= tx < 30 for tx, _ in tiles)
+    assert not any(SAFE_ZONE.collidepoint(rock.x, rock.y) for rock in rocks)
+    assert np.count_nonzero(grid.tiles == ROCK) == 20 * 40 + 500
+
+
+def test_items_batch_stops_when_the_area_runs_out():
+    area = pygame.Rect(0, 0, 64 * 10, 64 * 10)
+    grid = TileGrid(area.width, area.height, 64)
+    grid.tiles[:, 5:] = ROCK
+    items = []
+    placed = spawn_items_batch(np.random.default_rng(3), 1000, items, grid, SAFE_ZONE, area, 64)
+
+    free_outside_safe = 10 * 5 - 4  # The safe zone covers 2x2 tiles
+    assert placed == len(items) == free_outside_safe
+    assert len({(int(item["x"]) // 64, int(item["y"]) // 64) for item in items}) == free_outside_safe
+    assert (grid.tiles[:, :5] == FREE).all()  # Items don't block tiles
+
+
+def test_batch_placement_only_depends_on_the_seed():
+    area = pygame.Rect(0, 0, 64 * 50, 64 * 50)
+
+    def generate():
+        grid, items = TileGrid(area.width, area.height, 64), []
+        spawn_items_batch(np.random.default_rng(8), 2000, items, grid, SAFE_ZONE, area, 64)
+        return [(item["x"], item["y"]) for item in items]
+
+    assert generate() == generate()
+
+
+def test_camps_batch_reports_what_it_placed():
+    area = pygame.Rect(0, 0, 64 * 100, 64 * 100)
+    grid, camps = TileGrid(area.width, area.height, 64), []
+    placed = spawn_camps_batch(np.random.default_rng(5), random.Random(5), 50, camps, grid, SAFE_ZONE, area, 64)
+    assert placed == len(camps) == 50
+    assert np.count_nonzero(grid.tiles == CAMP) == 4 * 50
+
+
+# --- Poisson-disk sampler ---
+def test_poisson_samples_keep_their_distance():
+    area = pygame.Rect(0, 0, 64 * 200, 64 * 200)
+    grid = TileGrid(area.width, area.height, 64)
+    grid.tiles[50:60, :] = ROCK
+
+    def valid(tx, ty):
+        return grid.tiles[np.minimum(tx, grid.width - 1), np.minimum(ty, grid.height - 1)] == FREE
+
+    tx, ty = poisson_disk_tiles(np.random.default_rng(4), area, 4, 64, valid)
+    assert len(tx) > 500
+    assert valid(tx, ty).all()
+    dist = np.maximum(np.abs(tx[:, None] - tx[None, :]), np.abs(ty[:, None] - ty[None, :]))
+    np.fill_diagonal(dist, 1000)
+    assert dist.min() >= 4
+
+    again = poisson_disk_tiles(np.random.default_rng(4), area, 4, 64, valid)
+    assert (again[0] == tx).all() and (again[1] == ty).all()
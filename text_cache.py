@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_COLOR = (255, 255, 255)
+MAX_CACHED_TEXT = 256
+
+# (face, size) -> pygame.font.Font, loaded once. face None = pygame's default font.
+fonts = {}
+
+# (face, size, text, color, antialias) -> rendered surface, least recently used first
+rendered = OrderedDict()
+
+
+def get_font(face=None, size=24):
+    """Shared Font for a face/size. Loading a font reads and parses the file, so do it once."""
+    key = (face, size)
+    font = fonts.get(key)
+    if font is None:
+        font = fonts[key] = pygame.font.Font(face, size)
+    return font
+
+
+def render_text(text, size=24, color=DEFAULT_COLOR, face=None, antialias=True):
+    """Rendered text surface, reused while the same string keeps being drawn.
+
+    The returned surface is shared: blit it, don't draw on it.
+    """
+    key = (face, size, text, tuple(color), antialias)
+    surface = rendered.get(key)
+    if surface is not None:
+        rendered.move_to_end(key)
+        return surface
+
+    surface = rendered[key] = get_font(face, size).render(text, antialias, color)
+    if len(rendered) > MAX_CACHED_TEXT:
+        rendered.popitem(last=False)
+    return surface
+
+
+def clear():
+    """Forget every font and rendered string (e.g. after pygame.quit)."""
+    fonts.clear()
+    rendered.clear()
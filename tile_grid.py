@@ -0,0 +1,119 @@
+import numpy as np
+
+import world_events
+
+GRID_SIZE = 64
+
+# Tile kinds (one byte per tile)
+FREE = 0
+WATER = 1
+ROCK = 2
+CAMP = 3
+CAMPFIRE = 4
+
+
+class TileGrid:
+    """Array-backed occupancy map with one uint8 per GRID_SIZE tile.
+
+    The array is indexed [tile_x, tile_y] so it lines up with pygame.surfarray.
+    Every lookup is a single array access regardless of how many entities exist.
+    """
+
+    def __init__(self, map_width, map_height, grid_size=GRID_SIZE):
+        self.grid_size = grid_size
+        self.width = -(-map_width // grid_size)    # ceil, so edge tiles exist
+        self.height = -(-map_height // grid_size)
+        self.tiles = np.zeros((self.width, self.height), dtype=np.uint8)
+
+    # --- Coordinates ---
+    def to_tile(self, x, y):
+        return int(x // self.grid_size), int(y // self.grid_size)
+
+    def in_bounds(self, tx, ty):
+        return 0 <= tx < self.width and 0 <= ty < self.height
+
+    # --- Lookups ---
+    def get(self, tx, ty):
+        """Tile kind at tile coordinates; out-of-map tiles read as FREE."""
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return self.tiles[tx, ty]
+        return FREE
+
+    def get_at(self, x, y):
+        """Tile kind at world pixel coordinates."""
+        return self.get(int(x // self.grid_size), int(y // self.grid_size))
+
+    def is_free(self, tx, ty):
+        return self.in_bounds(tx, ty) and self.tiles[tx, ty] == FREE
+
+    def is_water_at(self, x, y):
+        return self.get_at(x, y) == WATER
+
+    def tile_span(self, rect):
+        """Clipped tile bounds (tx0, ty0, tx1, ty1) covered by a pixel rect, exclusive end."""
+        size = self.grid_size
+        tx0 = max(0, int(rect[0] // size))
+        ty0 = max(0, int(rect[1] // size))
+        tx1 = min(self.width, int((rect[0] + max(rect[2], 1) - 1) // size) + 1)
+        ty1 = min(self.height, int((rect[1] + max(rect[3], 1) - 1) // size) + 1)
+        return tx0, ty0, tx1, ty1
+
+    def rect_has(self, rect, kind):
+        """True if any tile under the pixel rect is of the given kind."""
+        tx0, ty0, tx1, ty1 = self.tile_span(rect)
+        if tx0 >= tx1 or ty0 >= ty1:
+            return False
+        return bool((self.tiles[tx0:tx1, ty0:ty1] == kind).any())
+
+    def can_place(self, tx, ty, w=1, h=1):
+        """True if a w x h tile footprint at (tx, ty) is fully inside the map and free."""
+        if tx < 0 or ty < 0 or tx + w > self.width or ty + h > self.height:
+            return False
+        return not self.tiles[tx:tx + w, ty:ty + h].any()
+
+    # --- Mutation ---
+    def set(self, tx, ty, kind):
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            self.tiles[tx, ty] = kind
+
+    def set_at(self, x, y, kind):
+        self.set(int(x // self.grid_size), int(y // self.grid_size), kind)
+
+    def fill(self, tx, ty, w, h, kind):
+        tx0, ty0 = max(0, tx), max(0, ty)
+        self.tiles[tx0:max(tx0, tx + w), ty0:max(ty0, ty + h)] = kind
+
+    def clear_area(self, rect):
+        """Reset every tile under a pixel rect to FREE (used when a chunk is evicted)."""
+        tx0, ty0, tx1, ty1 = self.tile_span(rect)
+        self.tiles[tx0:tx1, ty0:ty1] = FREE
+
+    def place(self, tx, ty, kind, w=1, h=1):
+        """Claim a footprint for a structure. Returns False if it is blocked."""
+        if not self.can_place(tx, ty, w, h):
+            return False
+        self.tiles[tx:tx + w, ty:ty + h] = kind
+        return True
+
+    # --- Sync with world changes ---
+    def clear_if(self, x, y, kind):
+        """Free the tile at pixel (x, y) if it still holds the given kind."""
+        tx, ty = self.to_tile(x, y)
+        if self.get(tx, ty) == kind:
+            self.tiles[tx, ty] = FREE
+
+    def on_rock_mined(self, rock):
+        self.clear_if(rock.x, rock.y, ROCK)
+
+    def on_water_harvested(self, tile):
+        self.clear_if(tile.x, tile.y, WATER)
+
+    def track_world_events(self):
+        self.subscriptions = world_events.subscribe_all([
+            ("rock_mined", self.on_rock_mined),
+            ("water_harvested", self.on_water_harvested),
+        ])
+
+    def close(self):
+        """Stop following world events (see track_world_events)."""
+        world_events.unsubscribe_all(getattr(self, "subscriptions", []))
@@ -1,5 +1,9 @@
 import pygame
 
+from assets import assets
+from hud import Panel
+from text_cache import render_text
+
 # 🎨 UI Style Constants
 INVENTORY_COLOR = (111, 78, 55)         # Panel BG
 INVENTORY_BORDER = (77, 51, 38)         # Border
@@ -16,28 +20,47 @@ SLOT_SIZE = 60
 ICON_SIZE = 40
 SCREEN_WIDTH = 1600  # Updated resolution
 SCREEN_HEIGHT = 900  # Updated resolution
+GRID_SIZE = 64
+GRID_COLOR = (0, 0, 0, 25)
+
+
+INVENTORY_X = 100
+INVENTORY_Y = 100
+HOTBAR_X = SCREEN_WIDTH // 2 - (HOTBAR_SLOTS * SLOT_SIZE) // 2  # Centered horizontally
+HOTBAR_Y = SCREEN_HEIGHT - 100  # Adjusted to be closer to the bottom
+
+
+def slots_state(slots):
+    """Hashable snapshot of what a row of slots shows."""
+    return tuple((slot["item"], slot["count"]) if slot else None for slot in slots)
 
 
 def draw_inventory(screen, inventory_slots, open_, ITEM_TYPES, dragged_item=None, dragged_index=None, dragged_from=None):
     if not open_:
         return
 
-    INVENTORY_X = 100
-    INVENTORY_Y = 100
-    font = pygame.font.Font(None, 30)
+    # Redrawn only when the contents or the dragged slot change
+    hidden = dragged_index if dragged_from == "inventory" else None
+    inventory_panel.update((slots_state(inventory_slots), hidden), inventory_slots, ITEM_TYPES, hidden)
+    inventory_panel.draw(screen)
+
+
+def render_inventory(surface, inventory_slots, ITEM_TYPES, hidden_index):
+    inventory_x = 5  # Panel starts at the 5px border
+    inventory_y = 5
 
     # Draw background and border
     pygame.draw.rect(
-        screen,
+        surface,
         INVENTORY_BORDER,
-        (INVENTORY_X - 5, INVENTORY_Y - 5,
+        (inventory_x - 5, inventory_y - 5,
          INVENTORY_COLUMNS * INVENTORY_SLOT_SIZE + 10,
          INVENTORY_ROWS * INVENTORY_SLOT_SIZE + 10)
     )
     pygame.draw.rect(
-        screen,
+        surface,
         INVENTORY_COLOR,
-        (INVENTORY_X, INVENTORY_Y,
+        (inventory_x, inventory_y,
          INVENTORY_COLUMNS * INVENTORY_SLOT_SIZE,
          INVENTORY_ROWS * INVENTORY_SLOT_SIZE)
     )
@@ -46,15 +69,15 @@ def draw_inventory(screen, inventory_slots, open_, ITEM_TYPES, dragged_item=None
     for i, slot in enumerate(inventory_slots):
         row = i // INVENTORY_COLUMNS
         col = i % INVENTORY_COLUMNS
-        slot_x = INVENTORY_X + col * INVENTORY_SLOT_SIZE
-        slot_y = INVENTORY_Y + row * INVENTORY_SLOT_SIZE
+        slot_x = inventory_x + col * INVENTORY_SLOT_SIZE
+        slot_y = inventory_y + row * INVENTORY_SLOT_SIZE
 
         # Slot box
-        pygame.draw.rect(screen, INVENTORY_SLOT_COLOR, (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE))
-        pygame.draw.rect(screen, INVENTORY_SLOT_BORDER, (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE), 3)
+        pygame.draw.rect(surface, INVENTORY_SLOT_COLOR, (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE))
+        pygame.draw.rect(surface, INVENTORY_SLOT_BORDER, (slot_x, slot_y, INVENTORY_SLOT_SIZE, INVENTORY_SLOT_SIZE), 3)
 
         # Skip drawing if this is the dragged item
-        if dragged_from == "inventory" and dragged_index == i:
+        if hidden_index == i:
             continue
 
         if slot:
@@ -65,37 +88,43 @@ def draw_inventory(screen, inventory_slots, open_, ITEM_TYPES, dragged_item=None
             icon_x = slot_x + 10
             icon_y = slot_y + 10
             if item_type == "Water":
-                pygame.draw.rect(screen, (50, 143, 168), (icon_x, icon_y, 40, 40))
+                pygame.draw.rect(surface, (50, 143, 168), (icon_x, icon_y, 40, 40))
             else:
-                screen.blit(ITEM_TYPES[item_type], (icon_x, icon_y))
+                surface.blit(ITEM_TYPES[item_type], (icon_x, icon_y))
 
             # Draw count
             if count > 1:
-                count_text = font.render(str(count), True, TEXT_COLOR)
+                count_text = render_text(str(count), 30, TEXT_COLOR)
                 text_rect = count_text.get_rect(bottomright=(slot_x + INVENTORY_SLOT_SIZE - 8, slot_y + INVENTORY_SLOT_SIZE - 8))
-                screen.blit(count_text, text_rect)
+                surface.blit(count_text, text_rect)
 
 
 def draw_hotbar(screen, hotbar_slots, ITEM_TYPES, selected_index=0, dragged_item=None, dragged_index=None, dragged_from=None):
-    HOTBAR_X = SCREEN_WIDTH // 2 - (HOTBAR_SLOTS * SLOT_SIZE) // 2  # Centered horizontally
-    HOTBAR_Y = SCREEN_HEIGHT - 100  # Adjusted to be closer to the bottom
-    font = pygame.font.Font(None, 28)
+    # Redrawn only when the contents, the selection or the dragged slot change
+    hidden = dragged_index if dragged_from == "hotbar" else None
+    hotbar_panel.update((slots_state(hotbar_slots), selected_index, hidden), hotbar_slots, selected_index, hidden)
+    hotbar_panel.draw(screen)
+
+
+def render_hotbar(surface, hotbar_slots, selected_index, hidden_index):
+    hotbar_x = 4  # Panel starts at the 4px frame
+    hotbar_y = 4
 
     # Hotbar panel
-    pygame.draw.rect(screen, (0, 0, 0), (HOTBAR_X - 4, HOTBAR_Y - 4, HOTBAR_SLOTS * SLOT_SIZE + 8, SLOT_SIZE + 8))
-    pygame.draw.rect(screen, INVENTORY_COLOR, (HOTBAR_X, HOTBAR_Y, HOTBAR_SLOTS * SLOT_SIZE, SLOT_SIZE))
+    pygame.draw.rect(surface, (0, 0, 0), (hotbar_x - 4, hotbar_y - 4, HOTBAR_SLOTS * SLOT_SIZE + 8, SLOT_SIZE + 8))
+    pygame.draw.rect(surface, INVENTORY_COLOR, (hotbar_x, hotbar_y, HOTBAR_SLOTS * SLOT_SIZE, SLOT_SIZE))
 
     for i in range(HOTBAR_SLOTS):
-        slot_x = HOTBAR_X + i * SLOT_SIZE
+        slot_x = hotbar_x + i * SLOT_SIZE
 
         # Draw slot border
-        pygame.draw.rect(screen, (0, 0, 0), (slot_x, HOTBAR_Y, SLOT_SIZE, SLOT_SIZE), 4)
+        pygame.draw.rect(surface, (0, 0, 0), (slot_x, hotbar_y, SLOT_SIZE, SLOT_SIZE), 4)
 
         # Highlight selected
         if i == selected_index:
-            pygame.draw.rect(screen, (255, 255, 255), (slot_x + 2, HOTBAR_Y + 2, SLOT_SIZE - 4, SLOT_SIZE - 4), 2)
+            pygame.draw.rect(surface, (255, 255, 255), (slot_x + 2, hotbar_y + 2, SLOT_SIZE - 4, SLOT_SIZE - 4), 2)
 
-        if dragged_from == "hotbar" and dragged_index == i:
+        if hidden_index == i:
             continue
 
         slot = hotbar_slots[i]
@@ -103,20 +132,30 @@ def draw_hotbar(screen, hotbar_slots, ITEM_TYPES, selected_index=0, dragged_item
             item_type = slot["item"]
             count = slot["count"]
             icon_x = slot_x + 10
-            icon_y = HOTBAR_Y + 10
+            icon_y = hotbar_y + 10
 
             # Draw icon
             if item_type == "Water":
-                pygame.draw.rect(screen, (50, 143, 168), (icon_x, icon_y, ICON_SIZE - 10, ICON_SIZE - 10))
+                pygame.draw.rect(surface, (50, 143, 168), (icon_x, icon_y, ICON_SIZE - 10, ICON_SIZE - 10))
             else:
-                icon = pygame.transform.scale(ITEM_TYPES[item_type], (ICON_SIZE - 10, ICON_SIZE - 10))
-                screen.blit(icon, (icon_x, icon_y))
+                surface.blit(assets.icon(item_type, "hotbar"), (icon_x, icon_y))  # Pre-scaled hotbar icon
 
             # Draw count
             if count > 1:
-                count_text = font.render(str(count), True, TEXT_COLOR)
-                text_rect = count_text.get_rect(bottomright=(slot_x + SLOT_SIZE - 8, HOTBAR_Y + SLOT_SIZE - 8))
-                screen.blit(count_text, text_rect)
+                count_text = render_text(str(count), 28, TEXT_COLOR)
+                text_rect = count_text.get_rect(bottomright=(slot_x + SLOT_SIZE - 8, hotbar_y + SLOT_SIZE - 8))
+                surface.blit(count_text, text_rect)
+
+
+# Retained HUD panels (see hud.Panel)
+inventory_panel = Panel(
+    (INVENTORY_X - 5, INVENTORY_Y - 5, INVENTORY_COLUMNS * INVENTORY_SLOT_SIZE + 10, INVENTORY_ROWS * INVENTORY_SLOT_SIZE + 10),
+    render_inventory,
+)
+hotbar_panel = Panel(
+    (HOTBAR_X - 4, HOTBAR_Y - 4, HOTBAR_SLOTS * SLOT_SIZE + 8, SLOT_SIZE + 8),
+    render_hotbar,
+)
 
 
 def draw_dragged_item(screen, dragged_item, ITEM_TYPES):
@@ -130,5 +169,36 @@ def draw_dragged_item(screen, dragged_item, ITEM_TYPES):
             screen.blit(icon, (mx - 20, my - 20))
 
 
-def draw_grid(screen, grid_surface, camera_x, camera_y):
-    screen.blit(grid_surface, (-camera_x, -camera_y))
+def make_grid_tile(grid_size=GRID_SIZE, color=GRID_COLOR, dash=10, space=6):
+    """One grid cell with its dashed top and left edges; the pattern repeats every cell."""
+    tile = pygame.Surface((grid_size, grid_size), pygame.SRCALPHA)
+    for y in range(0, grid_size, dash + space):
+        pygame.draw.line(tile, color, (0, y), (0, y + dash), 1)
+    for x in range(0, grid_size, dash + space):
+        pygame.draw.line(tile, color, (x, 0), (x + dash, 0), 1)
+    return tile
+
+
+class GridOverlay:
+    """Screen-sized grid built once from a single repeating cell.
+
+    The cached surface is one cell larger than the screen in each direction, so
+    scrolling only changes the blit offset. Memory depends on the screen, not the map.
+    """
+
+    def __init__(self, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT, grid_size=GRID_SIZE):
+        self.grid_size = grid_size
+        tile = make_grid_tile(grid_size)
+        self.surface = pygame.Surface((screen_width + grid_size, screen_height + grid_size), pygame.SRCALPHA)
+        self.surface.blits(
+            [(tile, (x, y)) for x in range(0, self.surface.get_width(), grid_size)
+             for y in range(0, self.surface.get_height(), grid_size)],
+            doreturn=False
+        )
+
+    def draw(self, screen, camera_x, camera_y):
+        screen.blit(self.surface, (-(camera_x % self.grid_size), -(camera_y % self.grid_size)))
+
+
+def draw_grid(screen, grid_overlay, camera_x, camera_y):
+    grid_overlay.draw(screen, camera_x, camera_y)
@@ -1,5 +1,7 @@
 import pygame
 
+import world_events
+
 GRID_SIZE = 64
 
 class WaterTile:
@@ -9,6 +11,7 @@ class WaterTile:
         self.size = GRID_SIZE  # or whatever your lake tile size is
         self.rect = pygame.Rect(self.x, self.y, GRID_SIZE, GRID_SIZE)  # Size matches grid
         self.harvested = False
+        self.uid = None  # Chunk-local id, set by world generation
 
     def draw(self, screen, camera_x, camera_y):
         if not self.harvested:
@@ -16,3 +19,4 @@ class WaterTile:
 
     def harvest(self):
         self.harvested = True
+        world_events.emit("water_harvested", self)
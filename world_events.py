@@ -0,0 +1,44 @@
+"""Tiny publish/subscribe hub so world changes reach every system that caches world state.
+
+Events currently emitted:
+    "rock_mined"          (rock)
+    "water_harvested"     (water_tile)
+    "chest_looted"        (camp)
+    "campfire_placed"     (campfire)
+    "campfire_burnt_out"  (campfire)
+    "chunk_loaded"        (chunk)
+    "chunk_unloaded"      (chunk)
+"""
+
+_listeners = {}
+
+
+def subscribe(event_name, callback):
+    _listeners.setdefault(event_name, []).append(callback)
+
+
+def unsubscribe(event_name, callback):
+    callbacks = _listeners.get(event_name, [])
+    if callback in callbacks:
+        callbacks.remove(callback)
+
+
+def subscribe_all(subscriptions):
+    """Subscribe every (event_name, callback) pair. Returns the list, to hand to unsubscribe_all later."""
+    for event_name, callback in subscriptions:
+        subscribe(event_name, callback)
+    return subscriptions
+
+
+def unsubscribe_all(subscriptions):
+    for event_name, callback in subscriptions:
+        unsubscribe(event_name, callback)
+
+
+def emit(event_name, *args):
+    for callback in list(_listeners.get(event_name, ())):
+        callback(*args)
+
+
+def clear():
+    _listeners.clear()
@@ -1,19 +1,31 @@
+import hashlib
 import random
+import numpy as np
 import pygame
 from rocks import Rock
 from cow import Cow
 from water_tile import WaterTile
 from camp import Camp
+from tile_grid import FREE, WATER, ROCK, CAMP, CAMPFIRE
 
-def spawn_lakes(num, size, lakes, PLAYER_SAFE_ZONE, MAP_WIDTH, MAP_HEIGHT, GRID_SIZE):
+# --- Per-chunk densities (tuned to match the old 4000x3000 world) ---
+LAKE_CHANCE = 0.45      # Chance a chunk gets a lake
+LAKE_SIZE = 4
+ROCKS_PER_CHUNK = 3
+ITEMS_PER_CHUNK = 47
+COWS_PER_CHUNK = 1
+CAMP_CHANCE = 0.5       # Chance a chunk gets a camp
+
+def spawn_lakes(rng, num, size, lakes, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE):
     for _ in range(num):
-        base_x = random.randint(100, MAP_WIDTH - 100)
-        base_y = random.randint(100, MAP_HEIGHT - 100)
+        # Keep the whole lake inside the area so it belongs to a single chunk
+        base_x = rng.randint(area.left, max(area.left, area.right - size * GRID_SIZE))
+        base_y = rng.randint(area.top, max(area.top, area.bottom - size * GRID_SIZE))
         lake_tiles, collides = [], False
         for i in range(size):
             for j in range(size):
                 dist = abs(size // 2 - i) + abs(size // 2 - j)
-                if random.random() < 1 - dist * 0.2:
+                if rng.random() < 1 - dist * 0.2:
                     tx, ty = base_x + i * GRID_SIZE, base_y + j * GRID_SIZE
                     rect = pygame.Rect(tx, ty, GRID_SIZE, GRID_SIZE)
                     if PLAYER_SAFE_ZONE.colliderect(rect):
@@ -21,41 +33,294 @@ def spawn_lakes(num, size, lakes, PLAYER_SAFE_ZONE, MAP_WIDTH, MAP_HEIGHT, GRID_
                     lake_tiles.append(WaterTile(tx, ty))
         if not collides and lake_tiles:
             lakes.append(lake_tiles)
+            for tile in lake_tiles:
+                tile_grid.set_at(tile.x, tile.y, WATER)
 
-def spawn_rocks(n, rocks, occupied_tiles, PLAYER_SAFE_ZONE, MAP_WIDTH, MAP_HEIGHT, GRID_SIZE, rock_images):
+def spawn_rocks(rng, n, rocks, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE, rock_images):
     for _ in range(n):
-        x, y = random.randint(0, MAP_WIDTH // GRID_SIZE) * GRID_SIZE, random.randint(0, MAP_HEIGHT // GRID_SIZE) * GRID_SIZE
-        if (x, y) in occupied_tiles or PLAYER_SAFE_ZONE.collidepoint(x, y):
+        tx = rng.randint(area.left // GRID_SIZE, (area.right - 1) // GRID_SIZE)
+        ty = rng.randint(area.top // GRID_SIZE, (area.bottom - 1) // GRID_SIZE)
+        x, y = tx * GRID_SIZE, ty * GRID_SIZE
+        if not tile_grid.is_free(tx, ty) or PLAYER_SAFE_ZONE.collidepoint(x, y):
             continue
-        rocks.append(Rock(x, y, random.choice(rock_images)))
-        occupied_tiles.add((x, y))
+        rocks.append(Rock(x, y, rng.choice(rock_images)))
+        tile_grid.set(tx, ty, ROCK)
 
-def spawn_items(n, items, occupied_tiles, PLAYER_SAFE_ZONE, MAP_WIDTH, MAP_HEIGHT, GRID_SIZE):
+def spawn_items(rng, n, items, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE):
+    item_tiles = set()  # One item per tile; items don't block placement so they stay out of the grid
     for _ in range(n):
-        x = random.randint(50, MAP_WIDTH - 50)
-        y = random.randint(50, MAP_HEIGHT - 50)
-        x = (x // GRID_SIZE) * GRID_SIZE
-        y = (y // GRID_SIZE) * GRID_SIZE
-        if (x, y) in occupied_tiles or PLAYER_SAFE_ZONE.collidepoint(x, y):
+        tx = rng.randint(area.left // GRID_SIZE, (area.right - 1) // GRID_SIZE)
+        ty = rng.randint(area.top // GRID_SIZE, (area.bottom - 1) // GRID_SIZE)
+        x, y = tx * GRID_SIZE, ty * GRID_SIZE
+        if (tx, ty) in item_tiles or not tile_grid.is_free(tx, ty) or PLAYER_SAFE_ZONE.collidepoint(x, y):
             continue
-        x += random.uniform(1, 30)
-        y += random.uniform(1, 30)
+        x += rng.uniform(1, 30)
+        y += rng.uniform(1, 30)
         items.append({"type": "Wood", "x": x, "y": y})
-        occupied_tiles.add((x, y))
+        item_tiles.add((tx, ty))
 
-def spawn_cows(n, cows, MAP_WIDTH, MAP_HEIGHT, cow_image):
+def spawn_cows(rng, n, cows, area, cow_image, herd=None):
     for _ in range(n):
-        cows.append(Cow(random.randint(100, MAP_WIDTH - 100), random.randint(100, MAP_HEIGHT - 100), cow_image))
+        x = rng.randint(area.left, max(area.left, area.right - cow_image.get_width()))
+        y = rng.randint(area.top, max(area.top, area.bottom - cow_image.get_height()))
+        cows.append(Cow(x, y, cow_image, bounds=area, herd=herd))
 
-def spawn_camps(n, camps, PLAYER_SAFE_ZONE, MAP_WIDTH, MAP_HEIGHT, GRID_SIZE):
+def spawn_camps(rng, n, camps, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE):
     tries = 0
     while len(camps) < n and tries < 500:
-        x = random.randint(0, (MAP_WIDTH - GRID_SIZE * 2) // GRID_SIZE) * GRID_SIZE
-        y = random.randint(0, (MAP_HEIGHT - GRID_SIZE * 2) // GRID_SIZE) * GRID_SIZE
+        tries += 1
+        tx = rng.randint(area.left // GRID_SIZE, area.right // GRID_SIZE - 2)
+        ty = rng.randint(area.top // GRID_SIZE, area.bottom // GRID_SIZE - 2)
+        x, y = tx * GRID_SIZE, ty * GRID_SIZE
         rect = pygame.Rect(x, y, GRID_SIZE * 2, GRID_SIZE * 2)
-        if PLAYER_SAFE_ZONE.colliderect(rect):
+        if PLAYER_SAFE_ZONE.colliderect(rect) or not tile_grid.can_place(tx, ty, 2, 2):
             continue
         if any(c.rect.colliderect(rect.inflate(256, 256)) for c in camps):
             continue
-        camps.append(Camp(x, y))
-        tries += 1
+        camps.append(Camp(x, y, rng))
+        tile_grid.fill(tx, ty, 2, 2, CAMP)
+
+
+# --- Batch (NumPy) generation ---
+# Candidates are drawn in bulk and filtered with array masks against the safe zone
+# and the tile grid, so cost grows with the number of objects, not with retries.
+
+def area_tile_bounds(area, GRID_SIZE):
+    """Inclusive tile range fully covered by area."""
+    return area.left // GRID_SIZE, area.top // GRID_SIZE, (area.right - 1) // GRID_SIZE, (area.bottom - 1) // GRID_SIZE
+
+
+def outside_rect_mask(x, y, rect):
+    """Boolean mask of points (arrays) that are not inside rect."""
+    return ~((x >= rect.left) & (x < rect.right) & (y >= rect.top) & (y < rect.bottom))
+
+
+def count_free_tiles(tile_grid, tx0, ty0, tx1, ty1):
+    """Number of FREE tiles in the inclusive tile range (0 if it's empty)."""
+    if tx1 < tx0 or ty1 < ty0:
+        return 0
+    return int(np.count_nonzero(tile_grid.tiles[tx0:tx1 + 1, ty0:ty1 + 1] == FREE))
+
+
+def sample_free_tiles(np_rng, n, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE):
+    """Pick n random free, unique tiles in area outside the safe zone.
+
+    Candidates are drawn in batches until n are kept or every eligible tile is
+    taken, so fewer than n only come back when the area is full. Returns (tx, ty)
+    arrays in draw order, so results only depend on the rng state.
+    """
+    tx0, ty0, tx1, ty1 = area_tile_bounds(area, GRID_SIZE)
+    empty = np.empty(0, dtype=np.int64)
+    if n <= 0 or tx1 < tx0 or ty1 < ty0:
+        return empty, empty
+
+    picked_tx, picked_ty, picked = [], [], empty
+    draws = n  # The first batch is n draws; later ones are sized to the shortfall
+    n_eligible = None
+    while True:
+        tx = np_rng.integers(tx0, tx1 + 1, draws)
+        ty = np_rng.integers(ty0, ty1 + 1, draws)
+        keys = tx * tile_grid.height + ty
+        keep = tile_grid.tiles[tx, ty] == FREE
+        keep &= outside_rect_mask(tx * GRID_SIZE, ty * GRID_SIZE, PLAYER_SAFE_ZONE)
+        if len(picked):
+            keep &= ~np.isin(keys, picked)
+        idx = np.flatnonzero(keep)
+
+        # One object per tile: keep the first draw that landed on each tile
+        _, first = np.unique(keys[idx], return_index=True)
+        idx = idx[np.sort(first)][:n - len(picked)]
+        picked_tx.append(tx[idx])
+        picked_ty.append(ty[idx])
+        picked = np.concatenate((picked, keys[idx]))
+        if len(picked) >= n:
+            break
+
+        if n_eligible is None:
+            # Short on the first batch: count the tiles that can be picked at all,
+            # so drawing stops once every one of them is used
+            n_eligible = count_free_tiles(tile_grid, tx0, ty0, tx1, ty1)
+            safe = PLAYER_SAFE_ZONE  # Tiles whose corner lies inside it are never picked
+            n_eligible -= count_free_tiles(
+                tile_grid,
+                max(tx0, -(-safe.left // GRID_SIZE)), max(ty0, -(-safe.top // GRID_SIZE)),
+                min(tx1, -(-safe.right // GRID_SIZE) - 1), min(ty1, -(-safe.bottom // GRID_SIZE) - 1),
+            )
+            n = min(n, n_eligible)
+            if len(picked) >= n:
+                break
+        # Draw enough that the free tiles left are likely to cover the shortfall
+        area_tiles = (tx1 - tx0 + 1) * (ty1 - ty0 + 1)
+        draws = max((n - len(picked)) * area_tiles // (n_eligible - len(picked)), 16)
+
+    return np.concatenate(picked_tx), np.concatenate(picked_ty)
+
+
+def spawn_rocks_batch(np_rng, n, rocks, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE, rock_images):
+    """Place n rocks on free tiles (fewer only if the area runs out). Returns how many were placed."""
+    tx, ty = sample_free_tiles(np_rng, n, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE)
+    image_ids = np_rng.integers(0, len(rock_images), len(tx))
+    tile_grid.tiles[tx, ty] = ROCK
+    rocks.extend(
+        Rock(x, y, rock_images[i])
+        for x, y, i in zip((tx * GRID_SIZE).tolist(), (ty * GRID_SIZE).tolist(), image_ids.tolist())
+    )
+    return len(tx)
+
+
+def spawn_items_batch(np_rng, n, items, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE):
+    """Place n wood items, one per free tile (fewer only if the area runs out). Returns how many were placed."""
+    tx, ty = sample_free_tiles(np_rng, n, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE)
+    xs = tx * GRID_SIZE + np_rng.uniform(1, 30, len(tx))
+    ys = ty * GRID_SIZE + np_rng.uniform(1, 30, len(ty))
+    items.extend({"type": "Wood", "x": x, "y": y} for x, y in zip(xs.tolist(), ys.tolist()))
+    return len(tx)
+
+
+def poisson_disk_tiles(np_rng, area, min_tiles, GRID_SIZE, valid=None, max_samples=None, k=20):
+    """Tile positions at least min_tiles apart (Chebyshev distance) inside area.
+
+    Grid-based dart throwing: the background grid has cells min_tiles wide, so each
+    cell holds at most one sample and only the 3x3 neighbouring cells can conflict.
+    Cells are processed in 9 phases (cx % 3, cy % 3); cells of one phase never
+    conflict with each other, so each phase is accepted in one vectorized step.
+    Every still-empty cell gets one dart per round, for up to k rounds.
+    valid(tx, ty) -> bool mask rejects candidates (occupancy, safe zone, ...).
+    With max_samples only a random subset of cells is tried, so sparse requests
+    don't pay for filling the whole area.
+    """
+    tx0, ty0, tx1, ty1 = area_tile_bounds(area, GRID_SIZE)
+    gw = (tx1 - tx0 + min_tiles) // min_tiles
+    gh = (ty1 - ty0 + min_tiles) // min_tiles
+    empty = np.empty(0, dtype=np.int64)
+    if gw <= 0 or gh <= 0:
+        return empty, empty
+
+    cells = np.arange(gw * gh)
+    if max_samples is not None and max_samples * 2 < len(cells):
+        cells = np.sort(np_rng.choice(len(cells), max_samples * 2, replace=False))
+    cell_x, cell_y = cells // gh, cells % gh
+    phase = (cell_x % 3) * 3 + cell_y % 3
+
+    # Accepted sample per cell, padded by one cell on every side; "far" means empty
+    far = -(10 ** 9)
+    acc_x = np.full((gw + 2, gh + 2), far, dtype=np.int64)
+    acc_y = np.full((gw + 2, gh + 2), far, dtype=np.int64)
+    pending = np.ones(len(cells), dtype=bool)
+
+    for _ in range(k):
+        idx = np.flatnonzero(pending)
+        if not idx.size:
+            break
+        dart_x = tx0 + cell_x[idx] * min_tiles + np_rng.integers(0, min_tiles, idx.size)
+        dart_y = ty0 + cell_y[idx] * min_tiles + np_rng.integers(0, min_tiles, idx.size)
+        ok = (dart_x <= tx1) & (dart_y <= ty1)
+        if valid is not None:
+            ok &= valid(dart_x, dart_y)
+        idx_phase = phase[idx]
+
+        for p in range(9):
+            sel = ok & (idx_phase == p)
+            if not sel.any():
+                continue
+            ci = idx[sel]
+            px, py = dart_x[sel], dart_y[sel]
+            gx, gy = cell_x[ci] + 1, cell_y[ci] + 1
+            clear = np.ones(len(ci), dtype=bool)
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    clear &= (np.abs(px - acc_x[gx + ox, gy + oy]) >= min_tiles) | (np.abs(py - acc_y[gx + ox, gy + oy]) >= min_tiles)
+            acc_x[gx[clear], gy[clear]] = px[clear]
+            acc_y[gx[clear], gy[clear]] = py[clear]
+            pending[ci[clear]] = False
+
+    filled = ~pending
+    gx, gy = cell_x[filled] + 1, cell_y[filled] + 1
+    return acc_x[gx, gy], acc_y[gx, gy]
+
+
+def spawn_camps_batch(np_rng, rng, n, camps, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE):
+    """Place up to n 2x2-tile camps, spaced like spawn_camps (256 px apart) via Poisson-disk sampling.
+
+    Returns how many were placed (fewer than n when the area can't fit them).
+    """
+    tiles = tile_grid.tiles
+    tx1 = (area.right - 1) // GRID_SIZE
+    ty1 = (area.bottom - 1) // GRID_SIZE
+    safe = PLAYER_SAFE_ZONE
+
+    def valid(tx, ty):
+        inside = (tx + 1 <= tx1) & (ty + 1 <= ty1)
+        x0, y0 = np.minimum(tx, tx1 - 1), np.minimum(ty, ty1 - 1)  # Keep lookups in range
+        free = (tiles[x0, y0] | tiles[x0 + 1, y0] | tiles[x0, y0 + 1] | tiles[x0 + 1, y0 + 1]) == FREE
+        x, y = tx * GRID_SIZE, ty * GRID_SIZE
+        size = GRID_SIZE * 2
+        clear_of_safe = (x + size <= safe.left) | (x >= safe.right) | (y + size <= safe.top) | (y >= safe.bottom)
+        return inside & free & clear_of_safe
+
+    tx, ty = poisson_disk_tiles(np_rng, area, 256 // GRID_SIZE, GRID_SIZE, valid, max_samples=n)
+    if len(tx) > n:
+        pick = np.sort(np_rng.permutation(len(tx))[:n])
+        tx, ty = tx[pick], ty[pick]
+
+    for cx, cy in zip(tx.tolist(), ty.tolist()):
+        camps.append(Camp(cx * GRID_SIZE, cy * GRID_SIZE, rng))
+        tiles[cx:cx + 2, cy:cy + 2] = CAMP
+    return len(tx)
+
+
+def chunk_seed(world_seed, cx, cy):
+    """Stable 64-bit sub-seed for one chunk (independent of Python's hash randomization)."""
+    digest = hashlib.blake2b(f"{world_seed}:{cx}:{cy}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def generate_chunk(chunk, seed, tile_grid, PLAYER_SAFE_ZONE, GRID_SIZE, rock_images, cow_image, herd=None):
+    """Populate a freshly created chunk with lakes, rocks, items, cows and camps.
+
+    Everything is drawn from RNGs seeded with seed and only chunk-local occupancy is
+    consulted, so the same seed always rebuilds the same chunk no matter which
+    neighbours are loaded. Entities get a chunk-local uid so saves can refer to them.
+    """
+    area = chunk.area
+    if area.width < GRID_SIZE * 2 or area.height < GRID_SIZE * 2:
+        return  # Sliver at the map edge, too small for anything
+
+    rng = random.Random(seed)            # Lakes, cows and chest loot
+    np_rng = np.random.default_rng(seed)  # Bulk placement
+
+    lake_count = 1 if rng.random() < LAKE_CHANCE else 0
+    spawn_lakes(rng, lake_count, LAKE_SIZE, chunk.lakes, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE)
+    spawn_rocks_batch(np_rng, ROCKS_PER_CHUNK, chunk.rocks, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE, rock_images)
+    spawn_items_batch(np_rng, ITEMS_PER_CHUNK, chunk.items, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE)
+    spawn_cows(rng, COWS_PER_CHUNK, chunk.cows, area, cow_image, herd)
+    camp_count = 1 if rng.random() < CAMP_CHANCE else 0
+    spawn_camps_batch(np_rng, rng, camp_count, chunk.camps, tile_grid, PLAYER_SAFE_ZONE, area, GRID_SIZE)
+
+    assign_uids(chunk)
+
+
+def assign_uids(chunk):
+    for i, rock in enumerate(chunk.rocks):
+        rock.uid = i
+    for i, tile in enumerate(tile for lake in chunk.lakes for tile in lake):
+        tile.uid = i
+    for i, item in enumerate(chunk.items):
+        item["id"] = i
+    for i, camp in enumerate(chunk.camps):
+        camp.uid = i
+
+
+def mark_tiles(tile_grid, rocks, lakes, camps, campfires, GRID_SIZE):
+    """Record already-existing (e.g. loaded) world objects in the tile grid."""
+    for lake in lakes:
+        for tile in lake:
+            if not tile.harvested:
+                tile_grid.set_at(tile.x, tile.y, WATER)
+    for rock in rocks:
+        if not rock.mined:
+            tile_grid.set_at(rock.x, rock.y, ROCK)
+    for camp in camps:
+        tile_grid.fill(camp.x // GRID_SIZE, camp.y // GRID_SIZE, 2, 2, CAMP)
+    for fire in campfires:
+        tile_grid.set_at(fire.x, fire.y, CAMPFIRE)